@@ -1,6 +1,7 @@
 """Conversation state — sliding window of turns + system prompt."""
 
 import os
+from collections import deque
 
 DEFAULT_SYSTEM_PROMPT = (
     "You are a helpful voice assistant. Keep responses concise — "
@@ -16,18 +17,25 @@ class ConversationHistory:
 
     def __init__(self, system: str = ""):
         self.system = system or SYSTEM_PROMPT
-        self._turns: list[dict] = []
+        self._turns: deque[dict] = deque(maxlen=MAX_TURNS)
+        self._messages: tuple[dict, ...] | None = None  # Snapshot, rebuilt after changes
 
     def add_turn(self, role: str, text: str):
         """Add a turn to the history. Trims to MAX_TURNS."""
         self._turns.append({"role": role, "content": text})
-        if len(self._turns) > MAX_TURNS:
-            self._turns = self._turns[-MAX_TURNS:]
+        self._messages = None
 
-    def get_messages(self) -> list[dict]:
-        """Return the message list for the LLM API."""
-        return list(self._turns)
+    def get_messages(self) -> tuple[dict, ...]:
+        """Return the messages for the LLM API.
+
+        The same tuple is returned until the history changes, so one
+        caller can't alter what the next one sees; list() it to extend.
+        """
+        if self._messages is None:
+            self._messages = tuple(self._turns)
+        return self._messages
 
     def clear(self):
         """Reset conversation history."""
         self._turns.clear()
+        self._messages = None
@@ -0,0 +1,19 @@
+"""JSON helpers: orjson when installed, stdlib json otherwise.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+the stdlib exception either way.
+"""
+
+import json
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(data) -> str:
+        """Serialize to compact JSON text with orjson (~3x faster than stdlib)."""
+        return orjson.dumps(data).decode()
+except ImportError:
+    loads = json.loads
+    dumps = json.dumps
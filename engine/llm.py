@@ -7,6 +7,8 @@ import logging
 import os
 from typing import Optional
 
+from engine.jsonx import dumps as _json_dumps, loads as _json_loads
+
 log = logging.getLogger("llm")
 
 # Provider config from env
@@ -182,22 +184,23 @@ async def get_available_models() -> dict:
 
 async def pull_ollama_model(name: str):
     """Stream-pull an Ollama model. Async generator yielding progress dicts."""
-    import httpx
-    async with httpx.AsyncClient(timeout=None) as client:
-        async with client.stream(
-            "POST",
-            f"{OLLAMA_URL}/api/pull",
-            json={"name": name, "stream": True},
-        ) as resp:
-            resp.raise_for_status()
-            async for line in resp.aiter_lines():
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-                    yield data
-                except json.JSONDecodeError:
-                    continue
+    client = _get_async_httpx()
+    # Pulls can take minutes; lift the shared client's timeout for this stream
+    async with client.stream(
+        "POST",
+        f"{OLLAMA_URL}/api/pull",
+        json={"name": name, "stream": True},
+        timeout=None,
+    ) as resp:
+        resp.raise_for_status()
+        async for line in resp.aiter_lines():
+            if not line.strip():
+                continue
+            try:
+                data = _json_loads(line)
+                yield data
+            except json.JSONDecodeError:
+                continue
 
 
 # ── Generation ────────────────────────────────────────────────
@@ -391,7 +394,7 @@ def _generate_openai_with_tools(system: str, messages: list[dict], tools: list[d
         for tc in choice.message.tool_calls:
             args = tc.function.arguments
             if isinstance(args, str):
-                args = json.loads(args)
+                args = _json_loads(args)
             tool_calls.append({
                 "id": tc.id,
                 "function": {"name": tc.function.name, "arguments": args},
@@ -456,6 +459,74 @@ async def generate_with_tools(system: str, messages: list[dict],
     return await loop.run_in_executor(None, fn)
 
 
+def _tool_results_claude(tool_calls: list[dict], tool_results: dict,
+                         original_text: str) -> list[dict]:
+    """Claude: assistant content = [text_block?, tool_use_blocks...],
+    then user content = [tool_result_blocks...]."""
+    assistant_content = [{"type": "text", "text": original_text}] if original_text else []
+    for tc in tool_calls:
+        fn = tc["function"]
+        assistant_content.append({
+            "type": "tool_use",
+            "id": tc.get("id", ""),
+            "name": fn["name"],
+            "input": fn["arguments"],
+        })
+    user_content = [
+        {"type": "tool_result", "tool_use_id": tool_calls[i].get("id", ""), "content": result}
+        for i, result in tool_results.items()
+    ]
+    return [
+        {"role": "assistant", "content": assistant_content},
+        {"role": "user", "content": user_content},
+    ]
+
+
+def _tool_results_openai(tool_calls: list[dict], tool_results: dict,
+                         original_text: str) -> list[dict]:
+    """OpenAI: assistant message with tool_calls, then tool messages."""
+    openai_tool_calls = []
+    for i, tc in enumerate(tool_calls):
+        fn = tc["function"]
+        openai_tool_calls.append({
+            "id": tc.get("id", f"call_{i}"),
+            "type": "function",
+            "function": {"name": fn["name"], "arguments": _json_dumps(fn["arguments"])},
+        })
+    messages = [{
+        "role": "assistant",
+        "content": original_text or None,
+        "tool_calls": openai_tool_calls,
+    }]
+    messages.extend(
+        {"role": "tool", "tool_call_id": tool_calls[i].get("id", f"call_{i}"), "content": result}
+        for i, result in tool_results.items()
+    )
+    return messages
+
+
+def _tool_results_ollama(tool_calls: list[dict], tool_results: dict,
+                         original_text: str) -> list[dict]:
+    """Ollama: assistant message with tool_calls, then tool message(s)."""
+    messages = [{
+        "role": "assistant",
+        "content": original_text or "",
+        "tool_calls": [
+            {"function": {"name": tc["function"]["name"],
+                          "arguments": tc["function"]["arguments"]}}
+            for tc in tool_calls
+        ],
+    }]
+    messages.extend({"role": "tool", "content": result} for result in tool_results.values())
+    return messages
+
+
+_TOOL_RESULT_BUILDERS = {
+    "claude": _tool_results_claude,
+    "openai": _tool_results_openai,
+}
+
+
 def build_tool_result_messages(provider: str, tool_calls: list[dict],
                                 tool_results: dict, original_text: str = "") -> list[dict]:
     """Build provider-specific messages to send tool results back.
@@ -469,73 +540,8 @@ def build_tool_result_messages(provider: str, tool_calls: list[dict],
     Returns:
         List of messages to append to conversation for the follow-up call.
     """
-    messages = []
-
-    if provider == "claude":
-        # Claude: assistant content = [text_block?, tool_use_blocks...],
-        #         then user content = [tool_result_blocks...]
-        assistant_content = []
-        if original_text:
-            assistant_content.append({"type": "text", "text": original_text})
-        for tc in tool_calls:
-            assistant_content.append({
-                "type": "tool_use",
-                "id": tc.get("id", ""),
-                "name": tc["function"]["name"],
-                "input": tc["function"]["arguments"],
-            })
-        messages.append({"role": "assistant", "content": assistant_content})
-        user_content = [
-            {
-                "type": "tool_result",
-                "tool_use_id": tool_calls[i].get("id", ""),
-                "content": result,
-            }
-            for i, result in tool_results.items()
-        ]
-        messages.append({"role": "user", "content": user_content})
-
-    elif provider == "openai":
-        # OpenAI: assistant message with tool_calls, then tool messages
-        openai_tool_calls = [
-            {
-                "id": tc.get("id", f"call_{i}"),
-                "type": "function",
-                "function": {
-                    "name": tc["function"]["name"],
-                    "arguments": json.dumps(tc["function"]["arguments"]),
-                },
-            }
-            for i, tc in enumerate(tool_calls)
-        ]
-        messages.append({
-            "role": "assistant",
-            "content": original_text or None,
-            "tool_calls": openai_tool_calls,
-        })
-        for i, result in tool_results.items():
-            messages.append({
-                "role": "tool",
-                "tool_call_id": tool_calls[i].get("id", f"call_{i}"),
-                "content": result,
-            })
-
-    else:  # ollama
-        # Ollama: assistant message with tool_calls, then tool message(s)
-        ollama_tool_calls = [
-            {"function": {"name": tc["function"]["name"],
-                          "arguments": tc["function"]["arguments"]}}
-            for tc in tool_calls
-        ]
-        messages.append({
-            "role": "assistant",
-            "content": original_text or "",
-            "tool_calls": ollama_tool_calls,
-        })
-        for _i, result in tool_results.items():
-            messages.append({"role": "tool", "content": result})
-
-    return messages
+    builder = _TOOL_RESULT_BUILDERS.get(provider, _tool_results_ollama)
+    return builder(tool_calls, tool_results, original_text)
 
 
 def available_providers() -> list[dict]:
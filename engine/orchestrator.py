@@ -12,6 +12,7 @@ Provenance: ADR-0001 — orchestrator unification.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
@@ -32,6 +33,11 @@ from engine.search import (
 
 log = logging.getLogger("orchestrator")
 
+try:
+    import ahocorasick  # optional C automaton (pyahocorasick) for hedging scan
+except ImportError:
+    ahocorasick = None
+
 # ── Type aliases ──────────────────────────────────────────────
 
 DispatchFunc = Callable[[str, dict], Awaitable[str]]
@@ -40,8 +46,6 @@ ToolCallCallback = Callable[[str, dict], Awaitable[None]]
 
 # ── Regex patterns ────────────────────────────────────────────
 
-_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
-
 _TEXT_TOOL_RE = re.compile(
     r"""(?:^|['"`\s])(\w+)\s*\(?\s*(\{[^}]*\})\s*\)?""",
     re.DOTALL,
@@ -126,6 +130,27 @@ DEFAULT_TOOL_ALIASES: dict[str, str] = {
     "rag_search": "search_knowledge_base",
 }
 
+
+@functools.lru_cache(maxsize=8)
+def _hedging_matcher(phrases: tuple[str, ...]) -> Callable[[str], bool]:
+    """Compile hedging phrases into a single-pass matcher over lowercased text.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    one regex alternation of the escaped phrases.
+    """
+    if not phrases:
+        return lambda text: False
+    lowered = [phrase.lower() for phrase in phrases]
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for phrase in lowered:
+            automaton.add_word(phrase, phrase)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    pattern = re.compile("|".join(map(re.escape, lowered)))
+    return lambda text: pattern.search(text) is not None
+
+
 def _default_system_prompt() -> str:
     """Build system prompt with current date so the model knows 'today'."""
     from datetime import date
@@ -191,6 +216,8 @@ class Orchestrator:
     def __init__(self, config: Optional[OrchestratorConfig] = None) -> None:
         self.config = config or OrchestratorConfig()
         self.messages: list[dict] = []
+        # Compiled from config.hedging_phrases on first use; reset by update_config()
+        self._hedging_match: Optional[Callable[[str], bool]] = None
 
     # ── Public API ────────────────────────────────────────────
 
@@ -301,6 +328,8 @@ class Orchestrator:
         for key, value in kwargs.items():
             if hasattr(self.config, key):
                 setattr(self.config, key, value)
+        if "hedging_phrases" in kwargs:
+            self._hedging_match = None
 
     # ── Message building ──────────────────────────────────────
 
@@ -372,8 +401,24 @@ class Orchestrator:
 
     @staticmethod
     def _strip_thinking(text: str) -> str:
-        """Remove <think>...</think> blocks (Qwen 3 thinking mode)."""
-        return _THINK_RE.sub("", text).strip()
+        """Remove <think>...</think> blocks (Qwen 3 thinking mode).
+
+        Plain str.find scan; an unclosed <think> is left in place.
+        """
+        start = text.find("<think>")
+        if start < 0:
+            return text.strip()
+        parts = []
+        pos = 0
+        while start >= 0:
+            end = text.find("</think>", start + 7)
+            if end < 0:
+                break
+            parts.append(text[pos:start])
+            pos = end + 8
+            start = text.find("<think>", pos)
+        parts.append(text[pos:])
+        return "".join(parts).strip()
 
     # ── Text-based tool call parsing (fallback) ───────────────
 
@@ -384,6 +429,8 @@ class Orchestrator:
           gc_search {"query": "weather in Austin"}
         This parser catches those and converts them to standard format.
         """
+        if "{" not in text:
+            return []  # Every text tool call carries a JSON object
         aliases = self.config.tool_aliases
         results = []
         for match in _TEXT_TOOL_RE.finditer(text):
@@ -409,9 +456,14 @@ class Orchestrator:
     # ── Hedging detection ─────────────────────────────────────
 
     def _reply_is_hedging(self, reply: str) -> bool:
-        """Check if the LLM response contains hedging/refusal phrases."""
-        lower = reply.lower()
-        return any(phrase in lower for phrase in self.config.hedging_phrases)
+        """Check if the LLM response contains hedging/refusal phrases.
+
+        Single pass over the reply via the matcher compiled once per config.
+        """
+        matcher = self._hedging_match
+        if matcher is None:
+            matcher = self._hedging_match = _hedging_matcher(tuple(self.config.hedging_phrases))
+        return matcher(reply.lower())
 
     # ── Search query extraction ───────────────────────────────
 
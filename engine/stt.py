@@ -3,7 +3,6 @@
 import logging
 
 import numpy as np
-from scipy.signal import resample
 
 log = logging.getLogger("stt")
 
@@ -53,6 +52,8 @@ def transcribe(audio_bytes: bytes, sample_rate: int = 48000):
     # Resample to 16kHz — faster-whisper expects 16kHz input
     WHISPER_RATE = 16000
     if sample_rate != WHISPER_RATE:
+        from scipy.signal import resample  # ~0.6s import; only needed here
+
         num_output = int(len(samples) * WHISPER_RATE / sample_rate)
         samples = resample(samples, num_output).astype(np.float32)
         log.debug("Resampled to %d samples @ %dHz", len(samples), WHISPER_RATE)
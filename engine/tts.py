@@ -1,12 +1,12 @@
 """Piper TTS wrapper — text to 48kHz PCM with resampling and multi-voice support."""
 
+import functools
 import logging
 import os
 import urllib.request
 from pathlib import Path
 
 import numpy as np
-from scipy.signal import resample
 
 log = logging.getLogger("tts")
 
@@ -33,6 +33,7 @@ VOICE_CATALOG = [
 DEFAULT_VOICE = "en_US-lessac-medium"
 
 _CATALOG_BY_ID = {v["id"]: v for v in VOICE_CATALOG}
+VOICE_IDS = frozenset(_CATALOG_BY_ID)  # Valid voice_id values (catalog is static)
 
 # In-memory cache: voice_id → PiperVoice instance
 _voice_cache: dict = {}
@@ -60,6 +61,7 @@ def _download_model(voice_id: str) -> Path:
         log.info("Downloading voice model: %s ...", voice_id)
         urllib.request.urlretrieve(onnx_url, onnx_path)
         log.info("Model downloaded: %s", onnx_path)
+        _invalidate_voices()
 
     if not config_path.exists():
         log.info("Downloading voice config: %s ...", voice_id)
@@ -94,6 +96,8 @@ def synthesize(text: str, voice_id: str = "") -> bytes:
 
     Pipeline: text -> Piper TTS (22050Hz chunks) -> concat -> resample -> 48kHz PCM
     """
+    from scipy.signal import resample  # ~0.6s import; keep it off server startup
+
     voice = _get_voice(voice_id)
     native_rate = voice.config.sample_rate  # typically 22050
 
@@ -131,8 +135,13 @@ def synthesize(text: str, voice_id: str = "") -> bytes:
     return resampled.tobytes()
 
 
+@functools.lru_cache(maxsize=1)
 def list_voices() -> list[dict]:
-    """Return voice catalog with download status for each voice."""
+    """Return voice catalog with download status for each voice.
+
+    Cached (one stat per voice on first call); _download_model() clears the
+    cache when a new model lands on disk. Callers must not mutate the list.
+    """
     result = []
     for entry in VOICE_CATALOG:
         onnx_path = MODEL_DIR / f"{entry['id']}.onnx"
@@ -142,3 +151,8 @@ def list_voices() -> list[dict]:
             "downloaded": onnx_path.exists(),
         })
     return result
+
+
+def _invalidate_voices():
+    """Drop the cached list_voices() result (download status changed)."""
+    list_voices.cache_clear()
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoiceInfo:
     """Describes an available voice."""
     id: str
@@ -11,7 +11,7 @@ class VoiceInfo:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioChunk:
     """A chunk of raw PCM audio data."""
     samples: bytes          # 16-bit signed LE PCM
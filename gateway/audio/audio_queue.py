@@ -7,68 +7,103 @@ Unlike the ring buffer (fixed-size, lossy), this queue:
 """
 
 import threading
-from collections import deque
 
 
 class AudioQueue:
-    """Unbounded FIFO of PCM byte blobs, read out in fixed-size chunks.
+    """Unbounded FIFO of PCM bytes, read out in fixed-size chunks.
 
     Producers call enqueue() with variable-length PCM blobs (one per sentence).
     The consumer calls read(n) every 20ms to get exactly n bytes, zero-padded
     if not enough data is available yet.
+
+    Backed by a bytearray ring that doubles when a blob doesn't fit, so
+    steady-state reads and writes are slice copies with no per-chunk
+    allocations. A grown ring drops back to the initial capacity once it
+    drains, so one long burst doesn't pin its peak size for the session.
     """
 
-    def __init__(self):
-        self._chunks: deque[bytes] = deque()
-        self._current = b""  # Partially-consumed chunk
-        self._offset = 0
+    def __init__(self, capacity: int = 48000 * 2 * 4):
+        # Default: ~4 seconds of 48kHz mono 16-bit audio before first growth
+        self._initial_capacity = capacity
+        self._buf = bytearray(capacity)
+        self._head = 0  # Next byte to read
+        self._size = 0
         self._lock = threading.Lock()
 
     @property
     def available(self) -> int:
         """Total bytes available for reading."""
         with self._lock:
-            total = len(self._current) - self._offset
-            for chunk in self._chunks:
-                total += len(chunk)
-            return total
+            return self._size
+
+    def _grow(self, needed: int):
+        """Reallocate to fit `needed` bytes, unwrapping data to offset 0."""
+        capacity = len(self._buf)
+        while capacity < needed:
+            capacity *= 2
+        buf = bytearray(capacity)
+        first = min(self._size, len(self._buf) - self._head)
+        buf[:first] = self._buf[self._head:self._head + first]
+        buf[first:self._size] = self._buf[:self._size - first]
+        self._buf = buf
+        self._head = 0
 
     def enqueue(self, data: bytes):
         """Append a PCM blob to the queue (thread-safe)."""
-        if not data:
+        n = len(data)
+        if not n:
             return
         with self._lock:
-            self._chunks.append(data)
+            if self._size + n > len(self._buf):
+                self._grow(self._size + n)
+            capacity = len(self._buf)
+            tail = (self._head + self._size) % capacity
+            first = min(n, capacity - tail)
+            src = memoryview(data)
+            self._buf[tail:tail + first] = src[:first]
+            self._buf[:n - first] = src[first:]
+            self._size += n
+
+    def _shrink(self):
+        """Drop a grown, now-empty ring back to the initial capacity."""
+        if len(self._buf) > self._initial_capacity:
+            self._buf = bytearray(self._initial_capacity)
+        self._head = 0
 
     def read(self, n: int) -> bytes:
-        """Read exactly n bytes, advancing through queued chunks.
+        """Read exactly n bytes from the front of the queue.
 
         Returns silence (zeros) for any bytes beyond what's available.
         """
+        result = bytearray(n)
+        self.read_into(result)
+        return bytes(result)
+
+    def read_into(self, out: bytearray) -> int:
+        """Fill `out` from the front of the queue; zero the rest.
+
+        Like read(len(out)) but without allocating. Returns the number of
+        queued bytes copied.
+        """
+        n = len(out)
         with self._lock:
-            result = bytearray(n)
-            written = 0
-
-            while written < n:
-                # Refill current chunk if exhausted
-                if self._offset >= len(self._current):
-                    if not self._chunks:
-                        break  # No more data — rest is silence
-                    self._current = self._chunks.popleft()
-                    self._offset = 0
-
-                # Copy as much as we can from current chunk
-                remaining_in_chunk = len(self._current) - self._offset
-                to_copy = min(remaining_in_chunk, n - written)
-                result[written:written + to_copy] = self._current[self._offset:self._offset + to_copy]
-                self._offset += to_copy
-                written += to_copy
-
-            return bytes(result)
+            count = min(n, self._size)
+            if count:
+                capacity = len(self._buf)
+                first = min(count, capacity - self._head)
+                buf = memoryview(self._buf)
+                out[:first] = buf[self._head:self._head + first]
+                out[first:count] = buf[:count - first]
+                self._head = (self._head + count) % capacity
+                self._size -= count
+                if not self._size:
+                    self._shrink()
+        if count < n:
+            out[count:] = bytes(n - count)
+        return count
 
     def clear(self):
         """Discard all queued audio."""
         with self._lock:
-            self._chunks.clear()
-            self._current = b""
-            self._offset = 0
+            self._size = 0
+            self._shrink()
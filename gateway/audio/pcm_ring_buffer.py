@@ -8,17 +8,23 @@ for real TTS integration.
 
 import threading
 
+import numpy as np
+
 
 class PCMRingBuffer:
     """Fixed-size byte ring buffer with thread-safe read/write.
 
     - write() appends data, silently discarding oldest bytes on overflow
     - read(n) returns exactly n bytes, zero-padding if not enough data
+
+    Backed by a uint8 numpy array, so writes and reads are slice copies
+    rather than per-byte loops. The ring is byte-granular: a producer may
+    split PCM at any offset without misaligning later samples.
     """
 
     def __init__(self, capacity: int = 48000 * 2 * 2):
         # Default: ~1 second of 48kHz mono 16-bit audio
-        self._buf = bytearray(capacity)
+        self._arr = np.zeros(capacity, dtype=np.uint8)
         self._capacity = capacity
         self._write_pos = 0
         self._read_pos = 0
@@ -36,29 +42,46 @@ class PCMRingBuffer:
 
         If buffer is full, oldest data is overwritten (lossy).
         """
+        src = np.frombuffer(data, dtype=np.uint8)
+        n = src.size
+        cap = self._capacity
         with self._lock:
-            n = len(data)
-            for i in range(n):
-                self._buf[self._write_pos] = data[i]
-                self._write_pos = (self._write_pos + 1) % self._capacity
-                if self._size == self._capacity:
-                    # Overwriting unread data — advance read pointer
-                    self._read_pos = (self._read_pos + 1) % self._capacity
-                else:
-                    self._size += 1
+            if n >= cap:
+                # Only the newest `cap` bytes survive
+                self._arr[:] = src[n - cap:]
+                self._write_pos = 0
+                self._read_pos = 0
+                self._size = cap
+                return n
+
+            first = min(n, cap - self._write_pos)
+            self._arr[self._write_pos:self._write_pos + first] = src[:first]
+            self._arr[:n - first] = src[first:]
+            self._write_pos = (self._write_pos + n) % cap
+
+            overflow = self._size + n - cap
+            if overflow > 0:
+                # Overwrote unread data — advance read pointer past it
+                self._read_pos = (self._read_pos + overflow) % cap
+                self._size = cap
+            else:
+                self._size += n
             return n
 
     def read(self, n: int) -> bytes:
         """Read up to n bytes. Zero-pads if fewer bytes are available."""
+        result = bytearray(n)
+        out = np.frombuffer(result, dtype=np.uint8)
+        cap = self._capacity
         with self._lock:
-            available = min(n, self._size)
-            result = bytearray(n)
-            for i in range(available):
-                result[i] = self._buf[self._read_pos]
-                self._read_pos = (self._read_pos + 1) % self._capacity
-            self._size -= available
-            # Remaining bytes in result are already 0 (silence)
-            return bytes(result)
+            count = min(n, self._size)
+            first = min(count, cap - self._read_pos)
+            out[:first] = self._arr[self._read_pos:self._read_pos + first]
+            out[first:count] = self._arr[:count - first]
+            self._read_pos = (self._read_pos + count) % cap
+            self._size -= count
+        # Remaining bytes in result are already 0 (silence)
+        return bytes(result)
 
     def clear(self):
         """Discard all buffered data."""
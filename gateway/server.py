@@ -1,8 +1,11 @@
 """Gateway server — HTTP static serving + WebSocket signaling."""
 
 import asyncio
+import gzip
+import hmac
 import json
 import logging
+import mimetypes
 import os
 import time
 from pathlib import Path
@@ -10,9 +13,12 @@ from pathlib import Path
 from aiohttp import web
 from dotenv import load_dotenv
 
-load_dotenv()  # Must be before engine imports so they see .env vars
+# Must be before engine imports so they see .env vars. Test runs and CI
+# configure everything through the environment (as voice_assistant/config.py)
+if os.getenv("TESTING") != "1" and os.getenv("CI") != "1":
+    load_dotenv()
 
-from engine.tts import list_voices, DEFAULT_VOICE
+from engine.tts import list_voices, DEFAULT_VOICE, VOICE_IDS
 from engine.llm import (
     is_configured as llm_is_configured,
     get_provider_name,
@@ -28,22 +34,53 @@ from engine.orchestrator import OrchestratorConfig
 from engine.workflow import WorkflowRunner, get_workflow_def_for_client
 from voice_assistant.tools import get_all_schemas
 from voice_assistant.tool_router import dispatch_tool_call
+from voice_assistant.tools.rag import close_client as close_rag_client
+from voice_assistant.tools.web_search import close_client as close_search_client
 from engine.fast_path import try_fast_path
 from engine.input_filter import classify as classify_input, InputQuality
-from gateway.turn import fetch_twilio_turn_credentials
+from engine.jsonx import dumps as _json_dumps, loads as _json_loads
+from gateway.turn import fetch_twilio_turn_credentials, close_session as close_turn_session
 
 log = logging.getLogger("gateway")
 
 PORT = int(os.getenv("PORT", "8080"))
 AUTH_TOKEN = os.getenv("AUTH_TOKEN", "devtoken")
+_AUTH_TOKEN_BYTES = AUTH_TOKEN.encode()
 ICE_SERVERS_JSON = os.getenv("ICE_SERVERS_JSON", "[]")
 
 WEB_DIR = Path(__file__).resolve().parent.parent / "web"
 INDEX_TEMPLATE = None  # Loaded on startup
-_START_TIME = None  # Set on app creation
+_INDEX_BYTES = b""  # INDEX_TEMPLATE encoded once on startup
+_INDEX_GZIP = b""  # ...and gzip-compressed once
+_START_MONO = None  # time.monotonic() at app creation
+_STATIC_HELLO: dict = {}  # hello_ack fields that don't vary per connection
+
+STATIC_CACHE_MAX_BYTES = 64 * 1024  # Smaller /static files are served from memory
+# resolved path -> (mtime_ns, etag, gzip etag, content_type, body, gzip body or None)
+_static_cache: dict[Path, tuple] = {}
+
+# workflow_id -> encoded workflow_start frame (templates are static)
+_workflow_start_frames: dict[str, str] = {}
+
+HEALTH_CACHE_SECS = 0.5  # Reuse the serialized /health body for this long
+_health_body = b""
+_health_built_at = 0.0
 
 LOOKUP_PHRASE = "Let me look that up."
 
+WS_COALESCE_SECS = 0.015  # High-rate frames queued within this window go out as one batch
+WS_SEND_QUEUE_MAX = 512  # Per-client backlog past which coalescible frames are dropped
+PULL_PROGRESS_INTERVAL = 0.1  # Min seconds between pull_progress frames per status
+_WF_STATE_KEYS = ("detail", "step", "total", "step_name")  # Optional workflow_state fields
+AGENT_REPLY_MAX_INFLIGHT = 2  # Per-client cap on concurrent LLM turns; later ones wait
+
+# Tools come from voice_assistant/tools/ — same registry for both UIs.
+# web_search is real; check_calendar and search_notes are mocks (F-003, F-004).
+# The registry is filled at import time and search config comes from env, so
+# both are resolved once here instead of on every connect / chat turn.
+_ALL_TOOL_SCHEMAS = get_all_schemas()
+_SEARCH_CONFIGURED = search_is_configured()
+
 
 def build_index_html() -> str:
     """Read index.html and inject ICE servers config."""
@@ -51,17 +88,90 @@ def build_index_html() -> str:
     return raw.replace("__ICE_SERVERS_PLACEHOLDER__", ICE_SERVERS_JSON)
 
 
+def _token_ok(token) -> bool:
+    """Constant-time AUTH_TOKEN comparison for the WS hello."""
+    if not isinstance(token, str):
+        return False
+    raw = token.encode()
+    # Length mismatch can't match; skip the digest compare on obvious junk
+    return len(raw) == len(_AUTH_TOKEN_BYTES) and hmac.compare_digest(raw, _AUTH_TOKEN_BYTES)
+
+
 # ── HTTP routes ───────────────────────────────────────────────
 
 async def handle_index(request: web.Request) -> web.Response:
-    """Serve index.html with injected config."""
-    return web.Response(text=INDEX_TEMPLATE, content_type="text/html")
+    """Serve index.html with injected config (precomputed identity/gzip bodies)."""
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        return web.Response(
+            body=_INDEX_GZIP, content_type="text/html", charset="utf-8",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return web.Response(
+        body=_INDEX_BYTES, content_type="text/html", charset="utf-8",
+        headers={"Vary": "Accept-Encoding"},
+    )
+
+
+def _load_static(path: Path, mtime_ns: int) -> tuple:
+    """Read a small static file into memory, plus a gzip copy for text types."""
+    body = path.read_bytes()
+    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    compressible = content_type.startswith("text/") or content_type in (
+        "application/javascript", "application/json", "image/svg+xml",
+    )
+    gz = gzip.compress(body, compresslevel=6) if compressible else None
+    # Strong ETags must differ per representation, so the gzip body gets its own
+    tag = f"{mtime_ns:x}-{len(body):x}"
+    entry = (mtime_ns, f'"{tag}"', f'"{tag}-gz"', content_type, body, gz)
+    _static_cache[path] = entry
+    return entry
+
+
+async def handle_static(request: web.Request) -> web.StreamResponse:
+    """Serve /static files: small ones from an in-memory cache, large via sendfile.
+
+    Cache entries are keyed by resolved path (so "a//b.js" and "x/../b.js"
+    share one entry) and invalidated when the file's mtime changes. The
+    in-memory path also covers HTTPS mode, where aiohttp can't use sendfile.
+    """
+    path = (WEB_DIR / request.match_info["filename"]).resolve()
+    if WEB_DIR not in path.parents or not path.is_file():
+        raise web.HTTPNotFound()
+    st = path.stat()
+    if st.st_size > STATIC_CACHE_MAX_BYTES:
+        return web.FileResponse(path)
+
+    entry = _static_cache.get(path)
+    if entry is None or entry[0] != st.st_mtime_ns:
+        entry = _load_static(path, st.st_mtime_ns)
+    _, etag, gz_etag, content_type, body, gz = entry
+
+    use_gzip = gz is not None and "gzip" in request.headers.get("Accept-Encoding", "")
+    if use_gzip:
+        etag = gz_etag
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if request.headers.get("If-None-Match") == etag:
+        return web.Response(status=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return web.Response(body=gz, content_type=content_type, headers=headers)
+    return web.Response(body=body, content_type=content_type, headers=headers)
 
 
 async def handle_health(request: web.Request) -> web.Response:
-    """Lightweight health check — confirms event loop is responsive."""
-    uptime = round(time.time() - _START_TIME, 1) if _START_TIME else 0
-    return web.json_response({"status": "ok", "uptime": uptime})
+    """Lightweight health check — confirms event loop is responsive.
+
+    The JSON body is rebuilt at most every HEALTH_CACHE_SECS so load-balancer
+    probes mostly return pre-serialized bytes.
+    """
+    global _health_body, _health_built_at
+    now = time.monotonic()
+    if now - _health_built_at >= HEALTH_CACHE_SECS:
+        # Uptime truncated to 0.1s; monotonic also ignores wall-clock jumps
+        uptime = int((now - _START_MONO) * 10) / 10 if _START_MONO is not None else 0
+        _health_body = _json_dumps({"status": "ok", "uptime": uptime}).encode()
+        _health_built_at = now
+    return web.Response(body=_health_body, content_type="application/json")
 
 
 async def handle_quota(request: web.Request) -> web.Response:
@@ -71,73 +181,186 @@ async def handle_quota(request: web.Request) -> web.Response:
 
 # ── WebSocket handler ─────────────────────────────────────────
 
-async def handle_ws(request: web.Request) -> web.WebSocketResponse:
-    ws = web.WebSocketResponse(heartbeat=20)
-    await ws.prepare(request)
-    log.info("WebSocket connected from %s", request.remote)
+def _encode_frame(frame) -> str:
+    """Return a queued WS frame as JSON text (frames may be pre-encoded)."""
+    return frame if isinstance(frame, str) else _json_dumps(frame)
 
-    session = None  # Will hold WebRTC Session once created
-    ice_servers = []  # Populated on hello, shared with WebRTC session
-    agent_mode = llm_is_configured()
-    llm_provider = ""  # Empty = use default from env
-    llm_model = ""  # Empty = use OLLAMA_MODEL env var
-    tts_voice = DEFAULT_VOICE
-    search_enabled = True  # User toggle, defaults ON
-    client_tz = ""  # IANA timezone from browser (e.g. "America/Chicago")
-
-    # ── Orchestrator setup (shared tool registry) ───────────
-    # Tools come from voice_assistant/tools/ — same registry for both UIs.
-    # web_search is real; check_calendar and search_notes are mocks (F-003, F-004).
-    all_tool_schemas = get_all_schemas()
-
-    async def _safe_ws_send(data: dict) -> bool:
-        """Send JSON over WS, returning False if the connection is gone."""
-        try:
-            if not ws.closed:
-                await ws.send_json(data)
-                return True
-        except Exception:
-            log.debug("WS send failed (connection closing)")
-        return False
 
-    async def _on_status(status: str) -> None:
+def _workflow_start_frame(workflow_id: str):
+    """Encoded workflow_start frame for a template, or None if unknown."""
+    frame = _workflow_start_frames.get(workflow_id)
+    if frame is None:
+        client_def = get_workflow_def_for_client(workflow_id)
+        if not client_def:
+            return None
+        frame = _json_dumps({"type": "workflow_start", **client_def})
+        _workflow_start_frames[workflow_id] = frame
+    return frame
+
+
+class _WebSocketResponse(web.WebSocketResponse):
+    """WebSocketResponse whose send_json encodes with _json_dumps."""
+
+    async def send_json(self, data, compress=None, *, dumps=_json_dumps) -> None:
+        await super().send_json(data, compress=compress, dumps=dumps)
+
+
+class ClientConnection:
+    """Per-WebSocket client state and message handlers.
+
+    One instance per connection; the workflow/orchestrator callbacks are
+    bound methods instead of closures re-created on every accept.
+    """
+
+    __slots__ = (
+        "ws", "session", "ice_servers", "agent_mode", "llm_provider",
+        "llm_model", "tts_voice", "search_enabled", "client_tz", "debug",
+        "out_q", "flush_now", "queued_partial", "writer_task", "reply_tasks", "reply_slots",
+        "runner",
+    )
+
+    def __init__(self, ws: web.WebSocketResponse) -> None:
+        self.ws = ws
+        self.session = None  # Will hold WebRTC Session once created
+        self.ice_servers = []  # Populated on hello, shared with WebRTC session
+        self.agent_mode = llm_is_configured()
+        self.llm_provider = ""  # Empty = use default from env
+        self.llm_model = ""  # Empty = use OLLAMA_MODEL env var
+        self.tts_voice = DEFAULT_VOICE
+        self.search_enabled = True  # User toggle, defaults ON
+        self.client_tz = ""  # IANA timezone from browser (e.g. "America/Chicago")
+        # Checked once per connection: keeps per-frame debug logging off the hot path
+        self.debug = log.isEnabledFor(logging.DEBUG)
+
+        # ── Outbound frame queue ────────────────────────────────
+        # Workflow/transcription callbacks can fire dozens of times per second.
+        # They enqueue here (_queue_frame) and a single writer task coalesces
+        # whatever arrives within WS_COALESCE_SECS into one
+        # {"type": "batch", "items": [...]} frame. Replies and control frames
+        # (_safe_ws_send) share the queue, so every frame after hello_ack
+        # reaches the client in order, but they set flush_now to go out at once.
+        self.out_q: asyncio.Queue = asyncio.Queue()
+        self.flush_now = asyncio.Event()
+        self.queued_partial: list[dict] = []  # Partial transcription frame still in out_q
+        self.writer_task = asyncio.create_task(self._ws_writer())
+        self.reply_tasks: dict[asyncio.Task, None] = {}  # In-flight agent replies, oldest first
+        self.reply_slots = asyncio.Semaphore(AGENT_REPLY_MAX_INFLIGHT)
+
+        runner = WorkflowRunner(config=OrchestratorConfig(
+            provider=self.llm_provider,
+            model=self.llm_model,
+            tools=_ALL_TOOL_SCHEMAS if _SEARCH_CONFIGURED else [],
+            dispatch=dispatch_tool_call,
+            on_status=self._on_status,
+            on_tool_call=self._on_tool_call,
+        ))
+        runner.on_workflow_start = self._on_workflow_start
+        runner.on_workflow_state = self._on_workflow_state
+        runner.on_workflow_exit = self._on_workflow_exit
+        runner.on_narration = self._on_narration
+        runner.on_activity = self._on_activity
+        runner.on_debug = self._on_debug
+        self.runner = runner
+
+    # ── Outbound ────────────────────────────────────────────
+
+    async def _ws_writer(self) -> None:
+        ws = self.ws
+        out_q = self.out_q
+        flush_now = self.flush_now
+        while True:
+            batch = [await out_q.get()]
+            if not flush_now.is_set():
+                # Hold briefly so a burst goes out as one frame; a reply or
+                # control frame queued meanwhile ends the wait early
+                try:
+                    await asyncio.wait_for(flush_now.wait(), WS_COALESCE_SECS)
+                except asyncio.TimeoutError:
+                    pass
+            flush_now.clear()
+            while not out_q.empty():
+                batch.append(out_q.get_nowait())
+            self.queued_partial.clear()
+            if ws.closed:
+                continue
+            try:
+                if len(batch) == 1:
+                    await ws.send_str(_encode_frame(batch[0]))
+                else:
+                    items = ",".join(map(_encode_frame, batch))
+                    await ws.send_str(f'{{"type":"batch","items":[{items}]}}')
+            except Exception:
+                log.debug("WS send failed (connection closing)")
+
+    def _queue_partial_transcription(self, text: str) -> None:
+        """Queue a partial transcription, replacing one that hasn't been sent.
+
+        Each partial carries the full rolling transcript, so only the latest
+        one matters to the client.
+        """
+        if self.queued_partial:
+            self.queued_partial[0]["text"] = text
+            return
+        frame = {"type": "transcription", "text": text, "partial": True}
+        if self._queue_frame(frame):
+            self.queued_partial.append(frame)
+
+    def _queue_frame(self, data) -> bool:
+        """Queue a high-rate frame (status, workflow, partial) for coalescing.
+
+        These are dropped once WS_SEND_QUEUE_MAX frames are backed up, since
+        the next one supersedes them. Returns False if not queued.
+        """
+        if self.ws.closed:
+            return False
+        if self.out_q.qsize() >= WS_SEND_QUEUE_MAX:
+            log.warning("WS send queue full, dropping frame")
+            return False
+        self.out_q.put_nowait(data)
+        return True
+
+    async def _safe_ws_send(self, data) -> bool:
+        """Send a reply or control frame (dict or pre-encoded JSON str).
+
+        Goes through the same queue as coalesced frames, so order is kept,
+        but is never dropped and flushes the writer without waiting out
+        WS_COALESCE_SECS. Returns False if the connection is gone.
+        """
+        if self.ws.closed:
+            return False
+        self.out_q.put_nowait(data)
+        self.flush_now.set()
+        return True
+
+    # ── Orchestrator callbacks ──────────────────────────────
+
+    async def _on_status(self, status: str) -> None:
         if status == "thinking":
-            await _safe_ws_send({"type": "agent_thinking"})
+            self._queue_frame({"type": "agent_thinking"})
         elif status == "searching":
-            await _safe_ws_send({"type": "agent_searching"})
+            self._queue_frame({"type": "agent_searching"})
 
-    async def _on_tool_call(name: str, args: dict) -> None:
-        if ws.closed:
+    async def _on_tool_call(self, name: str, args: dict) -> None:
+        if self.ws.closed:
             return
-        if name == "web_search" and session:
-            await _safe_ws_send({"type": "agent_reply", "text": LOOKUP_PHRASE})
+        if name == "web_search" and self.session:
+            await self._safe_ws_send({"type": "agent_reply", "text": LOOKUP_PHRASE})
             try:
-                await session.speak_text(LOOKUP_PHRASE, voice_id=tts_voice)
+                await self.session.speak_text(LOOKUP_PHRASE, voice_id=self.tts_voice)
             except Exception:
                 log.debug("TTS for lookup phrase failed (session closing)")
-            await _safe_ws_send({"type": "agent_searching"})
-
-    runner = WorkflowRunner(config=OrchestratorConfig(
-        provider=llm_provider,
-        model=llm_model,
-        tools=all_tool_schemas if search_is_configured() else [],
-        dispatch=dispatch_tool_call,
-        on_status=_on_status,
-        on_tool_call=_on_tool_call,
-    ))
+            self._queue_frame({"type": "agent_searching"})
 
     # ── Workflow callbacks (rich WS messages for visual debugger) ──
-    async def _on_workflow_start(workflow_id, wf):
-        client_def = get_workflow_def_for_client(workflow_id)
-        if client_def:
-            await _safe_ws_send({
-                "type": "workflow_start",
-                **client_def,
-            })
 
-    async def _on_workflow_state(state_id, status, **kwargs):
+    async def _on_workflow_start(self, workflow_id, wf):
+        frame = _workflow_start_frame(workflow_id)
+        if frame:
+            self._queue_frame(frame)
+
+    async def _on_workflow_state(self, state_id, status, **kwargs):
         if status == "loop_update":
-            await _safe_ws_send({
+            self._queue_frame({
                 "type": "workflow_loop_update",
                 "state_id": state_id,
                 "children": kwargs.get("children", []),
@@ -149,61 +372,63 @@ async def handle_ws(request: web.Request) -> web.WebSocketResponse:
                 "state_id": state_id,
                 "status": status,
             }
-            if "detail" in kwargs:
-                msg["detail"] = kwargs["detail"]
-            if "step" in kwargs:
-                msg["step"] = kwargs["step"]
-            if "total" in kwargs:
-                msg["total"] = kwargs["total"]
-            if "step_name" in kwargs:
-                msg["step_name"] = kwargs["step_name"]
-            await _safe_ws_send(msg)
-
-    async def _on_workflow_exit(workflow_id):
-        await _safe_ws_send({
+            if kwargs:
+                msg.update({k: kwargs[k] for k in _WF_STATE_KEYS if k in kwargs})
+            self._queue_frame(msg)
+
+    async def _on_workflow_exit(self, workflow_id):
+        self._queue_frame({
             "type": "workflow_exit",
             "workflow_id": workflow_id,
         })
 
-    async def _on_narration(text):
-        await _safe_ws_send({"type": "workflow_narration", "text": text})
+    async def _on_narration(self, text):
+        self._queue_frame({"type": "workflow_narration", "text": text})
 
-    async def _on_activity(activity, timeout_secs):
-        await _safe_ws_send({"type": "workflow_activity", "activity": activity, "timeout_secs": timeout_secs})
+    async def _on_activity(self, activity, timeout_secs):
+        self._queue_frame({"type": "workflow_activity", "activity": activity, "timeout_secs": timeout_secs})
 
-    async def _on_debug(diag):
-        await _safe_ws_send({"type": "workflow_debug", **diag})
+    async def _on_debug(self, diag):
+        self._queue_frame({"type": "workflow_debug", **diag})
 
-    runner.on_workflow_start = _on_workflow_start
-    runner.on_workflow_state = _on_workflow_state
-    runner.on_workflow_exit = _on_workflow_exit
-    runner.on_narration = _on_narration
-    runner.on_activity = _on_activity
-    runner.on_debug = _on_debug
+    # ── Agent reply ─────────────────────────────────────────
 
-    def _refresh_orchestrator_tools():
+    def _refresh_orchestrator_tools(self):
         """Update runner tools based on current search toggle."""
-        if search_enabled and search_is_configured():
-            runner.update_config(tools=all_tool_schemas)
+        if self.search_enabled and _SEARCH_CONFIGURED:
+            self.runner.update_config(tools=_ALL_TOOL_SCHEMAS)
         else:
-            runner.update_config(tools=[])
+            self.runner.update_config(tools=[])
 
-    async def _try_fast_reply(user_text: str) -> bool:
+    async def _try_fast_reply(self, user_text: str) -> bool:
         """Try fast-path (no LLM). Returns True if handled, False to fall through."""
-        reply = try_fast_path(user_text, client_tz=client_tz)
+        reply = try_fast_path(user_text, client_tz=self.client_tz)
         if reply is None:
             return False
-        if not await _safe_ws_send({"type": "agent_reply", "text": reply}):
+        if not await self._safe_ws_send({"type": "agent_reply", "text": reply}):
             return True
-        log.info("Fast-path reply: %r (voice=%s)", reply[:80], tts_voice)
+        log.info("Fast-path reply: %r (voice=%s)", reply[:80], self.tts_voice)
         try:
-            if session:
-                await session.speak_text(reply, voice_id=tts_voice)
+            if self.session:
+                await self.session.speak_text(reply, voice_id=self.tts_voice)
         except Exception as e:
             log.warning("TTS speak failed: %s", e)
         return True
 
+    def _start_agent_reply(self, *args) -> None:
+        """Run _do_agent_reply in the background, capped per connection.
+
+        A user rapid-firing messages would otherwise pile up LLM calls; past
+        AGENT_REPLY_MAX_INFLIGHT, later turns wait for a slot (in order)
+        rather than cancelling one mid-turn and leaving history half-written.
+        """
+        reply_tasks = self.reply_tasks
+        task = asyncio.create_task(self._do_agent_reply(*args))
+        reply_tasks[task] = None
+        task.add_done_callback(lambda t: reply_tasks.pop(t, None))
+
     async def _do_agent_reply(
+        self,
         user_text: str,
         no_speech_prob: float = 0.0,
         avg_logprob: float = 0.0,
@@ -217,274 +442,338 @@ async def handle_ws(request: web.Request) -> web.WebSocketResponse:
             return
 
         # Layer 2: Fast path — answer simple queries without LLM
-        if await _try_fast_reply(user_text):
+        if await self._try_fast_reply(user_text):
             return
 
         try:
-            reply = await runner.chat(user_text)
+            async with self.reply_slots:
+                reply = await self.runner.chat(user_text)
         except Exception as e:
             log.error("WorkflowRunner error: %s", e)
-            await _safe_ws_send({"type": "error", "message": f"LLM error: {e}"})
+            await self._safe_ws_send({"type": "error", "message": f"LLM error: {e}"})
             return
 
-        if not await _safe_ws_send({"type": "agent_reply", "text": reply}):
+        if not await self._safe_ws_send({"type": "agent_reply", "text": reply}):
             return  # Client gone, skip TTS
-        log.info("Agent reply: %r (voice=%s)", reply[:80], tts_voice)
+        log.info("Agent reply: %r (voice=%s)", reply[:80], self.tts_voice)
 
         try:
-            if session:
-                await session.speak_text(reply, voice_id=tts_voice)
+            if self.session:
+                await self.session.speak_text(reply, voice_id=self.tts_voice)
         except Exception as e:
             log.warning("TTS speak failed: %s", e)
 
-    async for raw in ws:
-        if raw.type != web.WSMsgType.TEXT:
-            continue
-        try:
-            msg = json.loads(raw.data)
-        except json.JSONDecodeError:
-            await ws.send_json({"type": "error", "message": "Invalid JSON"})
-            continue
-
-        msg_type = msg.get("type")
-        log.debug("WS recv: %s", msg_type)
-
-        if msg_type == "hello":
-            token = msg.get("token", "")
-            if token != AUTH_TOKEN:
-                await ws.send_json({"type": "error", "message": "Bad token"})
-                await ws.close()
-                break
-            # Inject client timezone into system prompt for time awareness
-            client_tz = msg.get("timezone", "")
-            if client_tz:
-                from datetime import datetime
-                from zoneinfo import ZoneInfo
-                try:
-                    now = datetime.now(ZoneInfo(client_tz))
-                    time_ctx = (
-                        f"The user's timezone is {client_tz}. "
-                        f"Their current local time is {now.strftime('%I:%M %p')} "
-                        f"on {now.strftime('%A, %B %d, %Y')}. "
-                    )
-                    from engine.orchestrator import _default_system_prompt
-                    runner.update_config(system_prompt=time_ctx + _default_system_prompt())
-                    log.info("Client timezone: %s (%s)", client_tz, now.strftime('%I:%M %p %Z'))
-                except Exception:
-                    log.warning("Invalid client timezone: %s", client_tz)
-            # Fetch fresh TURN credentials (falls back to ICE_SERVERS_JSON)
-            ice_servers = await fetch_twilio_turn_credentials()
-            if not ice_servers:
-                try:
-                    ice_servers = json.loads(ICE_SERVERS_JSON)
-                except json.JSONDecodeError:
-                    ice_servers = []
-            tts_voices = list_voices()
-            model_catalog = await get_available_models()
-            # Default to Claude Haiku if API key is set, else Ollama, else auto-detect
-            default_model = ""
-            if os.getenv("ANTHROPIC_API_KEY", ""):
-                default_provider = "claude"
-                default_model = "claude-haiku-4-5-20251001"
-                llm_provider = "claude"
-                llm_model = default_model
-                runner.update_config(provider=llm_provider, model=llm_model)
-                log.info("Default model: claude/%s", default_model)
-            elif model_catalog["ollama_installed"]:
-                default_provider = "ollama"
-                # Respect OLLAMA_MODEL env var, else prefer qwen3:8b, else first installed
-                installed_names = [m["name"] for m in model_catalog["ollama_installed"]]
-                env_model = os.getenv("OLLAMA_MODEL", "")
-                if env_model and env_model in installed_names:
-                    default_model = env_model
-                elif "qwen3:8b" in installed_names:
-                    default_model = "qwen3:8b"
-                else:
-                    default_model = installed_names[0]
-                llm_provider = "ollama"
-                llm_model = default_model
-                runner.update_config(provider=llm_provider, model=llm_model)
-                log.info("Default model: ollama/%s", default_model)
+    # ── Inbound message handlers (dispatched by msg["type"]) ────
+
+    async def _handle_hello(self, msg: dict) -> None:
+        ws = self.ws
+        runner = self.runner
+        if not _token_ok(msg.get("token", "")):
+            await ws.send_json({"type": "error", "message": "Bad token"})
+            await ws.close()
+            return
+        # Inject client timezone into system prompt for time awareness
+        client_tz = self.client_tz = msg.get("timezone", "")
+        if client_tz:
+            from datetime import datetime
+            from zoneinfo import ZoneInfo
+            try:
+                now = datetime.now(ZoneInfo(client_tz))
+                time_ctx = (
+                    f"The user's timezone is {client_tz}. "
+                    f"Their current local time is {now.strftime('%I:%M %p')} "
+                    f"on {now.strftime('%A, %B %d, %Y')}. "
+                )
+                from engine.orchestrator import _default_system_prompt
+                runner.update_config(system_prompt=time_ctx + _default_system_prompt())
+                log.info("Client timezone: %s (%s)", client_tz, now.strftime('%I:%M %p %Z'))
+            except Exception:
+                log.warning("Invalid client timezone: %s", client_tz)
+        # Fetch fresh TURN credentials (falls back to ICE_SERVERS_JSON)
+        ice_servers = await fetch_twilio_turn_credentials()
+        if not ice_servers:
+            try:
+                ice_servers = _json_loads(ICE_SERVERS_JSON)
+            except json.JSONDecodeError:
+                ice_servers = []
+        self.ice_servers = ice_servers
+        model_catalog = await get_available_models()
+        # Default to Claude Haiku if API key is set, else Ollama, else auto-detect
+        default_model = ""
+        if os.getenv("ANTHROPIC_API_KEY", ""):
+            default_provider = "claude"
+            default_model = "claude-haiku-4-5-20251001"
+            self.llm_provider = "claude"
+            self.llm_model = default_model
+            runner.update_config(provider=self.llm_provider, model=self.llm_model)
+            log.info("Default model: claude/%s", default_model)
+        elif model_catalog["ollama_installed"]:
+            default_provider = "ollama"
+            # Respect OLLAMA_MODEL env var, else prefer qwen3:8b, else first installed
+            installed_names = [m["name"] for m in model_catalog["ollama_installed"]]
+            env_model = os.getenv("OLLAMA_MODEL", "")
+            if env_model and env_model in installed_names:
+                default_model = env_model
+            elif "qwen3:8b" in installed_names:
+                default_model = "qwen3:8b"
             else:
-                default_provider = get_provider_name()
-            search_quota = await get_quota_status()
-            await ws.send_json({
-                "type": "hello_ack",
-                "voices": tts_voices,
-                "tts_voices": tts_voices,
-                "tts_default_voice": tts_voice,
-                "ice_servers": ice_servers,
-                "llm_providers": available_providers(),
-                "llm_default": default_provider,
-                "model_catalog": model_catalog,
-                "llm_default_provider": default_provider,
-                "llm_default_model": default_model,
-                "search_enabled": search_enabled,
-                "search_quota": search_quota,
+                default_model = installed_names[0]
+            self.llm_provider = "ollama"
+            self.llm_model = default_model
+            runner.update_config(provider=self.llm_provider, model=self.llm_model)
+            log.info("Default model: ollama/%s", default_model)
+        else:
+            default_provider = get_provider_name()
+        search_quota = await get_quota_status()
+        voices = list_voices()  # Cached; fresh after a voice download
+        await ws.send_json({
+            **_STATIC_HELLO,
+            "voices": voices,
+            "tts_voices": voices,
+            "tts_default_voice": self.tts_voice,
+            "ice_servers": ice_servers,
+            "llm_default": default_provider,
+            "model_catalog": model_catalog,
+            "llm_default_provider": default_provider,
+            "llm_default_model": default_model,
+            "search_enabled": self.search_enabled,
+            "search_quota": search_quota,
+        })
+
+    async def _handle_webrtc_offer(self, msg: dict) -> None:
+        sdp = msg.get("sdp", "")
+        if not sdp:
+            await self._safe_ws_send({"type": "error", "message": "Missing SDP"})
+            return
+        from gateway.webrtc import Session
+        self.session = Session(ice_servers=self.ice_servers)
+        answer_sdp = await self.session.handle_offer(sdp)
+        await self._safe_ws_send({"type": "webrtc_answer", "sdp": answer_sdp})
+
+    async def _handle_start(self, msg: dict) -> None:
+        voice_id = msg.get("voice_id", "")
+        if self.session:
+            self.session.start_audio(voice_id)
+            log.info("Audio started: %s", voice_id)
+        else:
+            await self._safe_ws_send({"type": "error", "message": "No WebRTC session"})
+
+    async def _handle_stop(self, msg: dict) -> None:
+        if self.session:
+            self.session.stop_audio()
+            log.info("Audio stopped")
+
+    async def _handle_speak(self, msg: dict) -> None:
+        text = msg.get("text", "").strip()
+        if not text:
+            await self._safe_ws_send({"type": "error", "message": "Empty text"})
+        elif self.session:
+            log.info("TTS speak: %r (voice=%s)", text[:80], self.tts_voice)
+            await self.session.speak_text(text, voice_id=self.tts_voice)
+        else:
+            await self._safe_ws_send({"type": "error", "message": "No WebRTC session"})
+
+    async def _handle_set_provider(self, msg: dict) -> None:
+        provider = msg.get("provider", "")
+        if provider in ("claude", "openai", "ollama"):
+            self.llm_provider = provider
+            self.runner.update_config(provider=provider)
+            log.info("LLM provider switched to: %s", provider)
+            await self._safe_ws_send({"type": "provider_set", "provider": provider})
+        else:
+            await self._safe_ws_send({"type": "error", "message": f"Unknown provider: {provider}"})
+
+    async def _handle_set_model(self, msg: dict) -> None:
+        provider = msg.get("provider", "")
+        model = msg.get("model", "")
+        if provider in ("claude", "openai", "ollama"):
+            self.llm_provider = provider
+            self.llm_model = model if provider == "ollama" else ""
+            self.runner.update_config(provider=self.llm_provider, model=self.llm_model)
+            self.runner.clear_history()
+            log.info("Model switched: provider=%s, model=%s (conversation cleared)", provider, model)
+            await self._safe_ws_send({"type": "model_set", "provider": provider, "model": model})
+        else:
+            await self._safe_ws_send({"type": "error", "message": f"Unknown provider: {provider}"})
+
+    async def _handle_set_voice(self, msg: dict) -> None:
+        voice_id = msg.get("voice_id", "")
+        if voice_id in VOICE_IDS:
+            self.tts_voice = voice_id
+            log.info("Voice switched to: %s", voice_id)
+            await self._safe_ws_send({
+                "type": "voice_set",
+                "voice_id": voice_id,
+                "tts_voices": list_voices(),
             })
+        else:
+            await self._safe_ws_send({"type": "error", "message": f"Unknown voice: {voice_id}"})
 
-        elif msg_type == "webrtc_offer":
-            sdp = msg.get("sdp", "")
-            if not sdp:
-                await ws.send_json({"type": "error", "message": "Missing SDP"})
-                continue
-            from gateway.webrtc import Session
-            session = Session(ice_servers=ice_servers)
-            answer_sdp = await session.handle_offer(sdp)
-            await ws.send_json({"type": "webrtc_answer", "sdp": answer_sdp})
-
-        elif msg_type == "start":
-            voice_id = msg.get("voice_id", "")
-            if session:
-                session.start_audio(voice_id)
-                log.info("Audio started: %s", voice_id)
-            else:
-                await ws.send_json({"type": "error", "message": "No WebRTC session"})
-
-        elif msg_type == "stop":
-            if session:
-                session.stop_audio()
-                log.info("Audio stopped")
-
-        elif msg_type == "speak":
-            text = msg.get("text", "").strip()
-            if not text:
-                await ws.send_json({"type": "error", "message": "Empty text"})
-            elif session:
-                log.info("TTS speak: %r (voice=%s)", text[:80], tts_voice)
-                await session.speak_text(text, voice_id=tts_voice)
-            else:
-                await ws.send_json({"type": "error", "message": "No WebRTC session"})
-
-        elif msg_type == "set_provider":
-            provider = msg.get("provider", "")
-            if provider in ("claude", "openai", "ollama"):
-                llm_provider = provider
-                runner.update_config(provider=provider)
-                log.info("LLM provider switched to: %s", provider)
-                await ws.send_json({"type": "provider_set", "provider": provider})
-            else:
-                await ws.send_json({"type": "error", "message": f"Unknown provider: {provider}"})
-
-        elif msg_type == "set_model":
-            provider = msg.get("provider", "")
-            model = msg.get("model", "")
-            if provider in ("claude", "openai", "ollama"):
-                llm_provider = provider
-                llm_model = model if provider == "ollama" else ""
-                runner.update_config(provider=llm_provider, model=llm_model)
-                runner.clear_history()
-                log.info("Model switched: provider=%s, model=%s (conversation cleared)", provider, model)
-                await ws.send_json({"type": "model_set", "provider": provider, "model": model})
-            else:
-                await ws.send_json({"type": "error", "message": f"Unknown provider: {provider}"})
-
-        elif msg_type == "set_voice":
-            voice_id = msg.get("voice_id", "")
-            known_ids = {v["id"] for v in list_voices()}
-            if voice_id in known_ids:
-                tts_voice = voice_id
-                log.info("Voice switched to: %s", voice_id)
-                await ws.send_json({
-                    "type": "voice_set",
-                    "voice_id": voice_id,
-                    "tts_voices": list_voices(),
+    async def _handle_pull_model(self, msg: dict) -> None:
+        model_name = msg.get("model", "")
+        if not model_name:
+            await self._safe_ws_send({"type": "error", "message": "Missing model name"})
+            return
+        log.info("Starting model pull: %s", model_name)
+        await self._safe_ws_send({"type": "pull_started", "model": model_name})
+        asyncio.create_task(self._do_pull(model_name))
+
+    async def _do_pull(self, model_name: str) -> None:
+        ws = self.ws
+        # Ollama streams hundreds of byte-count updates per second; forward
+        # every status change but at most one update per interval otherwise.
+        last_status = None
+        last_sent = 0.0
+        try:
+            async for progress in pull_ollama_model(model_name):
+                if ws.closed:
+                    log.warning("WS closed during pull of %s", model_name)
+                    return
+                status = progress.get("status", "")
+                now = time.monotonic()
+                if status == last_status and now - last_sent < PULL_PROGRESS_INTERVAL:
+                    continue
+                last_status = status
+                last_sent = now
+                total = progress.get("total", 0)
+                completed = progress.get("completed", 0)
+                pct = int(completed / total * 100) if total > 0 else 0
+                await self._safe_ws_send({
+                    "type": "pull_progress",
+                    "model": model_name,
+                    "status": status,
+                    "percent": pct,
+                    "total": total,
+                    "completed": completed,
                 })
-            else:
-                await ws.send_json({"type": "error", "message": f"Unknown voice: {voice_id}"})
+            if not ws.closed:
+                updated_catalog = await get_available_models()
+                await self._safe_ws_send({"type": "pull_complete", "model": model_name})
+                await self._safe_ws_send({"type": "model_catalog_update", "model_catalog": updated_catalog})
+            log.info("Model pull complete: %s", model_name)
+        except Exception as e:
+            log.error("Model pull failed: %s — %s", model_name, e)
+            if not ws.closed:
+                await self._safe_ws_send({"type": "pull_error", "model": model_name, "message": str(e)})
 
-        elif msg_type == "pull_model":
-            model_name = msg.get("model", "")
-            if not model_name:
-                await ws.send_json({"type": "error", "message": "Missing model name"})
+    async def _handle_stop_speaking(self, msg: dict) -> None:
+        if self.session:
+            self.session.stop_speaking()
+            log.info("TTS playback stopped by user")
+
+    async def _on_transcription(self, text, partial):
+        if partial:
+            self._queue_partial_transcription(text)
+        else:
+            await self._safe_ws_send({"type": "transcription", "text": text, "partial": False})
+        if self.debug:
+            log.debug("Partial transcription: %r", text[:80] if text else "")
+
+    async def _handle_mic_start(self, msg: dict) -> None:
+        if self.session:
+            self.session.start_recording(on_transcription=self._on_transcription)
+            log.info("Mic recording started (live)")
+        else:
+            await self._safe_ws_send({"type": "error", "message": "No WebRTC session"})
+
+    async def _handle_mic_stop(self, msg: dict) -> None:
+        if self.session:
+            log.info("Mic recording stopping, final STT...")
+            text, no_speech_prob, avg_logprob, audio_duration_s = await self.session.stop_recording()
+            await self._safe_ws_send({"type": "transcription", "text": text, "partial": False})
+            log.info("Final transcription: %r", text[:80] if text else "")
+
+            # Agent mode: run in background so WS loop stays responsive
+            if self.agent_mode and text.strip():
+                self._refresh_orchestrator_tools()
+                self._start_agent_reply(text, no_speech_prob, avg_logprob, audio_duration_s)
+        else:
+            await self._safe_ws_send({"type": "error", "message": "No WebRTC session"})
+
+    async def _handle_chat(self, msg: dict) -> None:
+        # Text-only chat (no mic/WebRTC needed) — useful for testing
+        text = msg.get("text", "").strip()
+        if text:
+            self._refresh_orchestrator_tools()
+            await self._safe_ws_send({"type": "transcription", "text": text, "partial": False})
+            self._start_agent_reply(text)
+        else:
+            await self._safe_ws_send({"type": "error", "message": "Empty chat text"})
+
+    async def _handle_set_search_enabled(self, msg: dict) -> None:
+        self.search_enabled = msg.get("enabled", True)
+        self._refresh_orchestrator_tools()
+        log.info("Web search %s by user", "enabled" if self.search_enabled else "disabled")
+        await self._safe_ws_send({"type": "search_enabled_set", "enabled": self.search_enabled})
+
+    async def _handle_ping(self, msg: dict) -> None:
+        await self._safe_ws_send({"type": "pong"})
+
+    _HANDLERS = {
+        "hello": _handle_hello,
+        "webrtc_offer": _handle_webrtc_offer,
+        "start": _handle_start,
+        "stop": _handle_stop,
+        "speak": _handle_speak,
+        "set_provider": _handle_set_provider,
+        "set_model": _handle_set_model,
+        "set_voice": _handle_set_voice,
+        "pull_model": _handle_pull_model,
+        "stop_speaking": _handle_stop_speaking,
+        "mic_start": _handle_mic_start,
+        "mic_stop": _handle_mic_stop,
+        "chat": _handle_chat,
+        "set_search_enabled": _handle_set_search_enabled,
+        "ping": _handle_ping,
+    }
+
+    # ── Main loop ───────────────────────────────────────────
+
+    async def run(self) -> None:
+        """Receive and dispatch frames until the client disconnects."""
+        ws = self.ws
+        handlers = self._HANDLERS
+        async for raw in ws:
+            if raw.type != web.WSMsgType.TEXT:
+                continue
+            try:
+                msg = _json_loads(raw.data)
+            except json.JSONDecodeError:
+                await self._safe_ws_send({"type": "error", "message": "Invalid JSON"})
                 continue
-            log.info("Starting model pull: %s", model_name)
-            await ws.send_json({"type": "pull_started", "model": model_name})
 
-            async def _do_pull(ws, model_name):
-                try:
-                    async for progress in pull_ollama_model(model_name):
-                        if ws.closed:
-                            log.warning("WS closed during pull of %s", model_name)
-                            return
-                        status = progress.get("status", "")
-                        total = progress.get("total", 0)
-                        completed = progress.get("completed", 0)
-                        pct = int(completed / total * 100) if total > 0 else 0
-                        await ws.send_json({
-                            "type": "pull_progress",
-                            "model": model_name,
-                            "status": status,
-                            "percent": pct,
-                            "total": total,
-                            "completed": completed,
-                        })
-                    if not ws.closed:
-                        updated_catalog = await get_available_models()
-                        await ws.send_json({"type": "pull_complete", "model": model_name})
-                        await ws.send_json({"type": "model_catalog_update", "model_catalog": updated_catalog})
-                    log.info("Model pull complete: %s", model_name)
-                except Exception as e:
-                    log.error("Model pull failed: %s — %s", model_name, e)
-                    if not ws.closed:
-                        await ws.send_json({"type": "pull_error", "model": model_name, "message": str(e)})
-
-            asyncio.create_task(_do_pull(ws, model_name))
-
-        elif msg_type == "stop_speaking":
-            if session:
-                session.stop_speaking()
-                log.info("TTS playback stopped by user")
-
-        elif msg_type == "mic_start":
-            if session:
-                async def on_transcription(text, partial):
-                    await _safe_ws_send({"type": "transcription", "text": text, "partial": partial})
-                    log.debug("Partial transcription: %r", text[:80] if text else "")
-                session.start_recording(on_transcription=on_transcription)
-                log.info("Mic recording started (live)")
-            else:
-                await ws.send_json({"type": "error", "message": "No WebRTC session"})
-
-        elif msg_type == "mic_stop":
-            if session:
-                log.info("Mic recording stopping, final STT...")
-                text, no_speech_prob, avg_logprob, audio_duration_s = await session.stop_recording()
-                await ws.send_json({"type": "transcription", "text": text, "partial": False})
-                log.info("Final transcription: %r", text[:80] if text else "")
-
-                # Agent mode: run in background so WS loop stays responsive
-                if agent_mode and text.strip():
-                    _refresh_orchestrator_tools()
-                    asyncio.create_task(_do_agent_reply(text, no_speech_prob, avg_logprob, audio_duration_s))
-            else:
-                await ws.send_json({"type": "error", "message": "No WebRTC session"})
-
-        elif msg_type == "chat":
-            # Text-only chat (no mic/WebRTC needed) — useful for testing
-            text = msg.get("text", "").strip()
-            if text:
-                _refresh_orchestrator_tools()
-                await _safe_ws_send({"type": "transcription", "text": text, "partial": False})
-                asyncio.create_task(_do_agent_reply(text))
-            else:
-                await ws.send_json({"type": "error", "message": "Empty chat text"})
+            msg_type = msg.get("type")
+            if self.debug:
+                log.debug("WS recv: %s", msg_type)
 
-        elif msg_type == "set_search_enabled":
-            search_enabled = msg.get("enabled", True)
-            _refresh_orchestrator_tools()
-            log.info("Web search %s by user", "enabled" if search_enabled else "disabled")
-            await ws.send_json({"type": "search_enabled_set", "enabled": search_enabled})
+            handler = handlers.get(msg_type)
+            if handler is None:
+                await self._safe_ws_send({"type": "error", "message": f"Unknown type: {msg_type}"})
+                continue
+            await handler(self, msg)
+            if ws.closed:
+                break
 
-        elif msg_type == "ping":
-            await ws.send_json({"type": "pong"})
+    async def close(self) -> None:
+        """Cleanup on disconnect."""
+        self.writer_task.cancel()
+        for task in list(self.reply_tasks):
+            task.cancel()
+        if self.session:
+            await self.session.close()
 
-        else:
-            await ws.send_json({"type": "error", "message": f"Unknown type: {msg_type}"})
 
-    # Cleanup on disconnect
-    if session:
-        await session.close()
+async def handle_ws(request: web.Request) -> web.WebSocketResponse:
+    # Frames are small JSON; permessage-deflate would cost CPU per frame for little gain
+    ws = _WebSocketResponse(heartbeat=20, compress=False)
+    await ws.prepare(request)
+    log.info("WebSocket connected from %s", request.remote)
+
+    conn = ClientConnection(ws)
+    try:
+        await conn.run()
+    finally:
+        await conn.close()
     log.info("WebSocket disconnected")
     return ws
 
@@ -492,16 +781,27 @@ async def handle_ws(request: web.Request) -> web.WebSocketResponse:
 # ── App setup ─────────────────────────────────────────────────
 
 def create_app() -> web.Application:
-    global INDEX_TEMPLATE, _START_TIME
+    global INDEX_TEMPLATE, _INDEX_BYTES, _INDEX_GZIP
+    global _START_MONO, _STATIC_HELLO
     INDEX_TEMPLATE = build_index_html()
-    _START_TIME = time.time()
+    _INDEX_BYTES = INDEX_TEMPLATE.encode()
+    _INDEX_GZIP = gzip.compress(_INDEX_BYTES, compresslevel=6)
+    _START_MONO = time.monotonic()
+    # Voice lists are sent per hello: their "downloaded" flags change at runtime
+    _STATIC_HELLO = {
+        "type": "hello_ack",
+        "llm_providers": available_providers(),
+    }
 
     app = web.Application()
     app.router.add_get("/", handle_index)
     app.router.add_get("/health", handle_health)
     app.router.add_get("/api/quota", handle_quota)
     app.router.add_get("/ws", handle_ws)
-    app.router.add_static("/static", WEB_DIR, show_index=False)
+    app.router.add_get("/static/{filename:.+}", handle_static)
+    app.on_cleanup.append(lambda _app: close_turn_session())
+    app.on_cleanup.append(lambda _app: close_search_client())
+    app.on_cleanup.append(lambda _app: close_rag_client())
     return app
 
 
@@ -556,4 +856,12 @@ if __name__ == "__main__":
     else:
         log.info("Serving on http://0.0.0.0:%d", PORT)
 
+    # libuv event loop: cheaper task scheduling and socket I/O (Linux/macOS)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        log.info("Using uvloop event loop")
+    except ImportError:
+        log.info("uvloop not installed, using default asyncio loop")
+
     web.run_app(app, host="0.0.0.0", port=PORT, ssl_context=ssl_ctx)
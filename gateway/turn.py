@@ -2,11 +2,39 @@
 
 import logging
 import os
+import time
 
 import aiohttp
 
 log = logging.getLogger("turn")
 
+# Twilio tokens live far longer than this (default 24h); reuse them across
+# hellos instead of minting a new token per connection.
+TURN_CACHE_SECS = 60
+
+# Lazy-loaded shared session (keeps the TLS connection to Twilio warm)
+_session = None
+_cached_servers: list = []
+_cached_at = 0.0
+
+
+def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=5),
+            connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared Twilio HTTP session (call on app shutdown)."""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
 
 async def fetch_twilio_turn_credentials() -> list:
     """Call Twilio's Network Traversal Service to get temporary TURN/STUN creds.
@@ -14,8 +42,11 @@ async def fetch_twilio_turn_credentials() -> list:
     Returns a list of ICE server dicts in the format:
         [{"urls": "turn:...", "username": "...", "credential": "..."}]
 
+    Successful responses are reused for TURN_CACHE_SECS.
     Returns empty list if Twilio is not configured.
     """
+    global _cached_servers, _cached_at
+
     account_sid = os.getenv("TWILIO_ACCOUNT_SID", "")
     auth_token = os.getenv("TWILIO_AUTH_TOKEN", "")
 
@@ -23,20 +54,22 @@ async def fetch_twilio_turn_credentials() -> list:
         log.warning("TWILIO_ACCOUNT_SID / TWILIO_AUTH_TOKEN not set — no TURN servers")
         return []
 
+    if _cached_servers and time.monotonic() - _cached_at < TURN_CACHE_SECS:
+        return _cached_servers
+
     url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Tokens.json"
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                auth=aiohttp.BasicAuth(account_sid, auth_token),
-            ) as resp:
-                if resp.status != 201:
-                    body = await resp.text()
-                    log.error("Twilio token request failed (%d): %s", resp.status, body)
-                    return []
-
-                data = await resp.json()
+        async with _get_session().post(
+            url,
+            auth=aiohttp.BasicAuth(account_sid, auth_token),
+        ) as resp:
+            if resp.status != 201:
+                body = await resp.text()
+                log.error("Twilio token request failed (%d): %s", resp.status, body)
+                return []
+
+            data = await resp.json()
 
         ice_servers = data.get("ice_servers", [])
         log.info(
@@ -44,6 +77,8 @@ async def fetch_twilio_turn_credentials() -> list:
             len(ice_servers),
             data.get("ttl", "?"),
         )
+        _cached_servers = ice_servers
+        _cached_at = time.monotonic()
         return ice_servers
 
     except Exception as e:
@@ -1,38 +1,70 @@
 """WebRTC session management — PeerConnection lifecycle and ICE config."""
 
 import asyncio
+import functools
 import json
 import logging
 import os
 import re
 
-import numpy as np
-from aiortc import RTCPeerConnection, RTCSessionDescription, RTCConfiguration, RTCIceServer
-
 from engine.adapter import create_generator
 from engine.types import AudioChunk
 from gateway.audio.audio_queue import AudioQueue
-from gateway.audio.webrtc_audio_source import WebRTCAudioSource
+
+# aiortc/av (and numpy) are imported where they're used, so the pure-string
+# helpers (_clean_for_speech, _split_sentences) import without them.
 
 FRAME_SAMPLES = 960  # 20ms at 48kHz
 SAMPLE_RATE = 48000
+BYTES_PER_FRAME = FRAME_SAMPLES * 2  # int16 mono
+_SILENCE_FRAME = bytes(BYTES_PER_FRAME)  # Shared; bytes are immutable
+FRAME_POOL_SIZE = 4  # Rotating per-generator output buffers
 
 log = logging.getLogger("webrtc")
 
+# _clean_for_speech patterns, compiled once (applied in this order)
+_RE_HEADER = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_RE_BULLET = re.compile(r'^\s*[-*•]\s+', re.MULTILINE)
+_RE_NUMBERED = re.compile(r'^\s*\d+\.\s+', re.MULTILINE)
+_RE_EMPHASIS = re.compile(r'\*{1,3}(.+?)\*{1,3}')
+_RE_STRAY_STARS = re.compile(r'\*{1,3}')
+_RE_MDLINK = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_RE_URL = re.compile(r'https?://\S+', re.IGNORECASE)
+_RE_URL_PHRASE = re.compile(r'(?:visit|check|see|at|on|from)\s+https?://\S+', re.IGNORECASE)
+_RE_BACKTICK = re.compile(r'`(.+?)`')
+_RE_NEWLINES = re.compile(r'\n{2,}|\n')
+_RE_MULTI_SPACE = re.compile(r'\s{2,}')
+_RE_MULTI_PERIOD = re.compile(r'\.{2,}')
+
+# _split_sentences: whitespace run after sentence-ending punctuation
+_RE_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+
 
 def ice_servers_to_rtc(servers: list) -> list:
-    """Convert ICE server dicts to RTCIceServer objects."""
-    result = []
+    """Convert ICE server dicts to RTCIceServer objects.
+
+    The server list is the same for every session, so conversions are
+    memoized on a hashable (urls, username, credential) key.
+    """
+    if not servers:
+        return []
+    key = []
     for s in servers:
         urls = s.get("urls", s.get("url", ""))
         if isinstance(urls, str):
             urls = [urls]
-        result.append(RTCIceServer(
-            urls=urls,
-            username=s.get("username", ""),
-            credential=s.get("credential", ""),
-        ))
-    return result
+        key.append((tuple(urls), s.get("username", ""), s.get("credential", "")))
+    return list(_ice_servers_to_rtc_cached(tuple(key)))
+
+
+@functools.lru_cache(maxsize=16)
+def _ice_servers_to_rtc_cached(key: tuple) -> tuple:
+    from aiortc import RTCIceServer
+
+    return tuple(
+        RTCIceServer(urls=list(urls), username=username, credential=credential)
+        for urls, username, credential in key
+    )
 
 
 class QueuedGenerator:
@@ -40,14 +72,25 @@ class QueuedGenerator:
 
     Same interface as SineWaveGenerator (next_chunk() → AudioChunk)
     so WebRTCAudioSource doesn't need to change.
+
+    Frames are read into a small pool of reused bytearrays. A returned
+    chunk's samples stay valid until FRAME_POOL_SIZE more frames have been
+    read; WebRTCAudioSource copies each one into an AudioFrame right away.
     """
 
     def __init__(self, queue: AudioQueue):
         self.queue = queue
+        self._pool = [bytearray(BYTES_PER_FRAME) for _ in range(FRAME_POOL_SIZE)]
+        self._pool_idx = 0
 
     def next_chunk(self) -> AudioChunk:
         """Read one 20ms frame (960 samples = 1920 bytes) from the queue."""
-        pcm = self.queue.read(FRAME_SAMPLES * 2)  # 2 bytes per int16 sample
+        if self.queue.available:
+            pcm = self._pool[self._pool_idx]
+            self._pool_idx = (self._pool_idx + 1) % FRAME_POOL_SIZE
+            self.queue.read_into(pcm)
+        else:
+            pcm = _SILENCE_FRAME  # Idle between sentences: no allocation
         return AudioChunk(samples=pcm, sample_rate=SAMPLE_RATE, channels=1)
 
 
@@ -55,6 +98,9 @@ class Session:
     """Manages one WebRTC peer connection and its audio track."""
 
     def __init__(self, ice_servers: list = None):
+        from aiortc import RTCPeerConnection, RTCConfiguration
+        from gateway.audio.webrtc_audio_source import WebRTCAudioSource
+
         rtc_servers = ice_servers_to_rtc(ice_servers or [])
         config = RTCConfiguration(iceServers=rtc_servers) if rtc_servers else RTCConfiguration()
         self._pc = RTCPeerConnection(configuration=config)
@@ -101,6 +147,8 @@ class Session:
         aiortc bundles all ICE candidates into the answer SDP
         automatically (no trickle ICE support).
         """
+        from aiortc import RTCSessionDescription
+
         # Add our audio track to the connection
         self._pc.addTrack(self._audio_source)
 
@@ -142,31 +190,31 @@ class Session:
         markdown to plain speech-friendly text.
         """
         # Remove markdown headers: ## Header → Header
-        text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+        text = _RE_HEADER.sub('', text)
         # Convert bullet points BEFORE bold (so * bullets don't confuse ** bold)
-        text = re.sub(r'^\s*[-*•]\s+', '', text, flags=re.MULTILINE)
+        text = _RE_BULLET.sub('', text)
         # Convert numbered lists: "1. item" → "item"
-        text = re.sub(r'^\s*\d+\.\s+', '', text, flags=re.MULTILINE)
+        text = _RE_NUMBERED.sub('', text)
         # Remove bold/italic markers: **text** → text, *text* → text
-        text = re.sub(r'\*{1,3}(.+?)\*{1,3}', r'\1', text)
+        text = _RE_EMPHASIS.sub(r'\1', text)
         # Catch any remaining stray asterisks
-        text = re.sub(r'\*{1,3}', '', text)
+        text = _RE_STRAY_STARS.sub('', text)
         # Remove markdown links: [text](url) → text
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
-        # Track if URLs were present, then strip them along with surrounding phrases
-        has_urls = bool(re.search(r'https?://\S+', text))
-        # Strip "Visit/Check/See URL" phrases and bare URLs
-        text = re.sub(r'(?:visit|check|see|at|on|from)\s+https?://\S+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'https?://\S+', '', text)
+        text = _RE_MDLINK.sub(r'\1', text)
+        # Strip "Visit/Check/See URL" phrases and bare URLs; the substitution
+        # counts tell us whether there were any (no separate search pass)
+        has_urls = False
+        if "://" in text:
+            text, n_phrases = _RE_URL_PHRASE.subn('', text)
+            text, n_urls = _RE_URL.subn('', text)
+            has_urls = bool(n_phrases or n_urls)
         # Remove inline code backticks: `code` → code
-        text = re.sub(r'`(.+?)`', r'\1', text)
-        # Collapse multiple newlines into sentence breaks
-        text = re.sub(r'\n{2,}', '. ', text)
-        # Single newlines to spaces
-        text = re.sub(r'\n', ' ', text)
+        text = _RE_BACKTICK.sub(r'\1', text)
+        # Blank lines become sentence breaks, single newlines spaces
+        text = _RE_NEWLINES.sub(lambda m: '. ' if len(m.group()) > 1 else ' ', text)
         # Clean up multiple spaces/periods
-        text = re.sub(r'\s{2,}', ' ', text)
-        text = re.sub(r'\.{2,}', '.', text)
+        text = _RE_MULTI_SPACE.sub(' ', text)
+        text = _RE_MULTI_PERIOD.sub('.', text)
         text = text.strip()
         # If URLs were stripped, add a spoken note about the links
         if has_urls and text:
@@ -176,9 +224,10 @@ class Session:
     @staticmethod
     def _split_sentences(text: str) -> list[str]:
         """Split text into sentences for incremental TTS."""
-        # Split on sentence-ending punctuation followed by whitespace
-        parts = re.split(r'(?<=[.!?])\s+', text.strip())
-        return [p for p in parts if p.strip()]
+        # Split on sentence-ending punctuation followed by whitespace. After
+        # strip() no part can be empty, so only the empty input needs a guard.
+        text = text.strip()
+        return _RE_SENTENCE_BREAK.split(text) if text else []
 
     async def speak_text(self, text: str, voice_id: str = ""):
         """Run TTS sentence-by-sentence and enqueue audio into the FIFO.
@@ -206,6 +255,8 @@ class Session:
 
     async def _recv_mic_audio(self, track):
         """Background task: continuously receive audio frames from the browser mic track."""
+        import numpy as np
+
         logged_format = False
         while True:
             try:
@@ -272,8 +323,11 @@ class Session:
             if text and self._on_transcription and self._recording:
                 await self._on_transcription(text, True)
 
-    async def stop_recording(self) -> str:
-        """Stop recording, cancel periodic task, do final transcription."""
+    async def stop_recording(self) -> tuple[str, float, float, float]:
+        """Stop recording, cancel periodic task, do final transcription.
+
+        Returns (text, no_speech_prob, avg_logprob, audio_duration_s).
+        """
         self._recording = False
 
         # Cancel periodic transcription
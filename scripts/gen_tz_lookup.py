@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Regenerate voice_assistant/tools/_timezone_lookup_generated.py.
+
+Runs the datetime tool's lookup builder once and writes the result as a
+single dict literal, so importing the table is a .pyc load instead of a
+scan of the tz database. Re-run after editing the state/country/alias
+tables in datetime_tool.py or upgrading tzdata.
+
+Usage:
+    python3 scripts/gen_tz_lookup.py
+"""
+
+import os
+import sys
+
+# Add project root to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from voice_assistant.tools.datetime_tool import _build_timezone_lookup  # noqa: E402
+
+OUT_PATH = os.path.join(ROOT, "voice_assistant", "tools", "_timezone_lookup_generated.py")
+
+HEADER = '''"""City/region → IANA timezone lookup for the datetime tool.
+
+Generated by scripts/gen_tz_lookup.py — do not edit by hand.
+"""
+
+TIMEZONE_LOOKUP = {
+'''
+
+
+def main():
+    lookup = _build_timezone_lookup()
+    body = "".join(f"    {key!r}: {iana!r},\n" for key, iana in sorted(lookup.items()))
+    with open(OUT_PATH, "w") as f:
+        f.write(HEADER + body + "}\n")
+    print(f"Wrote {len(lookup)} entries to {os.path.relpath(OUT_PATH, ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
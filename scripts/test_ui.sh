@@ -0,0 +1,35 @@
+#!/usr/bin/env bash
+#
+# test_ui.sh — Run the Playwright UI suites against one shared Chromium.
+#
+# Requires a running server (TEST_URL, default http://localhost:8080).
+#
+# Usage: bash scripts/test_ui.sh
+#
+set -euo pipefail
+
+REPO_ROOT="$(cd "$(dirname "$0")/.." && pwd)"
+CDP_PORT="${PW_CDP_PORT:-9222}"
+
+cd "$REPO_ROOT"
+
+# ── Start shared browser ──────────────────────────────────────
+echo "Starting shared Chromium on port $CDP_PORT..."
+PW_CDP_PORT="$CDP_PORT" python3 tests/_browser_daemon.py &
+DAEMON_PID=$!
+trap 'kill "$DAEMON_PID" 2>/dev/null || true' EXIT
+
+for i in $(seq 1 20); do
+  if curl -s "http://localhost:$CDP_PORT/json/version" >/dev/null 2>&1; then
+    break
+  fi
+  sleep 0.5
+done
+
+export PW_CDP_URL="http://localhost:$CDP_PORT"
+
+# ── Run suites ────────────────────────────────────────────────
+STATUS=0
+python3 tests/test_mobile_ui.py || STATUS=1
+python3 tests/test_ui_workflow_v2.py || STATUS=1
+exit $STATUS
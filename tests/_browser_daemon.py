@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Keep one headless Chromium running for the Playwright UI tests.
+
+Launches Chromium with a remote-debugging port and waits. The UI test
+files attach to it over CDP when PW_CDP_URL is set, so a test run pays
+Chromium's cold start once instead of once per file.
+
+Usage:
+    python3 tests/_browser_daemon.py &
+    export PW_CDP_URL=http://localhost:9222
+    python3 tests/test_mobile_ui.py
+    python3 tests/test_ui_workflow_v2.py
+
+scripts/test_ui.sh does all of the above.
+"""
+
+import os
+import signal
+import sys
+import threading
+
+CDP_PORT = int(os.getenv("PW_CDP_PORT", "9222"))
+
+
+def main():
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        print("playwright not installed. Run: pip3 install playwright && python3 -m playwright install chromium")
+        sys.exit(1)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(
+            headless=True,
+            args=[f"--remote-debugging-port={CDP_PORT}"],
+        )
+        print(f"Chromium ready: PW_CDP_URL=http://localhost:{CDP_PORT}", flush=True)
+        stop.wait()
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
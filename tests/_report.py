@@ -0,0 +1,87 @@
+"""Shared PASS/FAIL/SKIP reporting for the script-style test runners.
+
+Used by test_suite.py, test_ui_workflow_v2.py and test_mobile_ui.py:
+colored result lines, counters, and the closing results box.
+"""
+
+import sys
+from dataclasses import dataclass, field
+
+# ── ANSI colors ──────────────────────────────────────────────
+# Only on a terminal; piped / CI logs get plain text
+if sys.stdout.isatty():
+    GREEN = "\033[92m"
+    RED = "\033[91m"
+    YELLOW = "\033[93m"
+    CYAN = "\033[96m"
+    BOLD = "\033[1m"
+    RESET = "\033[0m"
+else:
+    GREEN = RED = YELLOW = CYAN = BOLD = RESET = ""
+
+
+@dataclass(slots=True)
+class Reporter:
+    """Pass/fail/skip counts plus result lines buffered until flush().
+
+    Lines are written once per section (section() flushes the previous one)
+    so a run costs one write() per section instead of one per result.
+    """
+
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    lines: list[str] = field(default_factory=list)
+
+    def report(self, name: str, ok: bool, detail: str = ""):
+        """Record a single test result."""
+        if ok:
+            tag = f"{GREEN}PASS{RESET}"
+            self.passed += 1
+        else:
+            tag = f"{RED}FAIL{RESET}"
+            self.failed += 1
+        msg = f"  [{tag}] {name}"
+        if detail:
+            msg += f"  ({detail})"
+        self.lines.append(msg)
+
+    def skip(self, name: str, reason: str = ""):
+        """Record a skipped test."""
+        self.skipped += 1
+        msg = f"  [{YELLOW}SKIP{RESET}] {name}"
+        if reason:
+            msg += f"  ({reason})"
+        self.lines.append(msg)
+
+    def section(self, title: str):
+        """Flush the previous section's results and print a section header."""
+        self.flush()
+        sys.stdout.write(f"\n{CYAN}{BOLD}--- {title} ---{RESET}\n")
+
+    def flush(self):
+        """Write buffered output in a single write() call."""
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            self.lines.clear()
+
+    def merge(self, other: "Reporter"):
+        """Add another reporter's counts (e.g. from a worker process)."""
+        self.passed += other.passed
+        self.failed += other.failed
+        self.skipped += other.skipped
+
+    def print_summary(self, footer: str = ""):
+        """Flush, then print the results box; `footer` goes under the counts."""
+        self.flush()
+        total = self.passed + self.failed + self.skipped
+        failed = f"{RED}{self.failed} failed{RESET}{BOLD}" if self.failed else "0 failed"
+        out = [
+            f"\n{BOLD}{'=' * 56}",
+            f"  Results: {GREEN}{self.passed} passed{RESET}{BOLD}, {failed}, "
+            f"{YELLOW}{self.skipped} skipped{RESET}{BOLD}  ({total} total)",
+        ]
+        if footer:
+            out.append(footer)
+        out.append(f"{'=' * 56}{RESET}")
+        sys.stdout.write("\n".join(out) + "\n")
@@ -0,0 +1,129 @@
+/**
+ * test_fixtures.js — DOM fixtures for the Playwright UI tests.
+ *
+ * Installed once per browser context via add_init_script, so tests call
+ * window.__testFixtures.* instead of shipping DOM-building code on every
+ * page.evaluate.
+ */
+window.__testFixtures = {
+    researchCompareDef: {
+        workflow_id: "research_compare",
+        name: "Research & Compare",
+        description: "Lookup current data, decompose, search each entity, synthesize",
+        states: [
+            { id: "initial_lookup", name: "Initial lookup", type: "llm",
+              has_tool: true, tool_name: "web_search", next_step: "decompose",
+              narration: "Searching...", prompt_template: "" },
+            { id: "decompose", name: "Decomposing", type: "llm",
+              has_tool: false, tool_name: "", next_step: "search_each",
+              narration: "Breaking down...", prompt_template: "" },
+            { id: "search_each", name: "Searching each", type: "loop",
+              has_tool: true, tool_name: "web_search", next_step: "synthesize",
+              narration: "Looking up...", prompt_template: "" },
+            { id: "synthesize", name: "Synthesizing", type: "llm",
+              has_tool: false, tool_name: "", next_step: "",
+              narration: "Putting together...", prompt_template: "" }
+        ]
+    },
+
+    /** Render a workflow definition into the map and code debug panels. */
+    renderWorkflowGraph(def) {
+        def = def || this.researchCompareDef;
+        window.WorkflowMap.render(document.getElementById('workflow-map'), def);
+        window.WorkflowCode.render(document.getElementById('workflow-code'), def);
+    },
+
+    /** Mark a state active in both panels, optionally marking `prevId` visited. */
+    highlightState(id, prevId) {
+        if (prevId) window.WorkflowMap.highlight(prevId, 'visited', '');
+        window.WorkflowMap.highlight(id, 'active', '');
+        window.WorkflowCode.highlight(id);
+    },
+
+    /** Read the teal theme variables and the active node's border color. */
+    readThemeVars() {
+        const root = getComputedStyle(document.documentElement);
+        const node = document.querySelector('.wf-node.active');
+        return {
+            teal: root.getPropertyValue('--teal').trim(),
+            panelBg: root.getPropertyValue('--panel-bg').trim(),
+            fontCode: root.getPropertyValue('--font-code').trim(),
+            activeBorder: node ? getComputedStyle(node).borderColor : 'no active node',
+        };
+    },
+
+    /** Append a narration bubble to the conversation log. */
+    renderNarration(text) {
+        const log = document.getElementById('conversation-log');
+        const el = document.createElement('div');
+        el.className = 'msg-narration';
+        el.textContent = text;
+        log.appendChild(el);
+    },
+
+    /** Append a user + agent chat bubble pair to the conversation log. */
+    renderChatBubbles(userText, agentText) {
+        const log = document.getElementById('conversation-log');
+        const user = document.createElement('div');
+        user.className = 'msg msg-user';
+        user.textContent = userText;
+        log.appendChild(user);
+        const agent = document.createElement('div');
+        agent.className = 'msg msg-agent';
+        agent.textContent = agentText;
+        log.appendChild(agent);
+    },
+
+    /** Append a workflow activity card (step 1 of 4, timer, debug row). */
+    renderWorkflowCard() {
+        const log = document.getElementById('conversation-log');
+        const card = document.createElement('div');
+        card.className = 'workflow-card';
+
+        const header = document.createElement('div');
+        header.className = 'wfc-header';
+        header.textContent = 'RESEARCH & COMPARE';
+        card.appendChild(header);
+
+        const progress = document.createElement('div');
+        progress.className = 'wfc-progress';
+        for (let i = 0; i < 4; i++) {
+            const seg = document.createElement('div');
+            seg.className = 'wfc-segment' + (i === 0 ? ' active' : '');
+            progress.appendChild(seg);
+        }
+        card.appendChild(progress);
+
+        const stepLabel = document.createElement('div');
+        stepLabel.className = 'wfc-step-label';
+        stepLabel.textContent = 'Step 1 of 4 — INITIAL LOOKUP';
+        card.appendChild(stepLabel);
+
+        const activity = document.createElement('div');
+        activity.className = 'wfc-activity';
+        activity.textContent = 'Searching for top S&P 500 companies...';
+        card.appendChild(activity);
+
+        const timerRow = document.createElement('div');
+        timerRow.className = 'wfc-timer-row';
+        const timerTrack = document.createElement('div');
+        timerTrack.className = 'wfc-timer-track';
+        const timerFill = document.createElement('div');
+        timerFill.className = 'wfc-timer-fill';
+        timerFill.style.width = '30%';
+        timerTrack.appendChild(timerFill);
+        const timerText = document.createElement('div');
+        timerText.className = 'wfc-timer-text';
+        timerText.textContent = '3s / 10s';
+        timerRow.appendChild(timerTrack);
+        timerRow.appendChild(timerText);
+        card.appendChild(timerRow);
+
+        const debugRow = document.createElement('div');
+        debugRow.className = 'wfc-debug';
+        debugRow.textContent = 'initial_lookup — ollama:qwen3:8b | 42 tok @ 31.5 tok/s';
+        card.appendChild(debugRow);
+
+        log.appendChild(card);
+    },
+};
@@ -2,58 +2,39 @@
 """Playwright mobile viewport tests — iPhone Safari simulation.
 
 Verifies mobile layout, touch targets, Safari workarounds, and
-debug panel behavior at narrow viewport widths.
+debug panel behavior at narrow viewport widths. Independent sections
+run concurrently in separate browser contexts; sections that need the
+connected agent screen run in order on one page.
 
-Requires a running server at localhost:8080 and Chromium installed:
-    python3 -m playwright install chromium
+Requires a running server at localhost:8080 and Chromium + WebKit installed:
+    python3 -m playwright install chromium webkit
 
 Usage:
     python3 tests/test_mobile_ui.py
+    python3 tests/test_mobile_ui.py --force   # ignore cached static results (or UI_TEST_MEMO=0)
+    UI_TEST_ENGINES=chromium python3 tests/test_mobile_ui.py   # skip webkit
+    python3 tests/test_mobile_ui.py --shard 1/4   # CI matrix: run 1 of 4 shards
 """
 
+import argparse
+import asyncio
+import atexit
+import hashlib
+import json
 import sys
 import os
+import re
+import urllib.request
+import xml.etree.ElementTree as ET
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, PROJECT_ROOT)
+if PROJECT_ROOT not in sys.path:  # re-imports (pool workers) don't grow it
+    sys.path.insert(0, PROJECT_ROOT)
 
-GREEN = "\033[92m"
-RED = "\033[91m"
-YELLOW = "\033[93m"
-CYAN = "\033[96m"
-BOLD = "\033[1m"
-RESET = "\033[0m"
+from tests._report import BOLD, RESET, Reporter
 
-passed = 0
-failed = 0
-skipped = 0
-
-
-def report(name, ok, detail=""):
-    global passed, failed
-    if ok:
-        tag = f"{GREEN}PASS{RESET}"
-        passed += 1
-    else:
-        tag = f"{RED}FAIL{RESET}"
-        failed += 1
-    msg = f"  [{tag}] {name}"
-    if detail:
-        msg += f"  ({detail})"
-    print(msg)
-
-
-def skip(name, reason=""):
-    global skipped
-    skipped += 1
-    msg = f"  [{YELLOW}SKIP{RESET}] {name}"
-    if reason:
-        msg += f"  ({reason})"
-    print(msg)
-
-
-def section(title):
-    print(f"\n{CYAN}{BOLD}--- {title} ---{RESET}")
+stats = Reporter()
+atexit.register(stats.flush)
 
 
 # iPhone 14 viewport (390x844) with Safari user agent
@@ -64,568 +45,731 @@ SAFARI_UA = (
     "Version/17.0 Mobile/15E148 Safari/604.1"
 )
 
+# Measurement helpers installed once per context (add_init_script) so each
+# evaluate ships a short call instead of re-sending the same boilerplate.
+MEASURE_HELPERS_JS = """
+window.__mm = {
+    rect: id => document.getElementById(id).getBoundingClientRect(),
+    style: id => getComputedStyle(document.getElementById(id)),
+    qsRect: sel => document.querySelector(sel).getBoundingClientRect(),
+};
+"""
 
-def main():
+# DOM fixtures (workflow card, bubbles, ...) installed next to the helpers
+FIXTURES_JS = os.path.join(PROJECT_ROOT, "tests", "fixtures", "test_fixtures.js")
+
+# Raw /static/styles.css, fetched once per run. Substring checks on the source
+# replace stylesheet walks in the page; Chromium also strips Safari-only
+# properties (e.g. -webkit-overflow-scrolling) from parsed rules.
+css_text = ""
+
+# Tokens the CSS / viewport-meta checks look for, matched in one pass each.
+# css_found is filled from css_text in run_all().
+_CSS_PROBES = re.compile(r"safe-area-inset|100dvh|-webkit-overflow-scrolling|touch")
+_VIEWPORT_PROBES = re.compile(r"user-scalable=no|device-width")
+css_found = frozenset()
+
+WAIT_MS = 2000  # Upper bound for DOM-settle waits (they normally resolve in ms)
+
+# Sections whose results depend only on the served build (HTML + CSS + JS),
+# the test sources and the browser. Passing results are memoized per build hash and replayed on re-runs
+# against an unchanged build. Pass --force (or UI_TEST_MEMO=0) to always re-measure.
+MEMO_SECTIONS = {1, 2, 3, 10, 12}
+MEMO_DIR = os.path.join(PROJECT_ROOT, ".cache", "test_mobile_ui")
+USE_MEMO = os.getenv("UI_TEST_MEMO", "1") != "0"
+# Local files folded into the build hash next to the fetched CSS/HTML: the
+# served app.js, the DOM fixtures, and this file (the section functions)
+MEMO_SOURCES = (
+    os.path.join(PROJECT_ROOT, "web", "app.js"),
+    FIXTURES_JS,
+    os.path.abspath(__file__),
+)
+
+# Engines run concurrently. Chromium emulates Safari via UA; webkit is the
+# real Safari engine (python3 -m playwright install webkit).
+ENGINES = [e.strip() for e in os.getenv("UI_TEST_ENGINES", "chromium,webkit").split(",") if e.strip()]
+
+# CI sharding: "I/N" runs every N-th section unit starting at I (1-based).
+# The connected sections share one page, so they form a single unit.
+SHARD = (1, 1)
+REPORT_DIR = os.path.join(PROJECT_ROOT, ".test-reports")
+
+
+def parse_shard(spec):
+    """Parse "I/N" into (I, N) with 1 <= I <= N."""
     try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        print("playwright not installed. Run: pip3 install playwright && python3 -m playwright install chromium")
-        sys.exit(1)
+        index, total = (int(x) for x in spec.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected I/N, got {spec!r}")
+    if not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"shard {spec!r} out of range")
+    return index, total
 
-    auth_token = os.getenv("AUTH_TOKEN", "devtoken")
-    base_url = os.getenv("TEST_URL", "http://localhost:8080")
 
-    print(f"\n{BOLD}{'=' * 56}")
-    print(f"  Mobile UI — Playwright iPhone Viewport Tests")
-    print(f"  Server: {base_url}")
-    print(f"  Viewport: {IPHONE_VIEWPORT['width']}x{IPHONE_VIEWPORT['height']}")
-    print(f"{'=' * 56}{RESET}")
+def in_shard(position):
+    index, total = SHARD
+    return position % total == index - 1
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            viewport=IPHONE_VIEWPORT,
-            user_agent=SAFARI_UA,
-            has_touch=True,
-            is_mobile=True,
-            device_scale_factor=3,  # iPhone 14 = 3x
-        )
-        page = context.new_page()
 
-        # ══════════════════════════════════════════════
-        # Section 1: Viewport & Meta Tags
-        # ══════════════════════════════════════════════
-        section("Viewport & Meta Tags")
-        try:
-            page.goto(base_url, timeout=10000)
-            report("page loads at mobile viewport", True)
-        except Exception as e:
-            report("page loads at mobile viewport", False, str(e))
-            browser.close()
-            _print_summary()
-            return
+def fetch_text(url):
+    try:
+        with urllib.request.urlopen(url, timeout=10) as resp:
+            return resp.read().decode()
+    except Exception:
+        return ""
 
-        # Check viewport meta tag
-        viewport_meta = page.evaluate("""
-            (() => {
-                const meta = document.querySelector('meta[name="viewport"]');
-                return meta ? meta.getAttribute('content') : '';
-            })()
-        """)
-        report("viewport meta tag exists", bool(viewport_meta), f"content: {viewport_meta}")
-        report("user-scalable=no set",
-               "user-scalable=no" in viewport_meta,
-               f"content: {viewport_meta}")
-        report("width=device-width set",
-               "device-width" in viewport_meta,
-               f"content: {viewport_meta}")
 
-        # ══════════════════════════════════════════════
-        # Section 2: Safe Area CSS
-        # ══════════════════════════════════════════════
-        section("Safe Area CSS Properties")
+def load_memo(build_hash):
+    try:
+        with open(os.path.join(MEMO_DIR, f"{build_hash}.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-        # Check that env(safe-area-inset-*) is used in critical areas
-        # We check the computed padding values — env() resolves to 0 in non-notched contexts
-        top_bar_padding_top = page.evaluate("""
-            getComputedStyle(document.getElementById('top-bar')).paddingTop
-        """)
-        report("top-bar has padding-top (safe-area aware)",
-               top_bar_padding_top and top_bar_padding_top != "0px",
-               f"padding-top: {top_bar_padding_top}")
 
-        bottom_bar_padding_bottom = page.evaluate("""
-            getComputedStyle(document.getElementById('bottom-bar')).paddingBottom
-        """)
-        report("bottom-bar has padding-bottom (safe-area aware)",
-               bottom_bar_padding_bottom and bottom_bar_padding_bottom != "0px",
-               f"padding-bottom: {bottom_bar_padding_bottom}")
+def save_memo(build_hash, memo):
+    os.makedirs(MEMO_DIR, exist_ok=True)
+    with open(os.path.join(MEMO_DIR, f"{build_hash}.json"), "w") as f:
+        json.dump(memo, f)
 
-        # Check that safe-area env() appears in the stylesheet
-        has_safe_area_top = page.evaluate("""
-            (() => {
-                for (const sheet of document.styleSheets) {
-                    try {
-                        for (const rule of sheet.cssRules) {
-                            if (rule.cssText && rule.cssText.includes('safe-area-inset'))
-                                return true;
-                        }
-                    } catch(e) {}
-                }
-                return false;
-            })()
-        """)
-        report("CSS uses env(safe-area-inset-*)", has_safe_area_top)
 
-        # ══════════════════════════════════════════════
-        # Section 3: Touch Target Sizing
-        # ══════════════════════════════════════════════
-        section("Touch Target Sizing (min 44x44)")
+class SectionLog:
+    """Buffered results for one section.
 
-        # All buttons should be at least 44px in height for mobile touch
-        buttons_too_small = page.evaluate("""
-            (() => {
-                const buttons = document.querySelectorAll('button');
-                const small = [];
-                for (const btn of buttons) {
-                    if (btn.offsetParent === null) continue;
-                    const rect = btn.getBoundingClientRect();
-                    if (rect.height < 44 || rect.width < 44) {
-                        small.push({
-                            id: btn.id || btn.className,
-                            w: Math.round(rect.width),
-                            h: Math.round(rect.height)
-                        });
-                    }
-                }
-                return small;
-            })()
-        """)
-        report("all visible buttons >= 44px touch target",
-               len(buttons_too_small) == 0,
-               f"too small: {buttons_too_small}" if buttons_too_small else "all OK")
+    Sections run concurrently in separate browser contexts, so results are
+    collected here and replayed in section order once everything finishes.
+    """
 
-        # Token input should be at least 44px
-        input_height = page.evaluate("""
-            document.getElementById('token-input').getBoundingClientRect().height
-        """)
-        report("token input >= 44px height",
-               input_height >= 44,
-               f"height: {input_height}px")
+    def __init__(self, order, title):
+        self.order = order
+        self.title = title
+        self.results = []
 
-        # ══════════════════════════════════════════════
-        # Section 4: Container Width
-        # ══════════════════════════════════════════════
-        section("Container Fits Mobile Width")
+    def report(self, name, ok, detail=""):
+        self.results.append((name, ok, detail))
 
-        container_width = page.evaluate("""
-            document.querySelector('.container').getBoundingClientRect().width
-        """)
-        report("container <= viewport width",
-               container_width <= IPHONE_VIEWPORT["width"],
-               f"container: {container_width}px, viewport: {IPHONE_VIEWPORT['width']}px")
+    def passed(self):
+        return bool(self.results) and all(ok for _, ok, _ in self.results)
 
-        # Check no horizontal scrollbar
-        has_h_scroll = page.evaluate("""
-            document.documentElement.scrollWidth > document.documentElement.clientWidth
-        """)
-        report("no horizontal scroll overflow", not has_h_scroll)
+    def replay(self, stats):
+        stats.section(self.title)
+        for name, ok, detail in self.results:
+            stats.report(name, ok, detail)
+
+
+async def new_mobile_context(browser):
+    context = await browser.new_context(
+        viewport=IPHONE_VIEWPORT,
+        user_agent=SAFARI_UA,
+        has_touch=True,
+        is_mobile=True,
+        device_scale_factor=3,  # iPhone 14 = 3x
+    )
+    await context.add_init_script(script=MEASURE_HELPERS_JS)
+    await context.add_init_script(path=FIXTURES_JS)
+    return context
+
+
+async def open_page(context, base_url, log):
+    """Load the app in a fresh page; reports and returns None on failure."""
+    page = await context.new_page()
+    try:
+        await page.goto(base_url, timeout=10000)
+    except Exception as e:
+        log.report("page loads at mobile viewport", False, str(e))
+        return None
+    return page
+
+
+async def settle(wait):
+    """Await a Playwright wait condition (timeout WAIT_MS).
+
+    Returns False on timeout instead of raising, so the checks that follow
+    report the failure rather than aborting the whole section.
+    """
+    try:
+        await wait
+    except Exception:
+        return False
+    return True
+
+
+async def run_isolated(browser, base_url, order, title, fn):
+    """Run one independent section in its own browser context."""
+    log = SectionLog(order, title)
+    context = await new_mobile_context(browser)
+    try:
+        page = await open_page(context, base_url, log)
+        if page is not None:
+            await fn(page, log)
+    finally:
+        await context.close()
+    return [log]
+
+
+# ── Independent sections (connect screen only) ───────────────
+
+async def section_viewport(page, log):
+    # ══════════════════════════════════════════════
+    # Section 1: Viewport & Meta Tags
+    # ══════════════════════════════════════════════
+    log.report("page loads at mobile viewport", True)
+
+    # Check viewport meta tag
+    viewport_meta = await page.evaluate("""
+        (() => {
+            const meta = document.querySelector('meta[name="viewport"]');
+            return meta ? meta.getAttribute('content') : '';
+        })()
+    """)
+    found = set(_VIEWPORT_PROBES.findall(viewport_meta))
+    log.report("viewport meta tag exists", bool(viewport_meta), f"content: {viewport_meta}")
+    log.report("user-scalable=no set",
+               "user-scalable=no" in found,
+               f"content: {viewport_meta}")
+    log.report("width=device-width set",
+               "device-width" in found,
+               f"content: {viewport_meta}")
+
+
+async def section_safe_area(page, log):
+    # ══════════════════════════════════════════════
+    # Section 2: Safe Area CSS
+    # ══════════════════════════════════════════════
+
+    # One round-trip for all measurements in this section.
+    # We check the computed padding values — env() resolves to 0 in non-notched contexts
+    m = await page.evaluate("""
+        ({
+            topBarPaddingTop: __mm.style('top-bar').paddingTop,
+            bottomBarPaddingBottom: __mm.style('bottom-bar').paddingBottom,
+        })
+    """)
+    log.report("top-bar has padding-top (safe-area aware)",
+               m["topBarPaddingTop"] and m["topBarPaddingTop"] != "0px",
+               f"padding-top: {m['topBarPaddingTop']}")
+    log.report("bottom-bar has padding-bottom (safe-area aware)",
+               m["bottomBarPaddingBottom"] and m["bottomBarPaddingBottom"] != "0px",
+               f"padding-bottom: {m['bottomBarPaddingBottom']}")
+    # Check that safe-area env() appears in the stylesheet
+    log.report("CSS uses env(safe-area-inset-*)", "safe-area-inset" in css_found)
+
+
+async def section_touch_targets(page, log):
+    # ══════════════════════════════════════════════
+    # Section 3: Touch Target Sizing
+    # ══════════════════════════════════════════════
+
+    # All buttons (and the token input) should be at least 44px for mobile touch
+    m = await page.evaluate("""
+        (() => {
+            const small = [];
+            for (const btn of document.querySelectorAll('button')) {
+                if (btn.offsetParent === null) continue;
+                const rect = btn.getBoundingClientRect();
+                if (rect.height < 44 || rect.width < 44) {
+                    small.push({
+                        id: btn.id || btn.className,
+                        w: Math.round(rect.width),
+                        h: Math.round(rect.height)
+                    });
+                }
+            }
+            return {
+                smallButtons: small,
+                inputHeight: __mm.rect('token-input').height,
+            };
+        })()
+    """)
+    buttons_too_small = m["smallButtons"]
+    log.report("all visible buttons >= 44px touch target",
+               len(buttons_too_small) == 0,
+               f"too small: {buttons_too_small}" if buttons_too_small else "all OK")
+    log.report("token input >= 44px height",
+               m["inputHeight"] >= 44,
+               f"height: {m['inputHeight']}px")
+
+
+async def section_container(page, log):
+    # ══════════════════════════════════════════════
+    # Section 4: Container Width
+    # ══════════════════════════════════════════════
+
+    m = await page.evaluate("""
+        ({
+            containerWidth: __mm.qsRect('.container').width,
+            hasHScroll: document.documentElement.scrollWidth > document.documentElement.clientWidth,
+        })
+    """)
+    log.report("container <= viewport width",
+               m["containerWidth"] <= IPHONE_VIEWPORT["width"],
+               f"container: {m['containerWidth']}px, viewport: {IPHONE_VIEWPORT['width']}px")
+    # Check no horizontal scrollbar
+    log.report("no horizontal scroll overflow", not m["hasHScroll"])
+
+
+async def section_safari_audio(page, log):
+    # ══════════════════════════════════════════════
+    # Section 10: Safari Audio Workarounds
+    # ══════════════════════════════════════════════
+
+    m = await page.evaluate("""
+        (() => {
+            // AudioContext / webkitAudioContext availability
+            const hasWebkitAudio = typeof window.AudioContext !== 'undefined' ||
+                                   typeof window.webkitAudioContext !== 'undefined';
+            // The fallback pattern works at runtime
+            let hasFallback = false;
+            try {
+                const ctx = new (window.AudioContext || window.webkitAudioContext)();
+                ctx.close();
+                hasFallback = true;
+            } catch(e) {}
+            // playsInline property is supported
+            const audio = document.createElement('audio');
+            audio.playsInline = true;
+            return {
+                hasWebkitAudio,
+                hasFallback,
+                hasPlaysInline: audio.playsInline === true,
+            };
+        })()
+    """)
+    log.report("AudioContext or webkitAudioContext available", m["hasWebkitAudio"])
+    log.report("AudioContext fallback pattern works", m["hasFallback"])
+    log.report("playsInline property supported", m["hasPlaysInline"])
+
+
+async def section_dvh(page, log):
+    # ══════════════════════════════════════════════
+    # Section 12: dvh Units & Full Height
+    # ══════════════════════════════════════════════
+
+    # Check CSS uses 100dvh (Safari mobile toolbar aware)
+    log.report("CSS uses 100dvh for Safari mobile", "100dvh" in css_found)
+    log.report("CSS source includes -webkit-overflow-scrolling:touch",
+               {"-webkit-overflow-scrolling", "touch"} <= css_found)
+
+
+ISOLATED_SECTIONS = [
+    (1, "Viewport & Meta Tags", section_viewport),
+    (2, "Safe Area CSS Properties", section_safe_area),
+    (3, "Touch Target Sizing (min 44x44)", section_touch_targets),
+    (4, "Container Fits Mobile Width", section_container),
+    (10, "Safari Audio Workarounds", section_safari_audio),
+    (12, "Dynamic Viewport Height (dvh)", section_dvh),
+]
+
+
+# ── Connected sections (share one WebSocket session) ─────────
+
+async def sections_connected(browser, base_url, auth_token):
+    """Sections 5-9, 11 and 13 need the connected agent screen, so they run
+    in order on a single page."""
+    logs = []
+    context = await new_mobile_context(browser)
+    try:
+        log = SectionLog(5, "WebSocket Connect (mobile)")
+        logs.append(log)
+        page = await open_page(context, base_url, log)
+        if page is None:
+            return logs
+
+        # Elements measured across several sections; evaluating through a
+        # locator passes the element straight in (no lookup in the script)
+        debug_panels = page.locator("#debug-panels")
+        talk_btn = page.locator("#talk-btn")
+        provider_select = page.locator("#provider-select")
 
         # ══════════════════════════════════════════════
         # Section 5: WebSocket Connect & Force Agent Screen
         # ══════════════════════════════════════════════
-        section("WebSocket Connect (mobile)")
-        page.locator("#token-input").fill(auth_token)
-        page.locator("#connect-btn").click()
+        await page.locator("#token-input").fill(auth_token)
+        await page.locator("#connect-btn").click()
 
         try:
-            page.wait_for_function(
+            await page.wait_for_function(
                 "document.getElementById('provider-select').options.length > 0",
                 timeout=10000,
             )
-            report("model select populated on mobile", True)
+            log.report("model select populated on mobile", True)
         except Exception as e:
-            report("model select populated on mobile", False, str(e))
-            browser.close()
-            _print_summary()
-            return
+            log.report("model select populated on mobile", False, str(e))
+            return logs
 
         # Force-show agent screen (WebRTC won't work headless)
-        page.evaluate("""
+        await page.evaluate("""
             document.getElementById('connect-screen').classList.add('hidden');
             document.getElementById('agent-screen').classList.remove('hidden');
         """)
-        page.wait_for_timeout(300)
+        await settle(page.locator("#agent-screen").wait_for(state="visible", timeout=WAIT_MS))
 
         # ══════════════════════════════════════════════
         # Section 6: Debug Panels — Slide-Over on Mobile
         # ══════════════════════════════════════════════
-        section("Debug Panels (mobile slide-over)")
+        log = SectionLog(6, "Debug Panels (mobile slide-over)")
+        logs.append(log)
 
         # At 390px wide, debug panels should use position:fixed overlay, not side-by-side
-        page.locator("#debug-toggle").click()
-        page.wait_for_timeout(300)
-
-        debug_visible = page.evaluate(
-            "document.getElementById('debug-panels').classList.contains('visible')")
-        report("debug panels show on mobile", debug_visible)
-
-        debug_position = page.evaluate("""
-            getComputedStyle(document.getElementById('debug-panels')).position
+        await page.locator("#debug-toggle").click()
+        await settle(page.wait_for_function("""
+            (() => {
+                const panels = document.getElementById('debug-panels');
+                return panels.classList.contains('visible') &&
+                       panels.getBoundingClientRect().width > 0;
+            })()
+        """, timeout=WAIT_MS))
+
+        m = await debug_panels.evaluate("""
+            panels => {
+                const style = getComputedStyle(panels);
+                const backdrop = document.getElementById('debug-backdrop');
+                return {
+                    visible: panels.classList.contains('visible'),
+                    position: style.position,
+                    width: panels.getBoundingClientRect().width,
+                    flexDirection: style.flexDirection,
+                    backdropExists: backdrop !== null,
+                    backdropVisible: backdrop !== null && backdrop.classList.contains('visible'),
+                };
+            }
         """)
-        report("debug panels are position:fixed (slide-over)",
-               debug_position == "fixed",
-               f"position: {debug_position}")
+        log.report("debug panels show on mobile", m["visible"])
+        log.report("debug panels are position:fixed (slide-over)",
+                   m["position"] == "fixed",
+                   f"position: {m['position']}")
 
-        debug_width = page.evaluate("""
-            document.getElementById('debug-panels').getBoundingClientRect().width
-        """)
         max_panel_width = IPHONE_VIEWPORT["width"] * 0.85
-        report(f"debug panel width ~85vw (max {max_panel_width}px)",
-               debug_width <= max_panel_width + 2,  # small tolerance
-               f"width: {debug_width}px")
+        log.report(f"debug panel width ~85vw (max {max_panel_width}px)",
+                   m["width"] <= max_panel_width + 2,  # small tolerance
+                   f"width: {m['width']}px")
 
         # Panels should be stacked vertically on mobile (flex-direction: column)
-        panel_flex_dir = page.evaluate("""
-            getComputedStyle(document.getElementById('debug-panels')).flexDirection
-        """)
-        report("debug panels stacked vertically on mobile",
-               panel_flex_dir == "column",
-               f"flex-direction: {panel_flex_dir}")
+        log.report("debug panels stacked vertically on mobile",
+                   m["flexDirection"] == "column",
+                   f"flex-direction: {m['flexDirection']}")
 
         # Close debug panels via backdrop click (tests the mobile dismiss mechanism)
-        backdrop = page.locator("#debug-backdrop")
-        backdrop_exists = backdrop.count() > 0
-        report("debug backdrop element exists", backdrop_exists)
+        backdrop_exists = m["backdropExists"]
+        log.report("debug backdrop element exists", backdrop_exists)
         if backdrop_exists:
-            backdrop_visible = page.evaluate(
-                "document.getElementById('debug-backdrop').classList.contains('visible')")
-            report("backdrop visible when panels open", backdrop_visible)
+            log.report("backdrop visible when panels open", m["backdropVisible"])
             # Click the exposed right margin (panels are 85vw, backdrop is full screen)
-            # At 390px viewport, panels are ~332px wide, so x=370 is in the exposed area
-            page.mouse.click(370, 400)
-            page.wait_for_timeout(300)
-            panels_closed = not page.evaluate(
-                "document.getElementById('debug-panels').classList.contains('visible')")
-            report("backdrop click closes panels", panels_closed)
+            # At 390px viewport, panels are ~332px wide, so x=370 is in the exposed area.
+            # A real click (not dispatch_event) keeps hit-testing the backdrop; the
+            # wait resolving is itself the pass condition.
+            await page.mouse.click(370, 400)
+            panels_closed = await settle(page.wait_for_function(
+                "!document.getElementById('debug-panels').classList.contains('visible')",
+                timeout=WAIT_MS))
+            log.report("backdrop click closes panels", panels_closed)
         else:
             # Fallback: close via JS
-            page.evaluate("""
+            await page.evaluate("""
                 document.getElementById('debug-panels').classList.remove('visible');
             """)
-            page.wait_for_timeout(200)
 
         # ══════════════════════════════════════════════
-        # Section 7: Narration Bubble on Mobile
+        # Sections 7-9: Narration, Workflow Card, Chat Bubbles
         # ══════════════════════════════════════════════
-        section("Narration Bubble (mobile width)")
-
-        page.evaluate("""
+        # None of these measurements affect the next fixture, so render them
+        # all in one evaluate, wait once, and measure in one more.
+        await page.evaluate("""
+            ([narration, user, agent]) => {
+                const f = __testFixtures;
+                f.renderNarration(narration);
+                f.renderWorkflowGraph();
+                f.renderWorkflowCard();
+                f.renderChatBubbles(user, agent);
+            }
+        """, [
+            "Searching for the top performing S&P 500 companies by market cap...",
+            "What are the top 5 companies in the S&P 500 by market cap?",
+            "Here are the top 5 S&P 500 companies by market capitalization as of today. "
+            "Apple leads with approximately $3.5 trillion, followed by Microsoft, "
+            "NVIDIA, Amazon, and Alphabet.",
+        ])
+        await settle(page.locator(".msg-agent").last.wait_for(state="visible", timeout=WAIT_MS))
+
+        m = await page.evaluate("""
             (() => {
-                const log = document.getElementById('conversation-log');
-                const el = document.createElement('div');
-                el.className = 'msg-narration';
-                el.textContent = 'Searching for the top performing S&P 500 companies by market cap...';
-                log.appendChild(el);
-            })()
-        """)
-        page.wait_for_timeout(200)
-
-        narr = page.locator(".msg-narration")
-        report("narration bubble renders", narr.count() >= 1)
-        if narr.count() > 0:
-            narr_width = page.evaluate("""
-                document.querySelector('.msg-narration').getBoundingClientRect().width
-            """)
-            conv_width = page.evaluate("""
-                document.getElementById('conversation-log').getBoundingClientRect().width
-            """)
-            report("narration fits within chat area",
-                   narr_width <= conv_width,
-                   f"narration: {narr_width:.0f}px, chat: {conv_width:.0f}px")
-
-        # ══════════════════════════════════════════════
-        # Section 8: Workflow Activity Card on Mobile
-        # ══════════════════════════════════════════════
-        section("Workflow Activity Card (mobile)")
-
-        # Render workflow graph (needed for WorkflowMap/Code)
-        page.evaluate("""
-            (() => {
-                const mockDef = {
-                    workflow_id: "research_compare",
-                    name: "Research & Compare",
-                    states: [
-                        { id: "initial_lookup", name: "Initial lookup", type: "llm",
-                          has_tool: true, tool_name: "web_search", next_step: "decompose",
-                          narration: "Searching...", prompt_template: "" },
-                        { id: "decompose", name: "Decomposing", type: "llm",
-                          has_tool: false, tool_name: "", next_step: "search_each",
-                          narration: "Breaking down...", prompt_template: "" },
-                        { id: "search_each", name: "Searching each", type: "loop",
-                          has_tool: true, tool_name: "web_search", next_step: "synthesize",
-                          narration: "Looking up...", prompt_template: "" },
-                        { id: "synthesize", name: "Synthesizing", type: "llm",
-                          has_tool: false, tool_name: "", next_step: "",
-                          narration: "Putting together...", prompt_template: "" }
-                    ]
+                const narr = document.querySelector('.msg-narration');
+                const card = document.querySelector('.workflow-card');
+                const debug = document.querySelector('.wfc-debug');
+                return {
+                    narrCount: document.querySelectorAll('.msg-narration').length,
+                    narrWidth: narr ? narr.getBoundingClientRect().width : 0,
+                    cardCount: document.querySelectorAll('.workflow-card').length,
+                    cardWidth: card ? card.getBoundingClientRect().width : 0,
+                    debugOverflowCss: debug ? getComputedStyle(debug).textOverflow : '',
+                    userWidth: __mm.qsRect('.msg-user').width,
+                    agentWidth: __mm.qsRect('.msg-agent').width,
+                    convWidth: __mm.rect('conversation-log').width,
                 };
-                const mapEl = document.getElementById('workflow-map');
-                window.WorkflowMap.render(mapEl, mockDef);
-                const codeEl = document.getElementById('workflow-code');
-                window.WorkflowCode.render(codeEl, mockDef);
-            })()
-        """)
-        page.wait_for_timeout(200)
-
-        # Build workflow card using safe DOM methods
-        page.evaluate("""
-            (() => {
-                const log = document.getElementById('conversation-log');
-                const card = document.createElement('div');
-                card.className = 'workflow-card';
-
-                const header = document.createElement('div');
-                header.className = 'wfc-header';
-                header.textContent = 'RESEARCH & COMPARE';
-                card.appendChild(header);
-
-                const progress = document.createElement('div');
-                progress.className = 'wfc-progress';
-                for (let i = 0; i < 4; i++) {
-                    const seg = document.createElement('div');
-                    seg.className = 'wfc-segment' + (i === 0 ? ' active' : '');
-                    progress.appendChild(seg);
-                }
-                card.appendChild(progress);
-
-                const stepLabel = document.createElement('div');
-                stepLabel.className = 'wfc-step-label';
-                stepLabel.textContent = 'Step 1 of 4 \\u2014 INITIAL LOOKUP';
-                card.appendChild(stepLabel);
-
-                const activity = document.createElement('div');
-                activity.className = 'wfc-activity';
-                activity.textContent = 'Searching for top S&P 500 companies...';
-                card.appendChild(activity);
-
-                const timerRow = document.createElement('div');
-                timerRow.className = 'wfc-timer-row';
-                const timerTrack = document.createElement('div');
-                timerTrack.className = 'wfc-timer-track';
-                const timerFill = document.createElement('div');
-                timerFill.className = 'wfc-timer-fill';
-                timerFill.style.width = '30%';
-                timerTrack.appendChild(timerFill);
-                const timerText = document.createElement('div');
-                timerText.className = 'wfc-timer-text';
-                timerText.textContent = '3s / 10s';
-                timerRow.appendChild(timerTrack);
-                timerRow.appendChild(timerText);
-                card.appendChild(timerRow);
-
-                const debugRow = document.createElement('div');
-                debugRow.className = 'wfc-debug';
-                debugRow.textContent = 'initial_lookup \\u2014 ollama:qwen3:8b | 42 tok @ 31.5 tok/s';
-                card.appendChild(debugRow);
-
-                log.appendChild(card);
             })()
         """)
-        page.wait_for_timeout(200)
-
-        wf_card = page.locator(".workflow-card")
-        report("workflow card renders", wf_card.count() >= 1)
-        if wf_card.count() > 0:
-            card_width = page.evaluate("""
-                document.querySelector('.workflow-card').getBoundingClientRect().width
-            """)
-            conv_width = page.evaluate("""
-                document.getElementById('conversation-log').getBoundingClientRect().width
-            """)
-            report("workflow card fits within chat area",
-                   card_width <= conv_width,
-                   f"card: {card_width:.0f}px, chat: {conv_width:.0f}px")
+        conv_width = m["convWidth"]
+
+        log = SectionLog(7, "Narration Bubble (mobile width)")
+        logs.append(log)
+        log.report("narration bubble renders", m["narrCount"] >= 1)
+        if m["narrCount"] > 0:
+            narr_width = m["narrWidth"]
+            log.report("narration fits within chat area",
+                       narr_width <= conv_width,
+                       f"narration: {narr_width:.0f}px, chat: {conv_width:.0f}px")
+
+        log = SectionLog(8, "Workflow Activity Card (mobile)")
+        logs.append(log)
+        log.report("workflow card renders", m["cardCount"] >= 1)
+        if m["cardCount"] > 0:
+            card_width = m["cardWidth"]
+            log.report("workflow card fits within chat area",
+                       card_width <= conv_width,
+                       f"card: {card_width:.0f}px, chat: {conv_width:.0f}px")
 
             # Check debug text has text-overflow ellipsis CSS
-            debug_overflow_css = page.evaluate("""
-                getComputedStyle(document.querySelector('.wfc-debug')).textOverflow
-            """)
-            report("debug text has text-overflow:ellipsis",
-                   debug_overflow_css == "ellipsis",
-                   f"text-overflow: {debug_overflow_css}")
-
-        # ══════════════════════════════════════════════
-        # Section 9: Chat Bubbles on Mobile
-        # ══════════════════════════════════════════════
-        section("Chat Bubbles (mobile width)")
-
-        page.evaluate("""
-            (() => {
-                const log = document.getElementById('conversation-log');
-                const user = document.createElement('div');
-                user.className = 'msg msg-user';
-                user.textContent = 'What are the top 5 companies in the S&P 500 by market cap?';
-                log.appendChild(user);
-                const agent = document.createElement('div');
-                agent.className = 'msg msg-agent';
-                agent.textContent = 'Here are the top 5 S&P 500 companies by market capitalization as of today. Apple leads with approximately $3.5 trillion, followed by Microsoft, NVIDIA, Amazon, and Alphabet.';
-                log.appendChild(agent);
-            })()
-        """)
-        page.wait_for_timeout(200)
-
-        user_bubble_width = page.evaluate("""
-            document.querySelector('.msg-user').getBoundingClientRect().width
-        """)
-        conv_width = page.evaluate("""
-            document.getElementById('conversation-log').getBoundingClientRect().width
-        """)
+            debug_overflow_css = m["debugOverflowCss"]
+            log.report("debug text has text-overflow:ellipsis",
+                       debug_overflow_css == "ellipsis",
+                       f"text-overflow: {debug_overflow_css}")
+
+        log = SectionLog(9, "Chat Bubbles (mobile width)")
+        logs.append(log)
+        user_bubble_width = m["userWidth"]
+        agent_bubble_width = m["agentWidth"]
         max_bubble = conv_width * 0.85
-        report("user bubble <= 85% of chat width",
-               user_bubble_width <= max_bubble + 2,
-               f"bubble: {user_bubble_width:.0f}px, max: {max_bubble:.0f}px")
+        log.report("user bubble <= 85% of chat width",
+                   user_bubble_width <= max_bubble + 2,
+                   f"bubble: {user_bubble_width:.0f}px, max: {max_bubble:.0f}px")
 
-        agent_bubble_width = page.evaluate("""
-            document.querySelector('.msg-agent').getBoundingClientRect().width
-        """)
-        report("agent bubble <= 85% of chat width",
-               agent_bubble_width <= max_bubble + 2,
-               f"bubble: {agent_bubble_width:.0f}px, max: {max_bubble:.0f}px")
-
-        # ══════════════════════════════════════════════
-        # Section 10: Safari Audio Workarounds
-        # ══════════════════════════════════════════════
-        section("Safari Audio Workarounds")
-
-        # Check AudioContext / webkitAudioContext availability
-        has_webkit_audio = page.evaluate("""
-            typeof window.AudioContext !== 'undefined' ||
-            typeof window.webkitAudioContext !== 'undefined'
-        """)
-        report("AudioContext or webkitAudioContext available", has_webkit_audio)
-
-        # Check that the fallback pattern works at runtime
-        has_fallback = page.evaluate("""
-            (() => {
-                try {
-                    const ctx = new (window.AudioContext || window.webkitAudioContext)();
-                    ctx.close();
-                    return true;
-                } catch(e) {
-                    return false;
-                }
-            })()
-        """)
-        report("AudioContext fallback pattern works", has_fallback)
-
-        # Check playsInline property is supported
-        has_plays_inline = page.evaluate("""
-            (() => {
-                const audio = document.createElement('audio');
-                audio.playsInline = true;
-                return audio.playsInline === true;
-            })()
-        """)
-        report("playsInline property supported", has_plays_inline)
+        log.report("agent bubble <= 85% of chat width",
+                   agent_bubble_width <= max_bubble + 2,
+                   f"bubble: {agent_bubble_width:.0f}px, max: {max_bubble:.0f}px")
 
         # ══════════════════════════════════════════════
         # Section 11: Hold-to-Talk Touch Events
         # ══════════════════════════════════════════════
-        section("Hold-to-Talk Touch Events")
+        log = SectionLog(11, "Hold-to-Talk Touch Events")
+        logs.append(log)
+
+        m = await talk_btn.evaluate("""
+            btn => {
+                const s = getComputedStyle(btn);
+                return {
+                    touchAction: s.touchAction,
+                    userSelect: s.userSelect || s.webkitUserSelect || '',
+                    height: btn.getBoundingClientRect().height,
+                };
+            }
+        """)
 
         # Verify the talk button has touch-action: none
-        talk_touch_action = page.evaluate("""
-            getComputedStyle(document.getElementById('talk-btn')).touchAction
-        """)
-        report("talk button has touch-action:none",
-               talk_touch_action == "none",
-               f"touch-action: {talk_touch_action}")
+        talk_touch_action = m["touchAction"]
+        log.report("talk button has touch-action:none",
+                   talk_touch_action == "none",
+                   f"touch-action: {talk_touch_action}")
 
         # Verify user-select: none on talk button
-        talk_user_select = page.evaluate("""
-            (() => {
-                const s = getComputedStyle(document.getElementById('talk-btn'));
-                return s.userSelect || s.webkitUserSelect || '';
-            })()
-        """)
-        report("talk button has user-select:none",
-               talk_user_select == "none",
-               f"user-select: {talk_user_select}")
+        talk_user_select = m["userSelect"]
+        log.report("talk button has user-select:none",
+                   talk_user_select == "none",
+                   f"user-select: {talk_user_select}")
 
         # Check talk button height (should be large touch target)
-        talk_height = page.evaluate("""
-            document.getElementById('talk-btn').getBoundingClientRect().height
-        """)
-        report("talk button >= 60px height (large touch target)",
-               talk_height >= 60,
-               f"height: {talk_height}px")
-
-        # ══════════════════════════════════════════════
-        # Section 12: dvh Units & Full Height
-        # ══════════════════════════════════════════════
-        section("Dynamic Viewport Height (dvh)")
-
-        # Check CSS uses 100dvh (Safari mobile toolbar aware)
-        has_dvh = page.evaluate("""
-            (() => {
-                for (const sheet of document.styleSheets) {
-                    try {
-                        for (const rule of sheet.cssRules) {
-                            if (rule.cssText && rule.cssText.includes('100dvh'))
-                                return true;
-                        }
-                    } catch(e) {}
-                }
-                return false;
-            })()
-        """)
-        report("CSS uses 100dvh for Safari mobile", has_dvh)
-
-        # Check -webkit-overflow-scrolling: touch via raw CSS fetch
-        # (Chromium strips Safari-only properties during parsing, so we
-        #  fetch the raw stylesheet text and search it directly)
-        has_webkit_scroll = page.evaluate("""
-            (async () => {
-                try {
-                    const resp = await fetch('/static/styles.css');
-                    const text = await resp.text();
-                    return text.includes('-webkit-overflow-scrolling') &&
-                           text.includes('touch');
-                } catch(e) {
-                    return false;
-                }
-            })()
-        """)
-        report("CSS source includes -webkit-overflow-scrolling:touch", has_webkit_scroll)
+        talk_height = m["height"]
+        log.report("talk button >= 60px height (large touch target)",
+                   talk_height >= 60,
+                   f"height: {talk_height}px")
 
         # ══════════════════════════════════════════════
         # Section 13: Select Dropdowns on Mobile
         # ══════════════════════════════════════════════
-        section("Select Dropdowns (mobile)")
+        log = SectionLog(13, "Select Dropdowns (mobile)")
+        logs.append(log)
+
+        m = await provider_select.evaluate("""
+            select => {
+                const s = getComputedStyle(select);
+                return {
+                    appearance: s.getPropertyValue('-webkit-appearance') ||
+                                s.getPropertyValue('appearance') || '',
+                    selectWidth: select.getBoundingClientRect().width,
+                    topBarWidth: __mm.rect('top-bar').width,
+                };
+            }
+        """)
 
         # -webkit-appearance: none is set
-        provider_appearance = page.evaluate("""
-            (() => {
-                const s = getComputedStyle(document.getElementById('provider-select'));
-                return s.getPropertyValue('-webkit-appearance') ||
-                       s.getPropertyValue('appearance') || '';
-            })()
-        """)
-        report("provider select has -webkit-appearance:none",
-               provider_appearance.strip() == "none",
-               f"appearance: '{provider_appearance.strip()}'")
+        provider_appearance = m["appearance"]
+        log.report("provider select has -webkit-appearance:none",
+                   provider_appearance.strip() == "none",
+                   f"appearance: '{provider_appearance.strip()}'")
 
         # Check selects are full width
-        select_width = page.evaluate("""
-            document.getElementById('provider-select').getBoundingClientRect().width
-        """)
-        top_bar_width = page.evaluate("""
-            document.getElementById('top-bar').getBoundingClientRect().width
-        """)
-        report("provider select is near full width",
-               select_width >= top_bar_width * 0.8,
-               f"select: {select_width:.0f}px, bar: {top_bar_width:.0f}px")
+        select_width = m["selectWidth"]
+        top_bar_width = m["topBarWidth"]
+        log.report("provider select is near full width",
+                   select_width >= top_bar_width * 0.8,
+                   f"select: {select_width:.0f}px, bar: {top_bar_width:.0f}px")
+
+    finally:
+        await context.close()
+    return logs
+
+
+async def launch_engine(p, engine):
+    """Launch one engine; Chromium attaches to a shared instance when
+    PW_CDP_URL is set (tests/_browser_daemon.py)."""
+    cdp_url = os.getenv("PW_CDP_URL", "")
+    if engine == "chromium" and cdp_url:
+        return await p.chromium.connect_over_cdp(cdp_url)
+    return await getattr(p, engine).launch(headless=True)
+
+
+async def run_engine(browser, engine, base_url, auth_token, page_html):
+    """Run every section against one browser engine; returns its SectionLogs."""
+    use_memo = USE_MEMO and css_text and page_html
+    digest = hashlib.sha256(
+        "\0".join([css_text, page_html, engine, browser.version]).encode()
+    )
+    for path in MEMO_SOURCES:
+        with open(path, "rb") as f:
+            digest.update(b"\0" + f.read())
+    build_hash = digest.hexdigest()
+    memo = load_memo(build_hash) if use_memo else {}
+
+    # Section units in order; the connected group sits where section 5 would
+    units = sorted(ISOLATED_SECTIONS + [(5, "connected", None)], key=lambda u: u[0])
+    units = [u for pos, u in enumerate(units) if in_shard(pos)]
+
+    cached, to_run = [], []
+    for order, title, fn in units:
+        if fn is None:
+            continue
+        if str(order) in memo:
+            log = SectionLog(order, f"{title} (cached)")
+            log.results = [tuple(r) for r in memo[str(order)]]
+            cached.append(log)
+        else:
+            to_run.append((order, title, fn))
+
+    run_connected = any(fn is None for _, _, fn in units)
+    groups = await asyncio.gather(
+        *([sections_connected(browser, base_url, auth_token)] if run_connected else []),
+        *[
+            run_isolated(browser, base_url, order, title, fn)
+            for order, title, fn in to_run
+        ],
+    )
+
+    logs = [log for group in groups for log in group]
+    if use_memo:
+        fresh = {
+            str(log.order): log.results
+            for log in logs
+            if log.order in MEMO_SECTIONS and log.passed()
+        }
+        if fresh:
+            save_memo(build_hash, {**memo, **fresh})
+
+    logs = sorted(logs + cached, key=lambda s: s.order)
+    for log in logs:
+        log.title = f"{log.title} [{engine}]"
+    return logs
+
+
+async def run_all(base_url, auth_token):
+    from playwright.async_api import async_playwright
+
+    global css_text, css_found
+    css_text, page_html = await asyncio.gather(
+        asyncio.to_thread(fetch_text, f"{base_url}/static/styles.css"),
+        asyncio.to_thread(fetch_text, f"{base_url}/"),
+    )
+    css_found = frozenset(_CSS_PROBES.findall(css_text))
+
+    async with async_playwright() as p:
+        launched = await asyncio.gather(
+            *[launch_engine(p, engine) for engine in ENGINES],
+            return_exceptions=True,
+        )
+        browsers = []
+        for engine, browser in zip(ENGINES, launched):
+            if isinstance(browser, Exception):
+                stats.section(f"Engine: {engine}")
+                stats.skip(f"{engine} launch", f"{browser}".splitlines()[0])
+            else:
+                browsers.append((engine, browser))
+        try:
+            per_engine = await asyncio.gather(*[
+                run_engine(browser, engine, base_url, auth_token, page_html)
+                for engine, browser in browsers
+            ])
+        finally:
+            for _, browser in browsers:
+                await browser.close()
+
+    for logs in per_engine:
+        for log in logs:
+            log.replay(stats)
+
+    if SHARD != (1, 1):
+        write_junit([log for logs in per_engine for log in logs])
+
+
+def write_junit(logs):
+    """Write this shard's results as JUnit XML for merging across CI runners."""
+    index, total = SHARD
+    root = ET.Element("testsuites", name=f"mobile-ui shard {index}/{total}")
+    for log in logs:
+        suite = ET.SubElement(root, "testsuite", name=log.title,
+                              tests=str(len(log.results)),
+                              failures=str(sum(not ok for _, ok, _ in log.results)))
+        for name, ok, detail in log.results:
+            case = ET.SubElement(suite, "testcase", classname=log.title, name=name)
+            if not ok:
+                ET.SubElement(case, "failure", message=detail or "failed")
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    ET.ElementTree(root).write(os.path.join(REPORT_DIR, f"shard-{index}.xml"),
+                               encoding="utf-8", xml_declaration=True)
 
-        # ══════════════════════════════════════════════
-        # Done
-        # ══════════════════════════════════════════════
-        browser.close()
 
-    _print_summary()
+def main():
+    global SHARD, USE_MEMO
+
+    parser = argparse.ArgumentParser(description="Playwright mobile viewport tests")
+    parser.add_argument("--shard", type=parse_shard,
+                        default=os.getenv("PLAYWRIGHT_SHARD", "1/1"),
+                        help="Run shard I of N (I/N, also PLAYWRIGHT_SHARD)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-run memoized static sections even if the build is unchanged")
+    args = parser.parse_args()
+    SHARD = args.shard
+    USE_MEMO = USE_MEMO and not args.force
 
+    try:
+        import playwright.async_api  # noqa: F401
+    except ImportError:
+        print("playwright not installed. Run: pip3 install playwright && python3 -m playwright install chromium")
+        sys.exit(1)
+
+    auth_token = os.getenv("AUTH_TOKEN", "devtoken")
+    base_url = os.getenv("TEST_URL", "http://localhost:8080")
 
-def _print_summary():
-    total = passed + failed + skipped
     print(f"\n{BOLD}{'=' * 56}")
-    print(f"  Results: {GREEN}{passed} passed{RESET}{BOLD}, ", end="")
-    if failed:
-        print(f"{RED}{failed} failed{RESET}{BOLD}, ", end="")
-    else:
-        print(f"0 failed, ", end="")
-    print(f"{YELLOW}{skipped} skipped{RESET}{BOLD}  ({total} total)")
+    print(f"  Mobile UI — Playwright iPhone Viewport Tests")
+    print(f"  Server: {base_url}")
+    print(f"  Viewport: {IPHONE_VIEWPORT['width']}x{IPHONE_VIEWPORT['height']}")
+    print(f"  Engines: {', '.join(ENGINES)}")
+    if SHARD != (1, 1):
+        print(f"  Shard: {SHARD[0]}/{SHARD[1]}")
     print(f"{'=' * 56}{RESET}")
-    sys.exit(0 if failed == 0 else 1)
+
+    asyncio.run(run_all(base_url, auth_token))
+
+    stats.print_summary()
+    sys.exit(0 if stats.failed == 0 else 1)
 
 
 if __name__ == "__main__":
@@ -14,72 +14,143 @@ Usage:
     python tests/test_suite.py              # Full suite
     python tests/test_suite.py --quick      # Unit tests only (<1s)
     python tests/test_suite.py --verbose    # Verbose output
+    python tests/test_suite.py --jobs 4     # Unit tests across 4 processes
 """
 
 import argparse
 import asyncio
+import atexit
+import contextlib
+import importlib.util
+import io
 import json
+import math
+import multiprocessing
 import os
 import struct
 import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 # ── Path setup ────────────────────────────────────────────────
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, PROJECT_ROOT)
+if PROJECT_ROOT not in sys.path:  # re-imports (pool workers) don't grow it
+    sys.path.insert(0, PROJECT_ROOT)
 
-# ── ANSI colors ──────────────────────────────────────────────
-GREEN = "\033[92m"
-RED = "\033[91m"
-YELLOW = "\033[93m"
-CYAN = "\033[96m"
-BOLD = "\033[1m"
-RESET = "\033[0m"
+# Settings come from the environment only; don't read the developer's .env
+os.environ.setdefault("TESTING", "1")
+
+from tests._report import BOLD, RESET, Reporter
 
 # ── Global counters ──────────────────────────────────────────
-passed = 0
-failed = 0
-skipped = 0
+R = Reporter()
 verbose = False
 
+# WS responses are parsed with orjson when installed, as in gateway/server.py
+from engine.jsonx import loads as _json_loads
+
+# aiohttp is imported once for the server tests (category 4)
+try:
+    from aiohttp.test_utils import TestClient, TestServer
+    from gateway.server import AUTH_TOKEN, create_app
+    HAS_AIOHTTP = True
+    # WS payloads the server tests send, serialized once (sent with send_str)
+    _HELLO_MSG = json.dumps({"type": "hello", "token": AUTH_TOKEN})
+    _BAD_HELLO_MSG = json.dumps({"type": "hello", "token": "wrong-token"})
+    _PING_MSG = json.dumps({"type": "ping"})
+    _AIOHTTP_ERROR = ""
+except ImportError as e:
+    HAS_AIOHTTP = False
+    _AIOHTTP_ERROR = str(e)
+
+# libuv event loop when available, matching gateway/server.py
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# One event loop shared by every run_async() call (closed in _print_summary)
+_LOOP = asyncio.new_event_loop()
+asyncio.set_event_loop(_LOOP)
+
+# Tests running in worker threads (categories 2-3) record their report/skip/
+# section calls here instead, and the main thread replays them in order
+_TLS = threading.local()
+
 SAMPLE_RATE = 48000
 FRAME_SAMPLES = 960
 BYTES_PER_FRAME = FRAME_SAMPLES * 2
 
+# Shared 20ms PCM frames, built once at import
+SILENCE_FRAME = bytes(BYTES_PER_FRAME)
+TONE_FRAME_440 = struct.pack(
+    f"<{FRAME_SAMPLES}h",
+    *(int(16000 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE)) for i in range(FRAME_SAMPLES)),
+)
+
+
+# report/skip/section go to R, except in worker threads (see _TLS)
 
 def report(name: str, ok: bool, detail: str = ""):
     """Record and print a single test result."""
-    global passed, failed
-    if ok:
-        tag = f"{GREEN}PASS{RESET}"
-        passed += 1
-    else:
-        tag = f"{RED}FAIL{RESET}"
-        failed += 1
-    msg = f"  [{tag}] {name}"
-    if detail:
-        msg += f"  ({detail})"
-    print(msg)
+    calls = getattr(_TLS, "calls", None)
+    if calls is not None:
+        calls.append((report, (name, ok, detail)))
+        return
+    R.report(name, ok, detail)
 
 
 def skip(name: str, reason: str = ""):
     """Record and print a skipped test."""
-    global skipped
-    skipped += 1
-    msg = f"  [{YELLOW}SKIP{RESET}] {name}"
-    if reason:
-        msg += f"  ({reason})"
-    print(msg)
+    calls = getattr(_TLS, "calls", None)
+    if calls is not None:
+        calls.append((skip, (name, reason)))
+        return
+    R.skip(name, reason)
 
 
 def section(title: str):
-    """Print a section header."""
-    print(f"\n{CYAN}{BOLD}--- {title} ---{RESET}")
+    """Flush the previous section's results and print a section header."""
+    calls = getattr(_TLS, "calls", None)
+    if calls is not None:
+        calls.append((section, (title,)))
+        return
+    R.section(title)
+
+
+atexit.register(lambda: R.flush())  # don't lose buffered lines if a test crashes
 
 
 def run_async(coro):
-    """Run an async coroutine synchronously."""
-    return asyncio.get_event_loop().run_until_complete(coro)
+    """Run an async coroutine synchronously on the shared loop.
+
+    Worker threads use their own loop (see _run_captured).
+    """
+    loop = getattr(_TLS, "loop", None) or _LOOP
+    return loop.run_until_complete(coro)
+
+
+def _run_captured(test, *args):
+    """Run a test in the current (worker) thread, recording its output.
+
+    Returns (calls, result); pass calls to _replay() on the main thread.
+    """
+    _TLS.calls = calls = []
+    _TLS.loop = loop = asyncio.new_event_loop()
+    try:
+        result = test(*args)
+    finally:
+        loop.close()
+        del _TLS.calls, _TLS.loop
+    return calls, result
+
+
+def _replay(calls):
+    """Re-issue recorded report/skip/section calls on the main thread."""
+    for fn, args in calls:
+        fn(*args)
 
 
 # =====================================================================
@@ -120,6 +191,17 @@ def test_audio_queue():
         q.clear()
         report("clear empties queue", q.available == 0)
 
+        # Grows instead of dropping when a blob wraps past capacity
+        small = AudioQueue(capacity=8)
+        small.enqueue(b"\x01" * 6)
+        small.read(4)
+        small.enqueue(bytes(range(10)))
+        out4 = small.read(12)
+        report("wrap + grow keeps every byte in order",
+               out4 == b"\x01" * 2 + bytes(range(10)), f"got {out4!r}")
+        report("grown ring shrinks back once drained",
+               len(small._buf) == 8, f"capacity {len(small._buf)}")
+
     except Exception as e:
         report("AudioQueue tests", False, str(e))
 
@@ -148,6 +230,14 @@ def test_pcm_ring_buffer():
         readback = buf.read(20)
         report("read zero-pads when short", readback == b"\xAA" * 10 + b"\x00" * 10)
 
+        # Odd lengths: PCM split mid-sample keeps every byte in order
+        written = buf.write(b"\x01\x02\x03")
+        buf.write(b"\x04")
+        report("odd write stores every byte", written == 3 and buf.available == 4,
+               f"wrote {written}, available {buf.available}")
+        readback = buf.read(3) + buf.read(1)
+        report("odd reads are byte-exact", readback == b"\x01\x02\x03\x04", repr(readback))
+
         # Overflow: write more than capacity
         buf2 = PCMRingBuffer(capacity=100)
         buf2.write(b"\xFF" * 150)
@@ -180,6 +270,8 @@ def test_conversation_history():
         report("add_turn creates messages", len(msgs) == 2)
         report("messages have correct structure",
                msgs[0] == {"role": "user", "content": "Hello"})
+        report("shared messages snapshot is immutable",
+               isinstance(msgs, tuple) and ch.get_messages() is msgs)
 
         # MAX_TURNS trimming
         for i in range(MAX_TURNS + 5):
@@ -308,6 +400,22 @@ def test_hedging_detection():
         report("case insensitive detection",
                _reply_is_hedging("MY KNOWLEDGE CUTOFF is April 2024."))
 
+        # Compiled matcher (automaton or regex alternation) agrees with a
+        # plain substring loop
+        from engine.orchestrator import _hedging_matcher, DEFAULT_HEDGING_PHRASES
+        matcher = _hedging_matcher(tuple(DEFAULT_HEDGING_PHRASES))
+        samples = ["i don't have access to that.", "sunny and 75 degrees.",
+                   "that is beyond my capabilities", "as an aide, i can help"]
+        report("compiled matcher matches fallback",
+               all(matcher(s) == any(p in s for p in DEFAULT_HEDGING_PHRASES)
+                   for s in samples))
+
+        # Changing the phrase list via update_config() recompiles the matcher
+        orch.update_config(hedging_phrases=["no idea"])
+        report("update_config recompiles hedging matcher",
+               orch._reply_is_hedging("No idea, sorry.")
+               and not orch._reply_is_hedging("As an AI, I cannot browse the web."))
+
     except Exception as e:
         report("hedging detection tests", False, str(e))
 
@@ -388,6 +496,8 @@ def test_ice_servers_to_rtc():
     section("ice_servers_to_rtc")
     try:
         from gateway.webrtc import ice_servers_to_rtc
+        if importlib.util.find_spec("aiortc") is None:
+            raise ImportError("No module named 'aiortc'")
     except ImportError as e:
         for name in ["converts server with 'urls' key",
                      "converts server with 'url' key", "handles empty list"]:
@@ -549,10 +659,20 @@ def test_clean_html():
 
         report("strips HTML tags",
                _clean_html("<b>bold</b> text") == "bold text")
-        report("strips HTML entities",
-               _clean_html("hello &amp; world &#x27;") == "hello  world")
+        report("decodes HTML entities",
+               _clean_html("AT&amp;T &#x27;hi&#x27; &nbsp;") == "AT&T 'hi'")
+        report("decoded entities are not stripped as tags",
+               _clean_html("&lt;b&gt; tag") == "<b> tag")
         report("handles clean text",
                _clean_html("no html here") == "no html here")
+        report("keeps a stray '<' before a tag",
+               _clean_html("a < b <i>c</i>") == "a < b c")
+
+        from voice_assistant.tools.web_search import SNIPPET_MAX_LEN, _clean_snippet
+        report("snippet is capped at SNIPPET_MAX_LEN",
+               _clean_snippet("<b>word</b> " * 1000) == ("word " * 100)[:SNIPPET_MAX_LEN])
+        report("short snippet is just cleaned",
+               _clean_snippet("<i>short</i> &amp; sweet") == "short & sweet")
 
     except ImportError as e:
         skip("_clean_html (voice_assistant deps missing)", str(e))
@@ -560,6 +680,104 @@ def test_clean_html():
         report("_clean_html tests", False, str(e))
 
 
+def test_web_search_cache():
+    section("Web search result cache (voice_assistant)")
+    try:
+        from voice_assistant.tools import web_search as ws
+
+        ws._result_cache.clear()
+        key = ws._cache_key("  Weather in   NYC ")
+        report("key is case/whitespace normalized", key == "weather in nyc")
+        report("miss on empty cache", ws._cache_get(key) is None)
+        ws._cache_put(key, "sunny")
+        report("hit after put", ws._cache_get(key) == "sunny")
+
+        ws._result_cache[key] = (time.monotonic() - ws.CACHE_TTL_S, "stale")
+        report("expired entry misses and is dropped",
+               ws._cache_get(key) is None and key not in ws._result_cache)
+
+        for i in range(ws.CACHE_MAX + 1):
+            ws._cache_put(f"q{i}", "r")
+        report("evicts oldest beyond CACHE_MAX",
+               len(ws._result_cache) == ws.CACHE_MAX and "q0" not in ws._result_cache)
+        ws._result_cache.clear()
+
+    except ImportError as e:
+        skip("web search cache (voice_assistant deps missing)", str(e))
+    except Exception as e:
+        report("web search cache tests", False, str(e))
+
+
+def test_web_search_hedged():
+    section("Web search provider hedging (voice_assistant)")
+    try:
+        from voice_assistant.tools.web_search import HEDGE_DELAY_S, WebSearchTool
+
+        started = []
+
+        def provider(name, delay, result):
+            async def search(query, header):
+                started.append(name)
+                await asyncio.sleep(delay)
+                return result
+            return search
+
+        tool = WebSearchTool()
+        result = run_async(tool._search_hedged([
+            provider("fast", 0.01, "A"), provider("backup", 0.01, "B")], "q", "header"))
+        report("fast primary answers alone", result == "A" and started == ["fast"])
+
+        started.clear()
+        result = run_async(tool._search_hedged([
+            provider("failing", 0.01, None), provider("backup", 0.01, "B")], "q", "header"))
+        report("failed primary falls through", result == "B" and started == ["failing", "backup"])
+
+        started.clear()
+        t0 = time.monotonic()
+        result = run_async(tool._search_hedged([
+            provider("slow", 5.0, "A"), provider("backup", 0.01, "B")], "q", "header"))
+        elapsed = time.monotonic() - t0
+        report("slow primary is hedged after HEDGE_DELAY_S",
+               result == "B" and elapsed < HEDGE_DELAY_S + 1.0, f"{elapsed:.2f}s")
+
+        result = run_async(tool._search_hedged([
+            provider("a", 0.01, None), provider("b", 0.01, None)], "q", "header"))
+        report("all providers failing returns None", result is None)
+
+    except ImportError as e:
+        skip("web search hedging (voice_assistant deps missing)", str(e))
+    except Exception as e:
+        report("web search hedging tests", False, str(e))
+
+
+def test_web_search_query_guards():
+    section("Web search query guards and provider backoff (voice_assistant)")
+    try:
+        from voice_assistant.tools.web_search import WebSearchTool
+
+        tool = WebSearchTool()
+        report("blank query rejected",
+               run_async(tool.execute(query="   ")).startswith("Error: no search query"))
+        report("one-character query rejected",
+               run_async(tool.execute(query=" a ")).startswith("Error: search query 'a' is too short"))
+
+        from voice_assistant.tools import web_search as ws
+        ws._backoff.clear()
+        ws._provider_failed("serper")
+        ws._provider_failed("serper")
+        report("failed provider backs off, doubling per failure",
+               ws._backing_off("serper") and ws._backoff["serper"][1] == 2
+               and 3.5 < ws._backoff["serper"][0] - time.monotonic() <= 4.0)
+        report("other providers unaffected", not ws._backing_off("brave"))
+        ws._provider_ok("serper")
+        report("success clears backoff", not ws._backing_off("serper") and not ws._backoff)
+
+    except ImportError as e:
+        skip("web search guards (voice_assistant deps missing)", str(e))
+    except Exception as e:
+        report("web search query guard tests", False, str(e))
+
+
 # ── 1.12 QueuedGenerator ────────────────────────────────────
 
 def test_queued_generator():
@@ -579,9 +797,8 @@ def test_queued_generator():
 
         q = AudioQueue()
 
-        # Write 3 frames of constant data
-        test_pcm = b"\x42\x00" * (FRAME_SAMPLES * 3)
-        q.enqueue(test_pcm)
+        # Write 3 frames of tone
+        q.enqueue(TONE_FRAME_440 * 3)
 
         gen = QueuedGenerator(q)
 
@@ -594,15 +811,14 @@ def test_queued_generator():
         report("channels is 1", chunk.channels == 1)
 
         # Verify data integrity
-        expected = b"\x42\x00" * FRAME_SAMPLES
-        report("chunk data matches input", chunk.samples == expected)
+        report("chunk data matches input", chunk.samples == TONE_FRAME_440)
 
         # Read remaining, then exhaust
         gen.next_chunk()
         gen.next_chunk()
         chunk4 = gen.next_chunk()
         report("exhausted buffer returns silence",
-               chunk4.samples == b"\x00" * BYTES_PER_FRAME)
+               chunk4.samples == SILENCE_FRAME)
 
     except Exception as e:
         report("QueuedGenerator tests", False, str(e))
@@ -655,7 +871,7 @@ def test_engine_types():
         v = VoiceInfo(id="test", name="Test Voice", description="A test voice")
         report("VoiceInfo fields", v.id == "test" and v.name == "Test Voice")
 
-        c = AudioChunk(samples=b"\x00" * 1920, sample_rate=48000, channels=1)
+        c = AudioChunk(samples=SILENCE_FRAME, sample_rate=48000, channels=1)
         report("AudioChunk fields",
                len(c.samples) == 1920 and c.sample_rate == 48000 and c.channels == 1)
 
@@ -972,172 +1188,236 @@ def test_search_quota():
 # CATEGORY 4: SERVER TESTS  (aiohttp test client)
 # =====================================================================
 
-def test_server_health():
-    """Server: GET /health returns 200 with status ok."""
-    section("Server /health (server)")
-    try:
-        from aiohttp import web
-        from aiohttp.test_utils import TestClient, TestServer
-
-        from gateway.server import create_app
+# Server coroutines run concurrently, so instead of calling report()
+# they return (name, ok, detail) tuples; ok=None records a skip.
+# Each gets the shared client and a task resolving to (ws, hello_ack) for
+# one WebSocket authenticated up front (see _open_ws_session).
 
-        async def _test():
-            app = create_app()
-            async with TestClient(TestServer(app)) as client:
-                resp = await client.get("/health")
-                report("GET /health status 200", resp.status == 200,
-                       f"got {resp.status}")
-                body = await resp.json()
-                report("health response has status=ok",
-                       body.get("status") == "ok", str(body))
-
-        run_async(_test())
-
-    except ImportError as e:
-        skip("server /health (aiohttp not installed)", str(e))
-    except Exception as e:
-        report("server /health", False, str(e))
-
-
-def test_server_index():
-    """Server: GET / returns 200 with HTML containing 'Voice'."""
-    section("Server index page (server)")
+async def _open_ws_session(client):
+    """Connect to /ws and authenticate; return (ws, hello_ack message)."""
+    ws = await client.ws_connect("/ws")
     try:
-        from aiohttp import web
-        from aiohttp.test_utils import TestClient, TestServer
+        await ws.send_str(_HELLO_MSG)
+        ack = await ws.receive_json(loads=_json_loads, timeout=10.0)
+    except BaseException:
+        await ws.close()
+        raise
+    return ws, ack
 
-        from gateway.server import create_app
 
-        async def _test():
-            app = create_app()
-            async with TestClient(TestServer(app)) as client:
-                resp = await client.get("/")
-                report("GET / status 200", resp.status == 200,
-                       f"got {resp.status}")
-                text = await resp.text()
-                report("index contains 'Voice'", "Voice" in text or "voice" in text,
-                       f"{len(text)} chars")
+async def _server_health(client, session):
+    """Server: GET /health returns 200 with status ok."""
+    resp = await client.get("/health")
+    body = await resp.json()
+    return [
+        ("GET /health status 200", resp.status == 200, f"got {resp.status}"),
+        ("health response has status=ok", body.get("status") == "ok", str(body)),
+    ]
 
-        run_async(_test())
 
-    except ImportError as e:
-        skip("server index (aiohttp not installed)", str(e))
-    except Exception as e:
-        report("server index", False, str(e))
+async def _server_index(client, session):
+    """Server: GET / returns 200 with HTML containing 'Voice'."""
+    resp = await client.get("/")
+    text = await resp.text()
+    return [
+        ("GET / status 200", resp.status == 200, f"got {resp.status}"),
+        ("index contains 'Voice'", "Voice" in text or "voice" in text,
+         f"{len(text)} chars"),
+    ]
 
 
-def test_ws_hello():
+async def _ws_hello(client, session):
     """Server: WebSocket hello with valid token returns hello_ack."""
-    section("WebSocket hello (server)")
-    try:
-        from aiohttp import web
-        from aiohttp.test_utils import TestClient, TestServer
-
-        from gateway.server import create_app, AUTH_TOKEN
-
-        async def _test():
-            app = create_app()
-            async with TestClient(TestServer(app)) as client:
-                ws = await client.ws_connect("/ws")
-                await ws.send_json({"type": "hello", "token": AUTH_TOKEN})
+    _, resp = await session
+    msg_type = resp.get("type")
+    return [
+        ("hello returns hello_ack", msg_type == "hello_ack",
+         f"got type={msg_type}"),
+        ("hello_ack has voices", isinstance(resp.get("voices"), list), ""),
+    ]
 
-                resp = await asyncio.wait_for(ws.receive_json(), timeout=10.0)
-                report("hello returns hello_ack",
-                       resp.get("type") == "hello_ack",
-                       f"got type={resp.get('type')}")
-                report("hello_ack has voices",
-                       isinstance(resp.get("voices"), list))
 
-                await ws.close()
-
-        run_async(_test())
-
-    except ImportError as e:
-        skip("WS hello (aiohttp not installed)", str(e))
-    except Exception as e:
-        report("WS hello", False, str(e))
-
-
-def test_ws_bad_token():
+async def _ws_bad_token(client, session):
     """Server: WebSocket hello with wrong token returns error."""
-    section("WebSocket bad token (server)")
+    ws = await client.ws_connect("/ws")
     try:
-        from aiohttp import web
-        from aiohttp.test_utils import TestClient, TestServer
-
-        from gateway.server import create_app
-
-        async def _test():
-            app = create_app()
-            async with TestClient(TestServer(app)) as client:
-                ws = await client.ws_connect("/ws")
-                await ws.send_json({"type": "hello", "token": "wrong-token"})
-
-                resp = await asyncio.wait_for(ws.receive(), timeout=5.0)
-                # Should get error message then close
-                if resp.type.name == "TEXT":
-                    data = json.loads(resp.data)
-                    report("bad token returns error type",
-                           data.get("type") == "error",
-                           f"got {data.get('type')}")
-                    report("error mentions bad token",
-                           "token" in data.get("message", "").lower()
-                           or "bad" in data.get("message", "").lower(),
-                           data.get("message", ""))
-                else:
-                    # Connection was closed immediately
-                    report("bad token closes connection", True, f"msg type={resp.type.name}")
-                    skip("error message content (connection closed immediately)")
-
-                await ws.close()
-
-        run_async(_test())
-
-    except ImportError as e:
-        skip("WS bad token (aiohttp not installed)", str(e))
-    except Exception as e:
-        report("WS bad token", False, str(e))
+        await ws.send_str(_BAD_HELLO_MSG)
+        resp = await ws.receive(timeout=5.0)
+    finally:
+        await ws.close()
+    # Should get error message then close. Check the raw frame: its keys
+    # ("type", "message") contain neither "token" nor "bad", so no parse needed
+    if resp.type.name == "TEXT":
+        raw = resp.data
+        lowered = raw.lower()
+        return [
+            ("bad token returns error type",
+             '"type":"error"' in raw or '"type": "error"' in raw, raw),
+            ("error mentions bad token",
+             "token" in lowered or "bad" in lowered, raw),
+        ]
+    # Connection was closed immediately
+    return [
+        ("bad token closes connection", True, f"msg type={resp.type.name}"),
+        ("error message content (connection closed immediately)", None, ""),
+    ]
 
 
-def test_ws_ping_pong():
+async def _ws_ping_pong(client, session):
     """Server: WebSocket ping message returns pong."""
-    section("WebSocket ping/pong (server)")
-    try:
-        from aiohttp import web
-        from aiohttp.test_utils import TestClient, TestServer
-
-        from gateway.server import create_app, AUTH_TOKEN
-
-        async def _test():
-            app = create_app()
-            async with TestClient(TestServer(app)) as client:
-                ws = await client.ws_connect("/ws")
-
-                # Authenticate first
-                await ws.send_json({"type": "hello", "token": AUTH_TOKEN})
-                await asyncio.wait_for(ws.receive_json(), timeout=10.0)
-
-                # Send ping
-                await ws.send_json({"type": "ping"})
-                resp = await asyncio.wait_for(ws.receive_json(), timeout=5.0)
-                report("ping returns pong",
-                       resp.get("type") == "pong",
-                       f"got type={resp.get('type')}")
-
-                await ws.close()
+    ws, _ = await session
+    await ws.send_str(_PING_MSG)
+    resp = await ws.receive_json(loads=_json_loads, timeout=5.0)
+    msg_type = resp.get("type")
+    return [
+        ("ping returns pong", msg_type == "pong", f"got type={msg_type}"),
+    ]
+
+
+# (section title, coroutine, name reported if the coroutine raises)
+SERVER_TESTS = (
+    ("Server /health (server)", _server_health, "server /health"),
+    ("Server index page (server)", _server_index, "server index"),
+    ("WebSocket hello (server)", _ws_hello, "WS hello"),
+    ("WebSocket bad token (server)", _ws_bad_token, "WS bad token"),
+    ("WebSocket ping/pong (server)", _ws_ping_pong, "WS ping/pong"),
+)
+
+
+def test_server():
+    """Run every server test concurrently against one shared test client."""
+    if not HAS_AIOHTTP:
+        for title, _, name in SERVER_TESTS:
+            section(title)
+            skip(f"{name} (aiohttp not installed)", _AIOHTTP_ERROR)
+        return
 
-        run_async(_test())
+    async def _run():
+        async with TestClient(TestServer(create_app())) as client:
+            session = asyncio.ensure_future(_open_ws_session(client))
+            try:
+                return await asyncio.gather(
+                    *(test(client, session) for _, test, _ in SERVER_TESTS),
+                    return_exceptions=True)
+            finally:
+                if not session.done():
+                    session.cancel()
+                elif not session.cancelled() and session.exception() is None:
+                    ws, _ = session.result()
+                    await ws.close()
 
-    except ImportError as e:
-        skip("WS ping/pong (aiohttp not installed)", str(e))
+    try:
+        results = run_async(_run())
     except Exception as e:
-        report("WS ping/pong", False, str(e))
+        report("server startup", False, str(e))
+        return
+
+    # Report in declaration order so output doesn't interleave
+    for (title, _, name), result in zip(SERVER_TESTS, results):
+        section(title)
+        if isinstance(result, BaseException):
+            report(name, False, str(result))
+            continue
+        for check, ok, detail in result:
+            if ok is None:
+                skip(check, detail)
+            else:
+                report(check, ok, detail)
 
 
 # =====================================================================
 # MAIN RUNNER
 # =====================================================================
 
+UNIT_TESTS = [
+    test_audio_queue,
+    test_pcm_ring_buffer,
+    test_conversation_history,
+    test_clean_for_speech,
+    test_split_sentences,
+    test_hedging_detection,
+    test_format_results,
+    test_build_tool_result_messages,
+    test_ice_servers_to_rtc,
+    test_orchestrator_helpers,
+    test_orchestrator_config,
+    test_orchestrator_trim_history,
+    test_clean_html,
+    test_web_search_cache,
+    test_web_search_hedged,
+    test_web_search_query_guards,
+    test_queued_generator,
+    test_llm_provider_detection,
+    test_search_configured,
+    test_engine_types,
+    test_adapter_voices,
+    test_workflow_module,
+]
+
+
+def _run_one(test) -> tuple[str, Reporter]:
+    """Run one test in a worker; return its output and its Reporter."""
+    global R
+    R = Reporter()
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        test()
+        R.flush()
+    return out.getvalue(), R
+
+
+def run_unit_tests(jobs: int):
+    """Run UNIT_TESTS, fanned out over `jobs` processes when jobs > 1.
+
+    Output is replayed in list order, so it matches a serial run. Workers
+    come from a forkserver, not fork, so none of them inherits the parent's
+    event loop; each gets its own when it imports this module.
+    """
+    if jobs <= 1:
+        for test in UNIT_TESTS:
+            test()
+        return
+
+    R.flush()
+    ctx = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as ex:
+        for text, worker in ex.map(_run_one, UNIT_TESTS):
+            sys.stdout.write(text)
+            R.merge(worker)
+
+
+async def _run_model_and_service_tests():
+    """Run categories 2 and 3 in threads, at most four at a time.
+
+    The STT tests share one lazily loaded Whisper model and need the TTS
+    output, so they run one after another behind TTS synthesis; everything
+    else overlaps with that chain. Returns the recorded calls per category
+    in serial-run order.
+    """
+    sem = asyncio.Semaphore(4)
+
+    async def run(test, *args):
+        async with sem:
+            return await asyncio.to_thread(_run_captured, test, *args)
+
+    async def model_chain():
+        synth, pcm = await run(test_tts_synthesize)
+        stt, _ = await run(test_stt_transcribe, pcm)
+        empty, _ = await run(test_stt_empty)
+        trip, _ = await run(test_tts_stt_round_trip, pcm)
+        return synth, stt, empty, trip
+
+    (synth, stt, empty, trip), *rest = await asyncio.gather(
+        model_chain(),
+        run(test_voice_listing),
+        run(test_ollama_connectivity),
+        run(test_web_search),
+        run(test_search_quota),
+    )
+    voices, ollama, search, quota = (calls for calls, _ in rest)
+    return [synth, voices, stt, empty, trip], [ollama, search, quota]
+
+
 def main():
     global verbose
 
@@ -1146,15 +1426,11 @@ def main():
                         help="Unit tests only (no models, no network)")
     parser.add_argument("--verbose", action="store_true",
                         help="Verbose output")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="Run unit tests across N worker processes")
     args = parser.parse_args()
     verbose = args.verbose
 
-    # Ensure event loop exists
-    try:
-        asyncio.get_event_loop()
-    except RuntimeError:
-        asyncio.set_event_loop(asyncio.new_event_loop())
-
     start = time.time()
 
     print(f"\n{BOLD}{'=' * 56}")
@@ -1163,53 +1439,30 @@ def main():
     print(f"{'=' * 56}{RESET}")
 
     # ── Category 1: Unit tests (always run) ──────────────────
-    print(f"\n{BOLD}  CATEGORY 1: Unit Tests{RESET}")
-    test_audio_queue()
-    test_pcm_ring_buffer()
-    test_conversation_history()
-    test_clean_for_speech()
-    test_split_sentences()
-    test_hedging_detection()
-    test_format_results()
-    test_build_tool_result_messages()
-    test_ice_servers_to_rtc()
-    test_orchestrator_helpers()
-    test_orchestrator_config()
-    test_orchestrator_trim_history()
-    test_clean_html()
-    test_queued_generator()
-    test_llm_provider_detection()
-    test_search_configured()
-    test_engine_types()
-    test_adapter_voices()
-    test_workflow_module()
+    R.lines.append(f"\n{BOLD}  CATEGORY 1: Unit Tests{RESET}")
+    run_unit_tests(args.jobs)
 
     if args.quick:
         elapsed = time.time() - start
         _print_summary(elapsed, quick=True)
         return
 
+    # ── Categories 2-3 run concurrently, reported in order ──
+    integration, service = run_async(_run_model_and_service_tests())
+
     # ── Category 2: Integration tests (need TTS/STT models) ─
-    print(f"\n{BOLD}  CATEGORY 2: Integration Tests{RESET}")
-    pcm = test_tts_synthesize()
-    test_voice_listing()
-    test_stt_transcribe(pcm)
-    test_stt_empty()
-    test_tts_stt_round_trip(pcm)
+    R.lines.append(f"\n{BOLD}  CATEGORY 2: Integration Tests{RESET}")
+    for calls in integration:
+        _replay(calls)
 
     # ── Category 3: Service tests (need network/Ollama) ──────
-    print(f"\n{BOLD}  CATEGORY 3: Service Tests{RESET}")
-    test_ollama_connectivity()
-    test_web_search()
-    test_search_quota()
+    R.lines.append(f"\n{BOLD}  CATEGORY 3: Service Tests{RESET}")
+    for calls in service:
+        _replay(calls)
 
     # ── Category 4: Server tests (aiohttp test client) ───────
-    print(f"\n{BOLD}  CATEGORY 4: Server Tests{RESET}")
-    test_server_health()
-    test_server_index()
-    test_ws_hello()
-    test_ws_bad_token()
-    test_ws_ping_pong()
+    R.lines.append(f"\n{BOLD}  CATEGORY 4: Server Tests{RESET}")
+    test_server()
 
     elapsed = time.time() - start
     _print_summary(elapsed)
@@ -1217,22 +1470,13 @@ def main():
 
 def _print_summary(elapsed: float, quick: bool = False):
     """Print final summary and exit."""
-    total = passed + failed + skipped
-    print(f"\n{BOLD}{'=' * 56}")
-    print(f"  Results: {GREEN}{passed} passed{RESET}{BOLD}, ", end="")
-    if failed:
-        print(f"{RED}{failed} failed{RESET}{BOLD}, ", end="")
-    else:
-        print(f"0 failed, ", end="")
-    print(f"{YELLOW}{skipped} skipped{RESET}{BOLD}  ({total} total)")
-    print(f"  Time: {elapsed:.1f}s", end="")
+    footer = f"  Time: {elapsed:.1f}s"
     if quick:
-        print(f"  (--quick: skipped categories 2-4)")
-    else:
-        print()
-    print(f"{'=' * 56}{RESET}")
+        footer += "  (--quick: skipped categories 2-4)"
+    R.print_summary(footer)
 
-    sys.exit(0 if failed == 0 else 1)
+    _LOOP.close()
+    sys.exit(0 if R.failed == 0 else 1)
 
 
 if __name__ == "__main__":
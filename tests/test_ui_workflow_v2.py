@@ -12,49 +12,45 @@ Usage:
     python3 tests/test_ui_workflow_v2.py
 """
 
+import atexit
 import sys
 import os
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, PROJECT_ROOT)
+if PROJECT_ROOT not in sys.path:  # re-imports (pool workers) don't grow it
+    sys.path.insert(0, PROJECT_ROOT)
 
-GREEN = "\033[92m"
-RED = "\033[91m"
-YELLOW = "\033[93m"
-CYAN = "\033[96m"
-BOLD = "\033[1m"
-RESET = "\033[0m"
+from tests._report import BOLD, RESET, Reporter
 
-passed = 0
-failed = 0
-skipped = 0
+# DOM fixtures shared with test_mobile_ui.py, installed once per context
+# (add_init_script) so evaluates send a short call instead of the JS itself
+FIXTURES_JS = os.path.join(PROJECT_ROOT, "tests", "fixtures", "test_fixtures.js")
 
+# Results are buffered per section; flush at exit so a crash keeps them
+R = Reporter()
+report = R.report
+skip = R.skip
+section = R.section
+atexit.register(R.flush)
 
-def report(name, ok, detail=""):
-    global passed, failed
-    if ok:
-        tag = f"{GREEN}PASS{RESET}"
-        passed += 1
-    else:
-        tag = f"{RED}FAIL{RESET}"
-        failed += 1
-    msg = f"  [{tag}] {name}"
-    if detail:
-        msg += f"  ({detail})"
-    print(msg)
 
+def settle(page, condition, timeout=2000):
+    """Wait until a JS condition holds instead of sleeping a fixed time.
 
-def skip(name, reason=""):
-    global skipped
-    skipped += 1
-    msg = f"  [{YELLOW}SKIP{RESET}] {name}"
-    if reason:
-        msg += f"  ({reason})"
-    print(msg)
+    A timeout isn't fatal: the report() that follows records the failure.
+    """
+    try:
+        page.wait_for_function(condition, timeout=timeout)
+    except Exception:
+        pass
 
 
-def section(title):
-    print(f"\n{CYAN}{BOLD}--- {title} ---{RESET}")
+def get_browser(p):
+    """Attach to a shared Chromium (tests/_browser_daemon.py) or launch one."""
+    cdp_url = os.getenv("PW_CDP_URL", "")
+    if cdp_url:
+        return p.chromium.connect_over_cdp(cdp_url)
+    return p.chromium.launch(headless=True)
 
 
 def main():
@@ -73,12 +69,22 @@ def main():
     print(f"{'=' * 56}{RESET}")
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+        browser = get_browser(p)
         context = browser.new_context(
             user_agent="Mozilla/5.0 (Playwright Test)",
         )
+        # Local DOM ops resolve in milliseconds; fail fast rather than
+        # waiting out Playwright's 30s default on a broken selector
+        context.set_default_timeout(5000)
+        context.add_init_script(path=FIXTURES_JS)
         page = context.new_page()
 
+        # Elements checked repeatedly; evaluating through a locator passes the
+        # element straight in instead of re-running getElementById in the script
+        debug_panels = page.locator("#debug-panels")
+        provider_select = page.locator("#provider-select")
+        panels_visible = "el => el.classList.contains('visible')"
+
         # ── Test 1: Page loads ──────────────────────────────
         section("Page Load")
         try:
@@ -103,32 +109,40 @@ def main():
 
         # ── Test 3: JS modules loaded ──────────────────────
         section("JS Modules")
-        has_wf_map = page.evaluate("typeof window.WorkflowMap")
-        report("WorkflowMap loaded", has_wf_map == "object", f"type: {has_wf_map}")
-
-        has_wf_code = page.evaluate("typeof window.WorkflowCode")
-        report("WorkflowCode loaded", has_wf_code == "object", f"type: {has_wf_code}")
-
-        map_methods = page.evaluate("Object.keys(window.WorkflowMap).sort().join(',')")
+        mods = page.evaluate("""() => ({
+            map: typeof window.WorkflowMap,
+            code: typeof window.WorkflowCode,
+            mapKeys: Object.keys(window.WorkflowMap || {}).sort().join(','),
+            codeKeys: Object.keys(window.WorkflowCode || {}).sort().join(','),
+        })""")
+        report("WorkflowMap loaded", mods["map"] == "object", f"type: {mods['map']}")
+        report("WorkflowCode loaded", mods["code"] == "object", f"type: {mods['code']}")
+
+        map_methods = mods["mapKeys"]
         report("WorkflowMap API complete",
                all(m in map_methods for m in ["render", "highlight", "updateLoop", "clear"]),
                map_methods)
 
-        code_methods = page.evaluate("Object.keys(window.WorkflowCode).sort().join(',')")
+        code_methods = mods["codeKeys"]
         report("WorkflowCode API complete",
                all(m in code_methods for m in ["render", "highlight", "clear"]),
                code_methods)
 
         # ── Test 4: Debug panels exist but hidden ──────────
         section("Debug Panels Structure")
-        report("debug-panels element exists",
-               page.locator("#debug-panels").count() == 1)
-        report("debug-panels hidden by default",
-               not page.evaluate("document.getElementById('debug-panels').classList.contains('visible')"))
-        report("workflow-map-panel exists",
-               page.locator("#workflow-map-panel").count() == 1)
-        report("workflow-code-panel exists",
-               page.locator("#workflow-code-panel").count() == 1)
+        panels = page.evaluate("""() => {
+            const dp = document.querySelectorAll('#debug-panels');
+            return {
+                count: dp.length,
+                visible: dp.length > 0 && dp[0].classList.contains('visible'),
+                mapPanels: document.querySelectorAll('#workflow-map-panel').length,
+                codePanels: document.querySelectorAll('#workflow-code-panel').length,
+            };
+        }""")
+        report("debug-panels element exists", panels["count"] == 1)
+        report("debug-panels hidden by default", not panels["visible"])
+        report("workflow-map-panel exists", panels["mapPanels"] == 1)
+        report("workflow-code-panel exists", panels["codePanels"] == 1)
 
         # ── Test 5: Connect + model default ────────────────
         section("WebSocket Connect & Default Model")
@@ -153,23 +167,19 @@ def main():
             return
 
         # Check default model
-        selected_value = page.evaluate("document.getElementById('provider-select').value")
+        selected_value = provider_select.input_value()
         report("default model is qwen3:8b",
                selected_value == "ollama:qwen3:8b",
                f"got: {selected_value}")
 
-        selected_text = page.evaluate("""
-            (() => {
-                const sel = document.getElementById('provider-select');
-                return sel.options[sel.selectedIndex]?.textContent || '';
-            })()
-        """)
+        selected_text = provider_select.evaluate(
+            "sel => sel.options[sel.selectedIndex]?.textContent || ''")
         report("selected text contains qwen3",
                "qwen3" in selected_text.lower(),
                f"text: {selected_text}")
 
         # Check voice select was populated too
-        voice_count = page.evaluate("document.getElementById('voice-select').options.length")
+        voice_count = page.locator("#voice-select").evaluate("sel => sel.options.length")
         report("voice select populated", voice_count > 0, f"{voice_count} voices")
 
         # ── Force-show agent screen for remaining tests ────
@@ -177,7 +187,7 @@ def main():
             document.getElementById('connect-screen').classList.add('hidden');
             document.getElementById('agent-screen').classList.remove('hidden');
         """)
-        page.wait_for_timeout(300)
+        settle(page, "() => document.getElementById('debug-toggle')?.getClientRects().length > 0")
 
         # ── Test 6: Debug toggle ───────────────────────────
         section("Debug Toggle")
@@ -185,137 +195,133 @@ def main():
         report("debug toggle visible", debug_toggle.is_visible())
 
         debug_toggle.click()
-        page.wait_for_timeout(300)
+        settle(page, "() => document.getElementById('debug-panels').classList.contains('visible')")
         report("panels show on click",
-               page.evaluate("document.getElementById('debug-panels').classList.contains('visible')"))
+               debug_panels.evaluate(panels_visible))
 
         debug_toggle.click()
-        page.wait_for_timeout(300)
+        settle(page, "() => !document.getElementById('debug-panels').classList.contains('visible')")
         report("panels hide on second click",
-               not page.evaluate("document.getElementById('debug-panels').classList.contains('visible')"))
+               not debug_panels.evaluate(panels_visible))
 
         # ── Test 7: Workflow map renderer (v2 style) ───────
         section("Workflow Map Renderer (v2 nodes)")
 
-        page.evaluate("""
-            (() => {
-                const mockDef = {
-                    workflow_id: "research_compare",
-                    name: "Research & Compare",
-                    description: "Lookup current data, decompose, search each entity, synthesize",
-                    states: [
-                        { id: "initial_lookup", name: "Initial lookup", type: "llm",
-                          has_tool: true, tool_name: "web_search", next_step: "decompose",
-                          narration: "Searching for top S&P 500...", prompt_template: "" },
-                        { id: "decompose", name: "Decomposing query", type: "llm",
-                          has_tool: false, tool_name: "", next_step: "search_each",
-                          narration: "Found results. Breaking into individual searches...",
-                          prompt_template: "" },
-                        { id: "search_each", name: "Searching each", type: "loop",
-                          has_tool: true, tool_name: "web_search", next_step: "synthesize",
-                          narration: "Looking up each company...", prompt_template: "" },
-                        { id: "synthesize", name: "Synthesizing", type: "llm",
-                          has_tool: false, tool_name: "", next_step: "",
-                          narration: "Putting it all together...", prompt_template: "" }
-                    ]
-                };
-                const mapEl = document.getElementById('workflow-map');
-                window.WorkflowMap.render(mapEl, mockDef);
-                const codeEl = document.getElementById('workflow-code');
-                window.WorkflowCode.render(codeEl, mockDef);
-                document.getElementById('debug-panels').classList.add('visible');
-            })()
-        """)
-        page.wait_for_timeout(500)
+        page.evaluate("""() => {
+            __testFixtures.renderWorkflowGraph();
+            document.getElementById('debug-panels').classList.add('visible');
+        }""")
+        settle(page, "() => document.querySelectorAll('.wf-node').length >= 5")
+
+        wf = page.evaluate("""() => {
+            const count = sel => document.querySelectorAll(sel).length;
+            const text = sel => {
+                const el = document.querySelector(sel);
+                return el ? el.textContent : null;
+            };
+            const exits = document.querySelectorAll('.wf-exit');
+            const exitId = exits.length ? exits[0].querySelector('.node-id') : null;
+            return {
+                nodes: count('.wf-node'),
+                firstId: text('.node-id'),
+                firstHint: text('.node-hint'),
+                badges: count('.wf-type-badge'),
+                firstBadge: text('.wf-type-badge'),
+                arrows: count('.wf-arrow'),
+                arrowHead: text('.arrow-head'),
+                connectors: count('.wf-connector'),
+                indicators: count('.wf-indicator'),
+                exits: exits.length,
+                exitId: exitId ? exitId.textContent : null,
+            };
+        }""")
 
         # 4 state nodes + 1 exit = 5
-        node_count = page.locator(".wf-node").count()
+        node_count = wf["nodes"]
         report("5 nodes (4 states + exit)", node_count == 5, f"got {node_count}")
 
         # Uppercase node IDs (v2 feature)
-        first_id = page.locator(".node-id").first.text_content()
+        first_id = wf["firstId"]
         report("node IDs are uppercase",
                first_id == "INITIAL LOOKUP",
                f"got: '{first_id}'")
 
         # Hint text (v2 feature)
-        first_hint = page.locator(".node-hint").first.text_content()
+        first_hint = wf["firstHint"]
         report("node has hint text", first_hint == "Initial lookup",
                f"got: '{first_hint}'")
 
         # Type badges (v2 feature)
-        badges = page.locator(".wf-type-badge")
-        report("type badges rendered", badges.count() >= 4, f"got {badges.count()}")
+        report("type badges rendered", wf["badges"] >= 4, f"got {wf['badges']}")
         report("first badge is 'llm+tool'",
-               badges.first.text_content() == "llm+tool",
-               f"got: '{badges.first.text_content()}'")
+               wf["firstBadge"] == "llm+tool",
+               f"got: '{wf['firstBadge']}'")
 
         # Arrow elements with ▼ (v2 feature — replaces v1 connectors)
-        arrows = page.locator(".wf-arrow")
-        report("arrow elements between nodes", arrows.count() >= 4,
-               f"got {arrows.count()}")
+        report("arrow elements between nodes", wf["arrows"] >= 4,
+               f"got {wf['arrows']}")
 
-        arrow_head = page.locator(".arrow-head").first.text_content()
+        arrow_head = wf["arrowHead"]
         report("arrow heads use ▼ character", arrow_head == "\u25bc",
                f"got: '{arrow_head}'")
 
         # No old v1 connectors
-        old_connectors = page.locator(".wf-connector")
-        report("no old v1 .wf-connector elements", old_connectors.count() == 0,
-               f"got {old_connectors.count()}")
+        report("no old v1 .wf-connector elements", wf["connectors"] == 0,
+               f"got {wf['connectors']}")
 
         # No old v1 indicators
-        old_indicators = page.locator(".wf-indicator")
-        report("no old v1 .wf-indicator elements", old_indicators.count() == 0,
-               f"got {old_indicators.count()}")
+        report("no old v1 .wf-indicator elements", wf["indicators"] == 0,
+               f"got {wf['indicators']}")
 
         # Exit node
-        exit_node = page.locator(".wf-exit")
-        report("exit node exists", exit_node.count() == 1)
-        report("exit node says EXIT",
-               exit_node.locator(".node-id").text_content() == "EXIT")
+        report("exit node exists", wf["exits"] == 1)
+        report("exit node says EXIT", wf["exitId"] == "EXIT")
 
         # ── Test 8: Code view syntax highlighting (v2) ─────
         section("Code View Syntax Highlighting")
 
-        report("code-keyword spans (purple)",
-               page.locator(".code-keyword").count() > 0,
-               f"{page.locator('.code-keyword').count()} spans")
-        report("code-string spans (green)",
-               page.locator(".code-string").count() > 0,
-               f"{page.locator('.code-string').count()} spans")
-        report("code-intent spans (orange)",
-               page.locator(".code-intent").count() > 0,
-               f"{page.locator('.code-intent').count()} spans")
-        report("code-state-ref spans (blue)",
-               page.locator(".code-state-ref").count() > 0,
-               f"{page.locator('.code-state-ref').count()} spans")
-
-        report("4 code blocks", page.locator(".code-block").count() == 4,
-               f"got {page.locator('.code-block').count()}")
+        code = page.evaluate("""() => {
+            const count = sel => document.querySelectorAll(sel).length;
+            return {
+                keyword: count('.code-keyword'),
+                string: count('.code-string'),
+                intent: count('.code-intent'),
+                stateRef: count('.code-state-ref'),
+                blocks: count('.code-block'),
+                say: Array.from(document.querySelectorAll('.code-keyword'))
+                    .filter(s => s.textContent.includes('say:')).length,
+                headers: count('.code-header'),
+                sectionHeaders: count('.code-section-header'),
+            };
+        }""")
+
+        report("code-keyword spans (purple)", code["keyword"] > 0,
+               f"{code['keyword']} spans")
+        report("code-string spans (green)", code["string"] > 0,
+               f"{code['string']} spans")
+        report("code-intent spans (orange)", code["intent"] > 0,
+               f"{code['intent']} spans")
+        report("code-state-ref spans (blue)", code["stateRef"] > 0,
+               f"{code['stateRef']} spans")
+
+        report("4 code blocks", code["blocks"] == 4, f"got {code['blocks']}")
 
         # say: lines for narration
-        say_count = page.evaluate("""
-            Array.from(document.querySelectorAll('.code-keyword'))
-                .filter(s => s.textContent.includes('say:')).length
-        """)
+        say_count = code["say"]
         report("'say:' keyword lines present", say_count >= 4,
                f"got {say_count}")
 
         # No old v1 code elements
-        old_headers = page.locator(".code-header")
-        report("no old v1 .code-header elements", old_headers.count() == 0,
-               f"got {old_headers.count()}")
-        old_sections = page.locator(".code-section-header")
-        report("no old v1 .code-section-header elements", old_sections.count() == 0,
-               f"got {old_sections.count()}")
+        report("no old v1 .code-header elements", code["headers"] == 0,
+               f"got {code['headers']}")
+        report("no old v1 .code-section-header elements", code["sectionHeaders"] == 0,
+               f"got {code['sectionHeaders']}")
 
         # ── Test 9: State highlighting (teal glow) ─────────
         section("State Highlighting (teal glow)")
 
-        page.evaluate("window.WorkflowMap.highlight('initial_lookup', 'active', '')")
-        page.evaluate("window.WorkflowCode.highlight('initial_lookup')")
-        page.wait_for_timeout(200)
+        page.evaluate("__testFixtures.highlightState('initial_lookup')")
+        settle(page, "() => document.querySelector('.wf-node.active') !== null")
 
         report("active node gets .active class",
                page.evaluate("""
@@ -330,12 +336,8 @@ def main():
                """))
 
         # Transition: visited + next active
-        page.evaluate("""
-            window.WorkflowMap.highlight('initial_lookup', 'visited', '');
-            window.WorkflowMap.highlight('decompose', 'active', '');
-            window.WorkflowCode.highlight('decompose');
-        """)
-        page.wait_for_timeout(200)
+        page.evaluate("__testFixtures.highlightState('decompose', 'initial_lookup')")
+        settle(page, "() => document.querySelector('.wf-node.active[data-state-id=\"decompose\"]') !== null")
 
         report("node transitions to visited",
                page.evaluate("""
@@ -355,7 +357,7 @@ def main():
             window.WorkflowMap.updateLoop('search_each',
                 ['Apple market cap', 'NVIDIA market cap', 'Microsoft market cap'], 1)
         """)
-        page.wait_for_timeout(300)
+        settle(page, "() => document.querySelectorAll('.wf-child-node').length === 3")
 
         report("3 loop children rendered",
                page.locator(".wf-child-node").count() == 3,
@@ -369,20 +371,8 @@ def main():
         section("Narration Bubble")
 
         # Inject narration via DOM (showNarrationBubble is module-scoped)
-        page.evaluate("""
-            (() => {
-                const log = document.getElementById('conversation-log');
-                // Remove existing
-                const prev = log.querySelector('.msg-narration');
-                if (prev) prev.remove();
-                // Add narration bubble
-                const el = document.createElement('div');
-                el.className = 'msg-narration';
-                el.textContent = 'Searching for top S&P 500 companies...';
-                log.appendChild(el);
-            })()
-        """)
-        page.wait_for_timeout(200)
+        page.evaluate("__testFixtures.renderNarration('Searching for top S&P 500 companies...')")
+        settle(page, "() => document.querySelector('.msg-narration') !== null")
 
         narr = page.locator(".msg-narration")
         report("narration bubble appears", narr.count() >= 1)
@@ -394,28 +384,21 @@ def main():
         # ── Test 12: CSS teal theme variables ──────────────
         section("CSS Theme Variables")
 
-        teal = page.evaluate(
-            "getComputedStyle(document.documentElement).getPropertyValue('--teal').trim()")
+        theme = page.evaluate("__testFixtures.readThemeVars()")
+
+        teal = theme["teal"]
         report("--teal is #00e5cc", teal == "#00e5cc", f"got: '{teal}'")
 
-        panel_bg = page.evaluate(
-            "getComputedStyle(document.documentElement).getPropertyValue('--panel-bg').trim()")
+        panel_bg = theme["panelBg"]
         report("--panel-bg is #0a0a12", panel_bg == "#0a0a12", f"got: '{panel_bg}'")
 
-        font_code = page.evaluate(
-            "getComputedStyle(document.documentElement).getPropertyValue('--font-code').trim()")
+        font_code = theme["fontCode"]
         report("--font-code starts with 'SF Mono'",
                font_code.startswith("'SF Mono'") or font_code.startswith("SF Mono"),
                f"got: '{font_code[:50]}'")
 
         # Check active node has teal border (computed style)
-        active_border = page.evaluate("""
-            (() => {
-                const node = document.querySelector('.wf-node.active');
-                if (!node) return 'no active node';
-                return getComputedStyle(node).borderColor;
-            })()
-        """)
+        active_border = theme["activeBorder"]
         report("active node has teal border color",
                "0, 229, 204" in active_border or "00e5cc" in active_border.lower(),
                f"border: {active_border}")
@@ -427,16 +410,8 @@ def main():
 
 
 def _print_summary():
-    total = passed + failed + skipped
-    print(f"\n{BOLD}{'=' * 56}")
-    print(f"  Results: {GREEN}{passed} passed{RESET}{BOLD}, ", end="")
-    if failed:
-        print(f"{RED}{failed} failed{RESET}{BOLD}, ", end="")
-    else:
-        print(f"0 failed, ", end="")
-    print(f"{YELLOW}{skipped} skipped{RESET}{BOLD}  ({total} total)")
-    print(f"{'=' * 56}{RESET}")
-    sys.exit(0 if failed == 0 else 1)
+    R.print_summary()
+    sys.exit(0 if R.failed == 0 else 1)
 
 
 if __name__ == "__main__":
@@ -6,8 +6,14 @@ pydantic-settings is not installed (e.g., system Python).
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
+# Test runs and CI configure everything through the environment; skip the
+# .env lookup there (gateway/server.py skips load_dotenv() the same way) so a
+# developer's local file can't leak into results
+_SKIP_ENV_FILE = os.getenv("TESTING") == "1" or os.getenv("CI") == "1"
+
 try:
     from pydantic_settings import BaseSettings
 
@@ -35,21 +41,35 @@ try:
         search_timeout: float = 10.0
 
         model_config = {
-            "env_file": str(Path(__file__).resolve().parent.parent / ".env"),
+            "env_file": (
+                None if _SKIP_ENV_FILE
+                else str(Path(__file__).resolve().parent.parent / ".env")
+            ),
             "extra": "ignore",
+            "frozen": True,
+            # A blank or padded value (e.g. "SERPER_API_KEY= ") must read as
+            # unset, so the search chain skips that provider without a request
+            "str_strip_whitespace": True,
         }
 
 except ImportError:
     # Fallback: read from env vars with same defaults (no .env file loading)
     class Settings:  # type: ignore[no-redef]
+        __slots__ = (
+            "ollama_url", "ollama_model", "ollama_fallback_model",
+            "serper_api_key", "brave_api_key", "tavily_api_key", "rag_url",
+            "max_tool_calls_per_turn", "max_history_messages", "enable_thinking",
+            "ollama_timeout", "search_timeout",
+        )
+
         def __init__(self):
-            self.ollama_url = os.getenv("OLLAMA_URL", "http://localhost:11434")
-            self.ollama_model = os.getenv("OLLAMA_MODEL", "qwen3:8b")
-            self.ollama_fallback_model = os.getenv("OLLAMA_FALLBACK_MODEL", "qwen2.5:14b")
-            self.serper_api_key = os.getenv("SERPER_API_KEY", "")
-            self.brave_api_key = os.getenv("BRAVE_API_KEY", "")
-            self.tavily_api_key = os.getenv("TAVILY_API_KEY", "")
-            self.rag_url = os.getenv("RAG_URL", "http://localhost:8100")
+            self.ollama_url = os.getenv("OLLAMA_URL", "http://localhost:11434").strip()
+            self.ollama_model = os.getenv("OLLAMA_MODEL", "qwen3:8b").strip()
+            self.ollama_fallback_model = os.getenv("OLLAMA_FALLBACK_MODEL", "qwen2.5:14b").strip()
+            self.serper_api_key = os.getenv("SERPER_API_KEY", "").strip()
+            self.brave_api_key = os.getenv("BRAVE_API_KEY", "").strip()
+            self.tavily_api_key = os.getenv("TAVILY_API_KEY", "").strip()
+            self.rag_url = os.getenv("RAG_URL", "http://localhost:8100").strip()
             self.max_tool_calls_per_turn = int(os.getenv("MAX_TOOL_CALLS_PER_TURN", "5"))
             self.max_history_messages = int(os.getenv("MAX_HISTORY_MESSAGES", "20"))
             self.enable_thinking = os.getenv("ENABLE_THINKING", "").lower() in ("1", "true")
@@ -57,4 +77,10 @@ except ImportError:
             self.search_timeout = float(os.getenv("SEARCH_TIMEOUT", "10.0"))
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading env / .env only once."""
+    return Settings()
+
+
+settings = get_settings()
@@ -15,6 +15,7 @@ import argparse
 import asyncio
 import logging
 import sys
+import threading
 
 from rich.console import Console
 from rich.text import Text
@@ -26,9 +27,33 @@ from engine.llm import list_ollama_models, pull_ollama_model
 from .config import settings
 from .tool_router import dispatch_tool_call
 from .tools import get_all_schemas
+from .tools.rag import close_client as close_rag_client
+from .tools.rag import probe_service as probe_rag_service
+from .tools.web_search import close_client as close_search_client
 
 console = Console()
 
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
+# Tool/workflow callbacks enqueue their lines here and _drain_logs prints
+# them, so the workflow loop doesn't wait on terminal writes. None outside
+# the REPL, where _log prints directly.
+_log_queue: asyncio.Queue[str | Text] | None = None
+
+
+def _log(msg: str | Text) -> None:
+    if _log_queue is None:
+        console.print(msg)
+    else:
+        _log_queue.put_nowait(msg)
+
+
+async def _drain_logs(queue: asyncio.Queue[str | Text]) -> None:
+    while True:
+        msg = await queue.get()
+        console.print(msg)
+        queue.task_done()
+
 
 def _setup_logging(debug: bool) -> None:
     level = logging.DEBUG if debug else logging.WARNING
@@ -45,12 +70,19 @@ def _setup_logging(debug: bool) -> None:
 async def _tool_call_callback(name: str, args: dict) -> None:
     """Display tool calls in real time."""
     args_str = ", ".join(f"{k}={v!r}" for k, v in args.items()) if args else ""
-    console.print(f"  [cyan dim]tool:[/] [cyan]{name}[/]({args_str})")
+    # Assembled instead of markup: skips rich's markup parser, and brackets
+    # in the argument reprs can't be mistaken for tags. The arguments keep
+    # repr highlighting; the name is bold, as repr highlighting made it.
+    line = Text.assemble(
+        "  ", ("tool:", "cyan dim"), " ", (name, "bold cyan"),
+        console.highlighter(f"({args_str})"),
+    )
+    _log(line)
 
 
 async def _workflow_start_callback(workflow_id, wf) -> None:
     """Display workflow activation."""
-    console.print(f"  [magenta dim]workflow:[/] [magenta]{wf.name}[/] ({workflow_id})")
+    _log(f"  [magenta dim]workflow:[/] [magenta]{wf.name}[/] ({workflow_id})")
 
 
 async def _workflow_state_callback(state_id, status, **kwargs) -> None:
@@ -60,14 +92,45 @@ async def _workflow_state_callback(state_id, status, **kwargs) -> None:
         msg = f"  [cyan dim]step:[/] [cyan]{state_id}[/]"
         if detail:
             msg += f"  ({detail})"
-        console.print(msg)
+        _log(msg)
     elif status == "visited":
-        console.print(f"  [dim]  done: {state_id}[/]")
+        _log(f"  [dim]  done: {state_id}[/]")
 
 
 async def _workflow_exit_callback(workflow_id) -> None:
     """Display workflow completion."""
-    console.print(f"  [magenta dim]workflow done:[/] {workflow_id}")
+    _log(f"  [magenta dim]workflow done:[/] {workflow_id}")
+
+
+async def _ainput(prompt: str) -> str:
+    """console.input() off the event loop, so background tasks keep running.
+
+    Reads on a daemon thread rather than asyncio.to_thread: a Ctrl-C must
+    not leave shutdown waiting on an executor thread stuck in readline().
+    """
+    loop = asyncio.get_running_loop()
+    fut: asyncio.Future[str] = loop.create_future()
+
+    def _deliver(result: str | None, exc: BaseException | None) -> None:
+        if fut.done():
+            return
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+
+    def _read() -> None:
+        try:
+            result, exc = console.input(prompt), None
+        except BaseException as e:  # EOFError / KeyboardInterrupt reach the caller
+            result, exc = None, e
+        try:
+            loop.call_soon_threadsafe(_deliver, result, exc)
+        except RuntimeError:
+            pass  # Loop already closed
+
+    threading.Thread(target=_read, name="repl-input", daemon=True).start()
+    return await fut
 
 
 async def _ensure_ollama_model() -> str:
@@ -76,11 +139,9 @@ async def _ensure_ollama_model() -> str:
     Returns the active model name, or "" if none available.
     """
     installed = await list_ollama_models()
-    installed_names: set[str] = set()
-    for m in installed:
-        installed_names.add(m["name"])
-        if m["name"].endswith(":latest"):
-            installed_names.add(m["name"][:-7])
+    names = [m["name"] for m in installed]
+    # "qwen3:latest" also answers to "qwen3"
+    installed_names = set(names) | {n[:-7] for n in names if n.endswith(":latest")}
 
     # Check preferred, then fallback
     if settings.ollama_model in installed_names:
@@ -94,19 +155,27 @@ async def _ensure_ollama_model() -> str:
     for model_name in (settings.ollama_model, settings.ollama_fallback_model):
         console.print(f"\n[yellow]Model '{model_name}' is not installed.[/]")
         try:
-            answer = console.input("[yellow]Pull it now? (y/n): [/]").strip().lower()
+            answer = (await _ainput("[yellow]Pull it now? (y/n): [/]")).strip().lower()
         except (EOFError, KeyboardInterrupt):
             return ""
         if answer not in ("y", "yes"):
             continue
         console.print(f"[dim]Pulling {model_name}... this may take a few minutes.[/]")
         try:
-            last_status = ""
+            # Ollama can change status many times a second while pulling
+            # layers; print at most every 100ms, plus the final status
+            loop = asyncio.get_running_loop()
+            last_status = status = ""
+            last_print = 0.0
             async for progress in pull_ollama_model(model_name):
                 status = progress.get("status", "")
-                if status != last_status:
+                now = loop.time()
+                if status != last_status and now - last_print >= 0.1:
                     console.print(f"  [dim]{status}[/]")
                     last_status = status
+                    last_print = now
+            if status != last_status:
+                console.print(f"  [dim]{status}[/]")
             console.print(f"[green]Model '{model_name}' ready.[/]\n")
             return model_name
         except Exception as e:
@@ -116,8 +185,9 @@ async def _ensure_ollama_model() -> str:
 
 
 async def _run_repl() -> None:
-    # Ensure Ollama model is available
-    active_model = await _ensure_ollama_model()
+    global _log_queue
+    # Ensure Ollama model is available; probe the knowledge base meanwhile
+    active_model, _ = await asyncio.gather(_ensure_ollama_model(), probe_rag_service())
     if not active_model:
         console.print("[red]No model available. Install one with: ollama pull qwen3:8b[/]")
         return
@@ -140,31 +210,44 @@ async def _run_repl() -> None:
     console.print(f"[bold]Voice Assistant[/] [dim]({active_model})[/]")
     console.print("[dim]Type 'quit' to exit, 'clear' to reset conversation.[/]\n")
 
-    while True:
-        try:
-            user_input = console.input("[bold green]You:[/] ").strip()
-        except (EOFError, KeyboardInterrupt):
-            console.print("\n[dim]Goodbye![/]")
-            break
-
-        if not user_input:
-            continue
-        if user_input.lower() in ("quit", "exit", "q"):
-            console.print("[dim]Goodbye![/]")
-            break
-        if user_input.lower() == "clear":
-            runner.clear_history()
-            console.print("[dim]Conversation cleared.[/]\n")
-            continue
-
-        with console.status("[dim]Thinking...[/]", spinner="dots"):
+    _log_queue = log_queue = asyncio.Queue()
+    drain = asyncio.create_task(_drain_logs(log_queue))
+    try:
+        while True:
             try:
-                response = await runner.chat(user_input)
-            except Exception as e:
-                console.print(f"[red]Error: {e}[/]\n")
+                user_input = (await _ainput("[bold green]You:[/] ")).strip()
+            except (EOFError, KeyboardInterrupt):
+                console.print("\n[dim]Goodbye![/]")
+                break
+
+            if not user_input:
+                continue
+            command = user_input.lower()
+            if command in _QUIT_COMMANDS:
+                console.print("[dim]Goodbye![/]")
+                break
+            if command == "clear":
+                runner.clear_history()
+                console.print("[dim]Conversation cleared.[/]\n")
                 continue
 
-        console.print(f"[bold blue]Assistant:[/] {response}\n")
+            error = None
+            with console.status("[dim]Thinking...[/]", spinner="dots"):
+                try:
+                    response = await runner.chat(user_input)
+                except Exception as e:
+                    error = e
+                # Tool/step lines go out before the reply
+                await log_queue.join()
+
+            if error is not None:
+                console.print(f"[red]Error: {error}[/]\n")
+                continue
+            console.print(f"[bold blue]Assistant:[/] {response}\n")
+    finally:
+        drain.cancel()
+        _log_queue = None
+        await asyncio.gather(close_rag_client(), close_search_client())
 
 
 def main() -> None:
@@ -173,7 +256,11 @@ def main() -> None:
     args = parser.parse_args()
 
     _setup_logging(args.debug)
-    asyncio.run(_run_repl())
+    try:
+        asyncio.run(_run_repl())
+    except KeyboardInterrupt:
+        # Ctrl-C arrives as task cancellation while a prompt is pending
+        console.print("\n[dim]Goodbye![/]")
 
 
 if __name__ == "__main__":
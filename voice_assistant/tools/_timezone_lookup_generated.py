@@ -0,0 +1,645 @@
+"""City/region → IANA timezone lookup for the datetime tool.
+
+Generated by scripts/gen_tz_lookup.py — do not edit by hand.
+"""
+
+TIMEZONE_LOOKUP = {
+    'abidjan': 'Africa/Abidjan',
+    'accra': 'Africa/Accra',
+    'acre': 'Brazil/Acre',
+    'act': 'Australia/ACT',
+    'adak': 'America/Adak',
+    'addis ababa': 'Africa/Addis_Ababa',
+    'adelaide': 'Australia/Adelaide',
+    'aden': 'Asia/Aden',
+    'alabama': 'America/Chicago',
+    'alaska': 'America/Anchorage',
+    'aleutian': 'US/Aleutian',
+    'algiers': 'Africa/Algiers',
+    'almaty': 'Asia/Almaty',
+    'amman': 'Asia/Amman',
+    'amsterdam': 'Europe/Amsterdam',
+    'anadyr': 'Asia/Anadyr',
+    'anchorage': 'America/Anchorage',
+    'andorra': 'Europe/Andorra',
+    'anguilla': 'America/Anguilla',
+    'antananarivo': 'Indian/Antananarivo',
+    'antigua': 'America/Antigua',
+    'apia': 'Pacific/Apia',
+    'aqtau': 'Asia/Aqtau',
+    'aqtobe': 'Asia/Aqtobe',
+    'araguaina': 'America/Araguaina',
+    'argentina': 'America/Argentina/Buenos_Aires',
+    'arizona': 'America/Phoenix',
+    'arkansas': 'America/Chicago',
+    'aruba': 'America/Aruba',
+    'ashgabat': 'Asia/Ashgabat',
+    'ashkhabad': 'Asia/Ashkhabad',
+    'asmara': 'Africa/Asmara',
+    'asmera': 'Africa/Asmera',
+    'astrakhan': 'Europe/Astrakhan',
+    'asuncion': 'America/Asuncion',
+    'athens': 'Europe/Athens',
+    'atikokan': 'America/Atikokan',
+    'atka': 'America/Atka',
+    'atlanta': 'America/New_York',
+    'atlantic': 'Canada/Atlantic',
+    'atyrau': 'Asia/Atyrau',
+    'auckland': 'Pacific/Auckland',
+    'austin': 'America/Chicago',
+    'australia': 'Australia/Sydney',
+    'austria': 'Europe/Vienna',
+    'azores': 'Atlantic/Azores',
+    'baghdad': 'Asia/Baghdad',
+    'bahia': 'America/Bahia',
+    'bahia banderas': 'America/Bahia_Banderas',
+    'bahrain': 'Asia/Bahrain',
+    'bajanorte': 'Mexico/BajaNorte',
+    'bajasur': 'Mexico/BajaSur',
+    'baku': 'Asia/Baku',
+    'bamako': 'Africa/Bamako',
+    'bangalore': 'Asia/Kolkata',
+    'bangkok': 'Asia/Bangkok',
+    'bangui': 'Africa/Bangui',
+    'banjul': 'Africa/Banjul',
+    'barbados': 'America/Barbados',
+    'barnaul': 'Asia/Barnaul',
+    'beijing': 'Asia/Shanghai',
+    'beirut': 'Asia/Beirut',
+    'belem': 'America/Belem',
+    'belfast': 'Europe/Belfast',
+    'belgium': 'Europe/Brussels',
+    'belgrade': 'Europe/Belgrade',
+    'belize': 'America/Belize',
+    'berlin': 'Europe/Berlin',
+    'bermuda': 'Atlantic/Bermuda',
+    'beulah': 'America/North_Dakota/Beulah',
+    'bishkek': 'Asia/Bishkek',
+    'bissau': 'Africa/Bissau',
+    'blanc-sablon': 'America/Blanc-Sablon',
+    'blantyre': 'Africa/Blantyre',
+    'boa vista': 'America/Boa_Vista',
+    'bogota': 'America/Bogota',
+    'boise': 'America/Boise',
+    'bombay': 'Asia/Kolkata',
+    'boston': 'America/New_York',
+    'bougainville': 'Pacific/Bougainville',
+    'bratislava': 'Europe/Bratislava',
+    'brazil': 'America/Sao_Paulo',
+    'brazzaville': 'Africa/Brazzaville',
+    'brisbane': 'Australia/Brisbane',
+    'broken hill': 'Australia/Broken_Hill',
+    'brunei': 'Asia/Brunei',
+    'brussels': 'Europe/Brussels',
+    'bucharest': 'Europe/Bucharest',
+    'budapest': 'Europe/Budapest',
+    'buenos aires': 'America/Argentina/Buenos_Aires',
+    'bujumbura': 'Africa/Bujumbura',
+    'busingen': 'Europe/Busingen',
+    'cairo': 'Africa/Cairo',
+    'calcutta': 'Asia/Kolkata',
+    'california': 'America/Los_Angeles',
+    'cambridge bay': 'America/Cambridge_Bay',
+    'campo grande': 'America/Campo_Grande',
+    'canada': 'America/Toronto',
+    'canary': 'Atlantic/Canary',
+    'canberra': 'Australia/Canberra',
+    'cancun': 'America/Cancun',
+    'cape verde': 'Atlantic/Cape_Verde',
+    'caracas': 'America/Caracas',
+    'casablanca': 'Africa/Casablanca',
+    'casey': 'Antarctica/Casey',
+    'catamarca': 'America/Catamarca',
+    'cayenne': 'America/Cayenne',
+    'cayman': 'America/Cayman',
+    'center': 'America/North_Dakota/Center',
+    'central': 'US/Central',
+    'ceuta': 'Africa/Ceuta',
+    'chagos': 'Indian/Chagos',
+    'chatham': 'Pacific/Chatham',
+    'chennai': 'Asia/Kolkata',
+    'chicago': 'America/Chicago',
+    'chihuahua': 'America/Chihuahua',
+    'chile': 'America/Santiago',
+    'china': 'Asia/Shanghai',
+    'chisinau': 'Europe/Chisinau',
+    'chita': 'Asia/Chita',
+    'choibalsan': 'Asia/Choibalsan',
+    'chongqing': 'Asia/Chongqing',
+    'christmas': 'Indian/Christmas',
+    'chungking': 'Asia/Chungking',
+    'chuuk': 'Pacific/Chuuk',
+    'ciudad juarez': 'America/Ciudad_Juarez',
+    'cocos': 'Indian/Cocos',
+    'colombia': 'America/Bogota',
+    'colombo': 'Asia/Colombo',
+    'colorado': 'America/Denver',
+    'comodrivadavia': 'America/Argentina/ComodRivadavia',
+    'comoro': 'Indian/Comoro',
+    'conakry': 'Africa/Conakry',
+    'connecticut': 'America/New_York',
+    'continental': 'Chile/Continental',
+    'copenhagen': 'Europe/Copenhagen',
+    'coral harbour': 'America/Coral_Harbour',
+    'cordoba': 'America/Cordoba',
+    'costa rica': 'America/Costa_Rica',
+    'coyhaique': 'America/Coyhaique',
+    'creston': 'America/Creston',
+    'cuiaba': 'America/Cuiaba',
+    'curacao': 'America/Curacao',
+    'currie': 'Australia/Currie',
+    'czech republic': 'Europe/Prague',
+    'dacca': 'Asia/Dacca',
+    'dakar': 'Africa/Dakar',
+    'dallas': 'America/Chicago',
+    'damascus': 'Asia/Damascus',
+    'danmarkshavn': 'America/Danmarkshavn',
+    'dar es salaam': 'Africa/Dar_es_Salaam',
+    'darwin': 'Australia/Darwin',
+    'davis': 'Antarctica/Davis',
+    'dawson': 'America/Dawson',
+    'dawson creek': 'America/Dawson_Creek',
+    'dc': 'America/New_York',
+    'delaware': 'America/New_York',
+    'delhi': 'Asia/Kolkata',
+    'denmark': 'Europe/Copenhagen',
+    'denoronha': 'Brazil/DeNoronha',
+    'denver': 'America/Denver',
+    'detroit': 'America/Detroit',
+    'dhaka': 'Asia/Dhaka',
+    'dili': 'Asia/Dili',
+    'djibouti': 'Africa/Djibouti',
+    'dominica': 'America/Dominica',
+    'douala': 'Africa/Douala',
+    'dubai': 'Asia/Dubai',
+    'dublin': 'Europe/Dublin',
+    'dumontdurville': 'Antarctica/DumontDUrville',
+    'dushanbe': 'Asia/Dushanbe',
+    'east': 'Brazil/East',
+    'east-indiana': 'US/East-Indiana',
+    'easter': 'Pacific/Easter',
+    'easterisland': 'Chile/EasterIsland',
+    'eastern': 'US/Eastern',
+    'edmonton': 'America/Edmonton',
+    'efate': 'Pacific/Efate',
+    'egypt': 'Africa/Cairo',
+    'eirunepe': 'America/Eirunepe',
+    'el aaiun': 'Africa/El_Aaiun',
+    'el salvador': 'America/El_Salvador',
+    'enderbury': 'Pacific/Enderbury',
+    'england': 'Europe/London',
+    'ensenada': 'America/Ensenada',
+    'eucla': 'Australia/Eucla',
+    'faeroe': 'Atlantic/Faeroe',
+    'fakaofo': 'Pacific/Fakaofo',
+    'famagusta': 'Asia/Famagusta',
+    'faroe': 'Atlantic/Faroe',
+    'fiji': 'Pacific/Fiji',
+    'finland': 'Europe/Helsinki',
+    'florida': 'America/New_York',
+    'fort nelson': 'America/Fort_Nelson',
+    'fort wayne': 'America/Fort_Wayne',
+    'fortaleza': 'America/Fortaleza',
+    'france': 'Europe/Paris',
+    'freetown': 'Africa/Freetown',
+    'funafuti': 'Pacific/Funafuti',
+    'gaborone': 'Africa/Gaborone',
+    'galapagos': 'Pacific/Galapagos',
+    'gambier': 'Pacific/Gambier',
+    'gaza': 'Asia/Gaza',
+    'general': 'Mexico/General',
+    'georgia': 'America/New_York',
+    'germany': 'Europe/Berlin',
+    'gibraltar': 'Europe/Gibraltar',
+    'glace bay': 'America/Glace_Bay',
+    'godthab': 'America/Godthab',
+    'goose bay': 'America/Goose_Bay',
+    'grand turk': 'America/Grand_Turk',
+    'greece': 'Europe/Athens',
+    'grenada': 'America/Grenada',
+    'guadalcanal': 'Pacific/Guadalcanal',
+    'guadeloupe': 'America/Guadeloupe',
+    'guam': 'Pacific/Guam',
+    'guangzhou': 'Asia/Shanghai',
+    'guatemala': 'America/Guatemala',
+    'guayaquil': 'America/Guayaquil',
+    'guernsey': 'Europe/Guernsey',
+    'guyana': 'America/Guyana',
+    'halifax': 'America/Halifax',
+    'harare': 'Africa/Harare',
+    'harbin': 'Asia/Harbin',
+    'havana': 'America/Havana',
+    'hawaii': 'Pacific/Honolulu',
+    'hebron': 'Asia/Hebron',
+    'helsinki': 'Europe/Helsinki',
+    'hermosillo': 'America/Hermosillo',
+    'hk': 'Asia/Hong_Kong',
+    'ho chi minh': 'Asia/Ho_Chi_Minh',
+    'hobart': 'Australia/Hobart',
+    'hong kong': 'Asia/Hong_Kong',
+    'honolulu': 'Pacific/Honolulu',
+    'houston': 'America/Chicago',
+    'hovd': 'Asia/Hovd',
+    'hyderabad': 'Asia/Kolkata',
+    'idaho': 'America/Boise',
+    'illinois': 'America/Chicago',
+    'india': 'Asia/Kolkata',
+    'indiana-starke': 'US/Indiana-Starke',
+    'indianapolis': 'America/Indianapolis',
+    'indonesia': 'Asia/Jakarta',
+    'inuvik': 'America/Inuvik',
+    'iowa': 'America/Chicago',
+    'iqaluit': 'America/Iqaluit',
+    'ireland': 'Europe/Dublin',
+    'irkutsk': 'Asia/Irkutsk',
+    'isle of man': 'Europe/Isle_of_Man',
+    'israel': 'Asia/Jerusalem',
+    'istanbul': 'Europe/Istanbul',
+    'italy': 'Europe/Rome',
+    'jakarta': 'Asia/Jakarta',
+    'jamaica': 'America/Jamaica',
+    'jan mayen': 'Atlantic/Jan_Mayen',
+    'japan': 'Asia/Tokyo',
+    'jayapura': 'Asia/Jayapura',
+    'jersey': 'Europe/Jersey',
+    'jerusalem': 'Asia/Jerusalem',
+    'johannesburg': 'Africa/Johannesburg',
+    'johnston': 'Pacific/Johnston',
+    'juba': 'Africa/Juba',
+    'jujuy': 'America/Jujuy',
+    'juneau': 'America/Juneau',
+    'kabul': 'Asia/Kabul',
+    'kaliningrad': 'Europe/Kaliningrad',
+    'kamchatka': 'Asia/Kamchatka',
+    'kampala': 'Africa/Kampala',
+    'kansas': 'America/Chicago',
+    'kanton': 'Pacific/Kanton',
+    'karachi': 'Asia/Karachi',
+    'kashgar': 'Asia/Kashgar',
+    'kathmandu': 'Asia/Kathmandu',
+    'katmandu': 'Asia/Katmandu',
+    'kentucky': 'America/New_York',
+    'kenya': 'Africa/Nairobi',
+    'kerguelen': 'Indian/Kerguelen',
+    'khandyga': 'Asia/Khandyga',
+    'khartoum': 'Africa/Khartoum',
+    'kiev': 'Europe/Kiev',
+    'kigali': 'Africa/Kigali',
+    'kinshasa': 'Africa/Kinshasa',
+    'kiritimati': 'Pacific/Kiritimati',
+    'kirov': 'Europe/Kirov',
+    'knox': 'America/Indiana/Knox',
+    'knox in': 'America/Knox_IN',
+    'kolkata': 'Asia/Kolkata',
+    'korea': 'Asia/Seoul',
+    'kosrae': 'Pacific/Kosrae',
+    'kralendijk': 'America/Kralendijk',
+    'krasnoyarsk': 'Asia/Krasnoyarsk',
+    'kuala lumpur': 'Asia/Kuala_Lumpur',
+    'kuching': 'Asia/Kuching',
+    'kuwait': 'Asia/Kuwait',
+    'kwajalein': 'Pacific/Kwajalein',
+    'kyiv': 'Europe/Kyiv',
+    'la': 'America/Los_Angeles',
+    'la paz': 'America/La_Paz',
+    'la rioja': 'America/Argentina/La_Rioja',
+    'lagos': 'Africa/Lagos',
+    'las vegas': 'America/Los_Angeles',
+    'lhi': 'Australia/LHI',
+    'libreville': 'Africa/Libreville',
+    'lima': 'America/Lima',
+    'lindeman': 'Australia/Lindeman',
+    'lisbon': 'Europe/Lisbon',
+    'ljubljana': 'Europe/Ljubljana',
+    'lome': 'Africa/Lome',
+    'london': 'Europe/London',
+    'longyearbyen': 'Arctic/Longyearbyen',
+    'lord howe': 'Australia/Lord_Howe',
+    'los angeles': 'America/Los_Angeles',
+    'louisiana': 'America/Chicago',
+    'louisville': 'America/Louisville',
+    'lower princes': 'America/Lower_Princes',
+    'luanda': 'Africa/Luanda',
+    'lubumbashi': 'Africa/Lubumbashi',
+    'lusaka': 'Africa/Lusaka',
+    'luxembourg': 'Europe/Luxembourg',
+    'macao': 'Asia/Macao',
+    'macau': 'Asia/Macau',
+    'maceio': 'America/Maceio',
+    'macquarie': 'Antarctica/Macquarie',
+    'madeira': 'Atlantic/Madeira',
+    'madrid': 'Europe/Madrid',
+    'magadan': 'Asia/Magadan',
+    'mahe': 'Indian/Mahe',
+    'maine': 'America/New_York',
+    'majuro': 'Pacific/Majuro',
+    'makassar': 'Asia/Makassar',
+    'malabo': 'Africa/Malabo',
+    'malaysia': 'Asia/Kuala_Lumpur',
+    'maldives': 'Indian/Maldives',
+    'malta': 'Europe/Malta',
+    'managua': 'America/Managua',
+    'manaus': 'America/Manaus',
+    'manila': 'Asia/Manila',
+    'maputo': 'Africa/Maputo',
+    'marengo': 'America/Indiana/Marengo',
+    'mariehamn': 'Europe/Mariehamn',
+    'marigot': 'America/Marigot',
+    'marquesas': 'Pacific/Marquesas',
+    'martinique': 'America/Martinique',
+    'maryland': 'America/New_York',
+    'maseru': 'Africa/Maseru',
+    'massachusetts': 'America/New_York',
+    'matamoros': 'America/Matamoros',
+    'mauritius': 'Indian/Mauritius',
+    'mawson': 'Antarctica/Mawson',
+    'mayotte': 'Indian/Mayotte',
+    'mazatlan': 'America/Mazatlan',
+    'mbabane': 'Africa/Mbabane',
+    'mcmurdo': 'Antarctica/McMurdo',
+    'melbourne': 'Australia/Melbourne',
+    'mendoza': 'America/Mendoza',
+    'menominee': 'America/Menominee',
+    'merida': 'America/Merida',
+    'metlakatla': 'America/Metlakatla',
+    'mexico': 'America/Mexico_City',
+    'mexico city': 'America/Mexico_City',
+    'miami': 'America/New_York',
+    'michigan': 'America/Detroit',
+    'midway': 'Pacific/Midway',
+    'minneapolis': 'America/Chicago',
+    'minnesota': 'America/Chicago',
+    'minsk': 'Europe/Minsk',
+    'miquelon': 'America/Miquelon',
+    'mississippi': 'America/Chicago',
+    'missouri': 'America/Chicago',
+    'mogadishu': 'Africa/Mogadishu',
+    'monaco': 'Europe/Monaco',
+    'moncton': 'America/Moncton',
+    'monrovia': 'Africa/Monrovia',
+    'montana': 'America/Denver',
+    'monterrey': 'America/Monterrey',
+    'montevideo': 'America/Montevideo',
+    'monticello': 'America/Kentucky/Monticello',
+    'montreal': 'America/Montreal',
+    'montserrat': 'America/Montserrat',
+    'moscow': 'Europe/Moscow',
+    'mountain': 'US/Mountain',
+    'mumbai': 'Asia/Kolkata',
+    'muscat': 'Asia/Muscat',
+    'nairobi': 'Africa/Nairobi',
+    'nassau': 'America/Nassau',
+    'nauru': 'Pacific/Nauru',
+    'ndjamena': 'Africa/Ndjamena',
+    'nebraska': 'America/Chicago',
+    'netherlands': 'Europe/Amsterdam',
+    'nevada': 'America/Los_Angeles',
+    'new delhi': 'Asia/Kolkata',
+    'new hampshire': 'America/New_York',
+    'new jersey': 'America/New_York',
+    'new mexico': 'America/Denver',
+    'new salem': 'America/North_Dakota/New_Salem',
+    'new york': 'America/New_York',
+    'new york state': 'America/New_York',
+    'new zealand': 'Pacific/Auckland',
+    'newfoundland': 'Canada/Newfoundland',
+    'niamey': 'Africa/Niamey',
+    'nicosia': 'Europe/Nicosia',
+    'nigeria': 'Africa/Lagos',
+    'nipigon': 'America/Nipigon',
+    'niue': 'Pacific/Niue',
+    'nome': 'America/Nome',
+    'norfolk': 'Pacific/Norfolk',
+    'noronha': 'America/Noronha',
+    'north': 'Australia/North',
+    'north carolina': 'America/New_York',
+    'north dakota': 'America/Chicago',
+    'norway': 'Europe/Oslo',
+    'nouakchott': 'Africa/Nouakchott',
+    'noumea': 'Pacific/Noumea',
+    'novokuznetsk': 'Asia/Novokuznetsk',
+    'novosibirsk': 'Asia/Novosibirsk',
+    'nsw': 'Australia/NSW',
+    'nuuk': 'America/Nuuk',
+    'ny': 'America/New_York',
+    'nyc': 'America/New_York',
+    'ohio': 'America/New_York',
+    'ojinaga': 'America/Ojinaga',
+    'oklahoma': 'America/Chicago',
+    'omsk': 'Asia/Omsk',
+    'oral': 'Asia/Oral',
+    'oregon': 'America/Los_Angeles',
+    'oslo': 'Europe/Oslo',
+    'ouagadougou': 'Africa/Ouagadougou',
+    'pacific': 'US/Pacific',
+    'pago pago': 'Pacific/Pago_Pago',
+    'pakistan': 'Asia/Karachi',
+    'palau': 'Pacific/Palau',
+    'palmer': 'Antarctica/Palmer',
+    'panama': 'America/Panama',
+    'pangnirtung': 'America/Pangnirtung',
+    'paramaribo': 'America/Paramaribo',
+    'paris': 'Europe/Paris',
+    'peking': 'Asia/Shanghai',
+    'pennsylvania': 'America/New_York',
+    'perth': 'Australia/Perth',
+    'peru': 'America/Lima',
+    'petersburg': 'America/Indiana/Petersburg',
+    'philadelphia': 'America/New_York',
+    'philippines': 'Asia/Manila',
+    'philly': 'America/New_York',
+    'phnom penh': 'Asia/Phnom_Penh',
+    'phoenix': 'America/Phoenix',
+    'pitcairn': 'Pacific/Pitcairn',
+    'podgorica': 'Europe/Podgorica',
+    'pohnpei': 'Pacific/Pohnpei',
+    'poland': 'Europe/Warsaw',
+    'ponape': 'Pacific/Ponape',
+    'pontianak': 'Asia/Pontianak',
+    'port moresby': 'Pacific/Port_Moresby',
+    'port of spain': 'America/Port_of_Spain',
+    'port-au-prince': 'America/Port-au-Prince',
+    'portland': 'America/Los_Angeles',
+    'porto acre': 'America/Porto_Acre',
+    'porto velho': 'America/Porto_Velho',
+    'porto-novo': 'Africa/Porto-Novo',
+    'portugal': 'Europe/Lisbon',
+    'prague': 'Europe/Prague',
+    'puerto rico': 'America/Puerto_Rico',
+    'punta arenas': 'America/Punta_Arenas',
+    'pyongyang': 'Asia/Pyongyang',
+    'qatar': 'Asia/Qatar',
+    'qostanay': 'Asia/Qostanay',
+    'queensland': 'Australia/Queensland',
+    'qyzylorda': 'Asia/Qyzylorda',
+    'rainy river': 'America/Rainy_River',
+    'rangoon': 'Asia/Rangoon',
+    'rankin inlet': 'America/Rankin_Inlet',
+    'rarotonga': 'Pacific/Rarotonga',
+    'recife': 'America/Recife',
+    'regina': 'America/Regina',
+    'resolute': 'America/Resolute',
+    'reunion': 'Indian/Reunion',
+    'reykjavik': 'Atlantic/Reykjavik',
+    'rhode island': 'America/New_York',
+    'riga': 'Europe/Riga',
+    'rio': 'America/Sao_Paulo',
+    'rio branco': 'America/Rio_Branco',
+    'rio de janeiro': 'America/Sao_Paulo',
+    'rio gallegos': 'America/Argentina/Rio_Gallegos',
+    'riyadh': 'Asia/Riyadh',
+    'rome': 'Europe/Rome',
+    'rosario': 'America/Rosario',
+    'rothera': 'Antarctica/Rothera',
+    'russia': 'Europe/Moscow',
+    'saigon': 'Asia/Saigon',
+    'saipan': 'Pacific/Saipan',
+    'sakhalin': 'Asia/Sakhalin',
+    'salta': 'America/Argentina/Salta',
+    'samara': 'Europe/Samara',
+    'samarkand': 'Asia/Samarkand',
+    'samoa': 'US/Samoa',
+    'san antonio': 'America/Chicago',
+    'san fran': 'America/Los_Angeles',
+    'san juan': 'America/Argentina/San_Juan',
+    'san luis': 'America/Argentina/San_Luis',
+    'san marino': 'Europe/San_Marino',
+    'santa isabel': 'America/Santa_Isabel',
+    'santarem': 'America/Santarem',
+    'santiago': 'America/Santiago',
+    'santo domingo': 'America/Santo_Domingo',
+    'sao paulo': 'America/Sao_Paulo',
+    'sao tome': 'Africa/Sao_Tome',
+    'sarajevo': 'Europe/Sarajevo',
+    'saratov': 'Europe/Saratov',
+    'saskatchewan': 'Canada/Saskatchewan',
+    'saudi arabia': 'Asia/Riyadh',
+    'scoresbysund': 'America/Scoresbysund',
+    'scotland': 'Europe/London',
+    'seattle': 'America/Los_Angeles',
+    'seoul': 'Asia/Seoul',
+    'sf': 'America/Los_Angeles',
+    'shanghai': 'Asia/Shanghai',
+    'shenzhen': 'Asia/Shanghai',
+    'shiprock': 'America/Shiprock',
+    'simferopol': 'Europe/Simferopol',
+    'singapore': 'Asia/Singapore',
+    'sitka': 'America/Sitka',
+    'skopje': 'Europe/Skopje',
+    'sofia': 'Europe/Sofia',
+    'south': 'Australia/South',
+    'south africa': 'Africa/Johannesburg',
+    'south carolina': 'America/New_York',
+    'south dakota': 'America/Chicago',
+    'south georgia': 'Atlantic/South_Georgia',
+    'south korea': 'Asia/Seoul',
+    'south pole': 'Antarctica/South_Pole',
+    'spain': 'Europe/Madrid',
+    'srednekolymsk': 'Asia/Srednekolymsk',
+    'st barthelemy': 'America/St_Barthelemy',
+    'st helena': 'Atlantic/St_Helena',
+    'st johns': 'America/St_Johns',
+    'st kitts': 'America/St_Kitts',
+    'st louis': 'America/Chicago',
+    'st lucia': 'America/St_Lucia',
+    'st thomas': 'America/St_Thomas',
+    'st vincent': 'America/St_Vincent',
+    'st. louis': 'America/Chicago',
+    'stanley': 'Atlantic/Stanley',
+    'stockholm': 'Europe/Stockholm',
+    'sweden': 'Europe/Stockholm',
+    'swift current': 'America/Swift_Current',
+    'switzerland': 'Europe/Zurich',
+    'sydney': 'Australia/Sydney',
+    'syowa': 'Antarctica/Syowa',
+    'tahiti': 'Pacific/Tahiti',
+    'taipei': 'Asia/Taipei',
+    'taiwan': 'Asia/Taipei',
+    'tallinn': 'Europe/Tallinn',
+    'tarawa': 'Pacific/Tarawa',
+    'tashkent': 'Asia/Tashkent',
+    'tasmania': 'Australia/Tasmania',
+    'tbilisi': 'Asia/Tbilisi',
+    'tegucigalpa': 'America/Tegucigalpa',
+    'tehran': 'Asia/Tehran',
+    'tel aviv': 'Asia/Tel_Aviv',
+    'tell city': 'America/Indiana/Tell_City',
+    'tennessee': 'America/Chicago',
+    'texas': 'America/Chicago',
+    'thailand': 'Asia/Bangkok',
+    'thimbu': 'Asia/Thimbu',
+    'thimphu': 'Asia/Thimphu',
+    'thule': 'America/Thule',
+    'thunder bay': 'America/Thunder_Bay',
+    'tijuana': 'America/Tijuana',
+    'timbuktu': 'Africa/Timbuktu',
+    'tirane': 'Europe/Tirane',
+    'tiraspol': 'Europe/Tiraspol',
+    'tokyo': 'Asia/Tokyo',
+    'tomsk': 'Asia/Tomsk',
+    'tongatapu': 'Pacific/Tongatapu',
+    'toronto': 'America/Toronto',
+    'tortola': 'America/Tortola',
+    'tripoli': 'Africa/Tripoli',
+    'troll': 'Antarctica/Troll',
+    'truk': 'Pacific/Truk',
+    'tucuman': 'America/Argentina/Tucuman',
+    'tunis': 'Africa/Tunis',
+    'turkey': 'Europe/Istanbul',
+    'uae': 'Asia/Dubai',
+    'ujung pandang': 'Asia/Ujung_Pandang',
+    'uk': 'Europe/London',
+    'ulaanbaatar': 'Asia/Ulaanbaatar',
+    'ulan bator': 'Asia/Ulan_Bator',
+    'ulyanovsk': 'Europe/Ulyanovsk',
+    'united arab emirates': 'Asia/Dubai',
+    'united kingdom': 'Europe/London',
+    'urumqi': 'Asia/Urumqi',
+    'ushuaia': 'America/Argentina/Ushuaia',
+    'ust-nera': 'Asia/Ust-Nera',
+    'utah': 'America/Denver',
+    'uzhgorod': 'Europe/Uzhgorod',
+    'vaduz': 'Europe/Vaduz',
+    'vancouver': 'America/Vancouver',
+    'vatican': 'Europe/Vatican',
+    'vegas': 'America/Los_Angeles',
+    'vermont': 'America/New_York',
+    'vevay': 'America/Indiana/Vevay',
+    'victoria': 'Australia/Victoria',
+    'vienna': 'Europe/Vienna',
+    'vientiane': 'Asia/Vientiane',
+    'vietnam': 'Asia/Ho_Chi_Minh',
+    'vilnius': 'Europe/Vilnius',
+    'vincennes': 'America/Indiana/Vincennes',
+    'virgin': 'America/Virgin',
+    'virginia': 'America/New_York',
+    'vladivostok': 'Asia/Vladivostok',
+    'volgograd': 'Europe/Volgograd',
+    'vostok': 'Antarctica/Vostok',
+    'wake': 'Pacific/Wake',
+    'wallis': 'Pacific/Wallis',
+    'warsaw': 'Europe/Warsaw',
+    'washington': 'America/Los_Angeles',
+    'washington dc': 'America/New_York',
+    'washington state': 'America/Los_Angeles',
+    'west': 'Brazil/West',
+    'west virginia': 'America/New_York',
+    'whitehorse': 'America/Whitehorse',
+    'winamac': 'America/Indiana/Winamac',
+    'windhoek': 'Africa/Windhoek',
+    'winnipeg': 'America/Winnipeg',
+    'wisconsin': 'America/Chicago',
+    'wyoming': 'America/Denver',
+    'yakutat': 'America/Yakutat',
+    'yakutsk': 'Asia/Yakutsk',
+    'yancowinna': 'Australia/Yancowinna',
+    'yangon': 'Asia/Yangon',
+    'yap': 'Pacific/Yap',
+    'yekaterinburg': 'Asia/Yekaterinburg',
+    'yellowknife': 'America/Yellowknife',
+    'yerevan': 'Asia/Yerevan',
+    'yukon': 'Canada/Yukon',
+    'zagreb': 'Europe/Zagreb',
+    'zaporozhye': 'Europe/Zaporozhye',
+    'zurich': 'Europe/Zurich',
+}
@@ -12,7 +12,13 @@ from pydantic import BaseModel
 
 
 class BaseTool(ABC):
-    """Abstract base for a callable tool."""
+    """Abstract base for a callable tool.
+
+    Tools are stateless singletons in the registry; subclasses declare
+    empty __slots__ too so instances carry no __dict__.
+    """
+
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -6,13 +6,23 @@ API integration (Apple Calendar, Google Calendar, etc.).
 See backlog: F-003-real-calendar-integration.md
 """
 
-from datetime import datetime
+from datetime import date
 from typing import Any
 
 from .base import BaseTool
 
+# MOCK: same events for every date
+_MOCK_EVENTS = (
+    "- 9:00 AM: Team standup (Zoom)\n"
+    "- 11:30 AM: Lunch with Alex at Torchy's Tacos\n"
+    "- 2:00 PM: Dentist appointment\n"
+    "- 5:00 PM: Yoga class"
+)
+
 
 class CalendarTool(BaseTool):
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "check_calendar"
@@ -36,11 +46,5 @@ class CalendarTool(BaseTool):
 
     async def execute(self, **kwargs: Any) -> str:
         # MOCK: Replace with real calendar API (F-003)
-        date = kwargs.get("date", datetime.now().strftime("%Y-%m-%d"))
-        return (
-            f"[MOCK DATA] Calendar for {date}:\n"
-            f"- 9:00 AM: Team standup (Zoom)\n"
-            f"- 11:30 AM: Lunch with Alex at Torchy's Tacos\n"
-            f"- 2:00 PM: Dentist appointment\n"
-            f"- 5:00 PM: Yoga class"
-        )
+        day = kwargs.get("date") or date.today().isoformat()
+        return f"[MOCK DATA] Calendar for {day}:\n{_MOCK_EVENTS}"
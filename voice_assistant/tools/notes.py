@@ -12,6 +12,8 @@ from .base import BaseTool
 
 
 class NotesTool(BaseTool):
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "search_notes"
@@ -34,7 +36,7 @@ class NotesTool(BaseTool):
         }
 
     async def execute(self, **kwargs: Any) -> str:
-        query = kwargs.get("query", "")
+        query = kwargs.get("query") or ""
         # Fake notes database
         notes = {
             "shopping": "Shopping list (Feb 15):\n- Oat milk\n- Avocados\n- Sourdough bread\n- Dark chocolate\n- Olive oil",
@@ -8,6 +8,7 @@ projects, code, or documentation rather than general web knowledge.
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 import httpx
@@ -18,11 +19,72 @@ from .base import BaseTool
 log = logging.getLogger("tools.rag")
 
 RAG_TIMEOUT = 2.0
+PROBE_TIMEOUT = 0.5
+DOWN_RETRY_S = 30.0  # After a failed probe/query, skip the service this long
 TOP_K = 5
 GITHUB_OWNER = "davidbmar"
 
+# Shared client: keeps the connection to the RAG service warm across queries
+_httpx_client: httpx.AsyncClient | None = None
+
+# monotonic() time the service was last found unreachable (None = not known down)
+_down_since: float | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _httpx_client
+    if _httpx_client is None:
+        _httpx_client = httpx.AsyncClient(
+            timeout=RAG_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+        )
+    return _httpx_client
+
+
+def _is_down() -> bool:
+    return _down_since is not None and time.monotonic() - _down_since < DOWN_RETRY_S
+
+
+def _mark_down() -> None:
+    global _down_since
+    _down_since = time.monotonic()
+
+
+def _mark_up() -> None:
+    global _down_since
+    _down_since = None
+
+
+async def probe_service() -> bool:
+    """Check the RAG service is reachable, remembering the answer.
+
+    Any HTTP response counts as up; only connect errors and timeouts mark
+    it down, letting execute() answer immediately instead of waiting out
+    RAG_TIMEOUT on every query.
+    """
+    try:
+        await _get_client().get(f"{settings.rag_url}/health", timeout=PROBE_TIMEOUT)
+    except (httpx.ConnectError, httpx.TimeoutException):
+        log.info("RAG service not reachable at %s", settings.rag_url)
+        _mark_down()
+        return False
+    except httpx.HTTPError:
+        pass
+    _mark_up()
+    return True
+
+
+async def close_client() -> None:
+    """Close the shared client (call before the event loop shuts down)."""
+    global _httpx_client
+    if _httpx_client is not None:
+        await _httpx_client.aclose()
+        _httpx_client = None
+
 
 class RAGTool(BaseTool):
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "search_knowledge_base"
@@ -48,20 +110,23 @@ class RAGTool(BaseTool):
         }
 
     async def execute(self, **kwargs: Any) -> str:
-        query = kwargs.get("query", "")
+        query = kwargs.get("query") or ""
         if not query:
             return "Error: no search query provided."
 
+        if _is_down():
+            return "Knowledge base is currently unavailable (service not running)."
+
         try:
-            async with httpx.AsyncClient(timeout=RAG_TIMEOUT) as client:
-                resp = await client.post(
-                    f"{settings.rag_url}/query",
-                    json={"query": query, "top_k": TOP_K},
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await _get_client().post(
+                f"{settings.rag_url}/query",
+                json={"query": query, "top_k": TOP_K},
+            )
+            resp.raise_for_status()
+            data = resp.json()
         except httpx.ConnectError:
             log.warning("RAG service not reachable at %s", settings.rag_url)
+            _mark_down()
             return "Knowledge base is currently unavailable (service not running)."
         except httpx.TimeoutException:
             log.warning("RAG query timed out after %.1fs", RAG_TIMEOUT)
@@ -77,22 +142,22 @@ class RAGTool(BaseTool):
         # Deduplicate by repo name — show each repo once with best score
         seen_repos: dict[str, dict] = {}
         for r in results:
-            filename = r.get("filename", "")
-            repo_name = filename.split("/")[0] if "/" in filename else filename
-            if repo_name and repo_name not in seen_repos:
-                seen_repos[repo_name] = r
+            repo_name = r.get("filename", "").partition("/")[0]
+            if repo_name:
+                seen_repos.setdefault(repo_name, r)
 
         lines = [f"Knowledge base results for '{query}':"]
         for i, (repo_name, r) in enumerate(seen_repos.items(), 1):
             score = r.get("score", 0.0)
             text = r.get("text", "").strip()
-            github_url = f"https://github.com/{GITHUB_OWNER}/{repo_name}"
             # Truncate long chunks to keep LLM context manageable
-            if len(text) > 500:
-                text = text[:500] + "..."
-            lines.append(f"{i}. {repo_name} (score: {score:.2f})")
-            lines.append(f"   GitHub: {github_url}")
-            lines.append(f"   {text}")
+            ellipsis = "..." if len(text) > 500 else ""
+            # One formatted entry per repo (header, link, text); joined once below
+            lines.append(
+                f"{i}. {repo_name} (score: {score:.2f})\n"
+                f"   GitHub: https://github.com/{GITHUB_OWNER}/{repo_name}\n"
+                f"   {text[:500]}{ellipsis}"
+            )
 
         log.info("RAG: %d results for '%s'", len(results), query[:60])
         return "\n".join(lines)
@@ -10,31 +10,203 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
 from typing import Any
 
 import httpx
 
+from engine.jsonx import loads as _json_loads
+
 from ..config import settings
 from .base import BaseTool
 
-# Strip HTML tags from search snippets
-_HTML_TAG_RE = re.compile(r"<[^>]+>")
-_HTML_ENTITY_RE = re.compile(r"&#x[0-9a-fA-F]+;|&[a-z]+;")
+# HTTP/2 lets concurrent searches to the same provider share one TLS
+# connection; httpx needs the h2 package for it, else it speaks HTTP/1.1
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# A tag can't contain '<': a stray '<' fails fast at the next one instead
+# of rescanning to the end of the text (quadratic on "<<<<...")
+_HTML_TAG_RE = re.compile(r"<[^<>]+>")
 
 log = logging.getLogger("tools.web_search")
 
 MAX_RESULTS = 8
+MIN_QUERY_LEN = 2
+MAX_QUERY_LEN = 512  # Longer queries are truncated; providers reject or ignore the rest
 SNIPPET_MAX_LEN = 500
+HEDGE_DELAY_S = 0.4  # Start the next provider if the current ones haven't answered by then
+
+# Settings are frozen, so provider URLs and auth headers are built once
+SERPER_URL = "https://google.serper.dev/search"
+TAVILY_URL = "https://api.tavily.com/search"
+BRAVE_URL = "https://api.search.brave.com/res/v1/web/search"
+_SERPER_HEADERS = {"X-API-KEY": settings.serper_api_key, "Content-Type": "application/json"}
+_TAVILY_HEADERS = {"X-API-Key": settings.tavily_api_key, "Content-Type": "application/json"}
+_BRAVE_HEADERS = {"X-Subscription-Token": settings.brave_api_key, "Accept": "application/json"}
+
+# Shared client: reuses TLS connections to the search APIs across queries
+_httpx_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _httpx_client
+    if _httpx_client is None:
+        _httpx_client = httpx.AsyncClient(
+            http2=_HTTP2,
+            timeout=settings.search_timeout,
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=40, keepalive_expiry=30,
+            ),
+        )
+    return _httpx_client
+
+
+async def close_client() -> None:
+    """Close the shared client (call before the event loop shuts down)."""
+    global _httpx_client
+    if _httpx_client is not None:
+        await _httpx_client.aclose()
+        _httpx_client = None
+
+
+# DuckDuckGo's client is blocking; it gets its own threads so slow searches
+# can't tie up the loop's default executor (TTS/STT use it). Hedging cancels
+# a losing DDG call, but that doesn't stop its thread, so there is more than
+# one: the next query's fallback needn't queue behind an abandoned request.
+# Each thread reuses its own DDGS session, so no locking is needed.
+_ddg_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ddg")
+_ddg_local = threading.local()  # .session: this ddg thread's DDGS
+
+
+def _ddg_text(query: str) -> list[dict] | None:
+    """Run a DuckDuckGo text search on this thread's session (ddg threads only).
+
+    Returns None if the search raised.
+    """
+    try:
+        ddgs = getattr(_ddg_local, "session", None)
+        if ddgs is None:
+            from duckduckgo_search import DDGS
+            ddgs = _ddg_local.session = DDGS()
+        return list(ddgs.text(query, max_results=MAX_RESULTS))
+    except Exception as e:
+        log.warning("DuckDuckGo search failed: %s", e)
+        _ddg_local.session = None  # Start a fresh session next time
+        return None
+
+
+# ── Provider backoff ──────────────────────────────────────
+# A provider that errored (HTTP error, timeout, bad body) is skipped for
+# 2, 4, 8... up to BACKOFF_MAX_S seconds, instead of being retried and
+# timing out again on the next query. An empty result set isn't an error.
+BACKOFF_MAX_S = 60.0
+_backoff: dict[str, tuple[float, int]] = {}  # name -> (retry after, consecutive failures)
+
+
+def _backing_off(name: str) -> bool:
+    entry = _backoff.get(name)
+    return entry is not None and time.monotonic() < entry[0]
+
+
+def _provider_failed(name: str) -> None:
+    failures = _backoff.get(name, (0.0, 0))[1] + 1
+    _backoff[name] = (time.monotonic() + min(BACKOFF_MAX_S, 2.0 ** failures), failures)
+
+
+def _provider_ok(name: str) -> None:
+    _backoff.pop(name, None)
+
+
+# ── Result cache ──────────────────────────────────────────
+# Formatted results by normalized query, oldest first: {key: (monotonic ts, text)}
+CACHE_TTL_S = 300.0
+CACHE_MAX = 256
+_result_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+def _cache_key(query: str) -> str:
+    """Case- and whitespace-insensitive key: "Weather  in NYC" == "weather in nyc"."""
+    return " ".join(query.lower().split())
+
+
+def _cache_get(key: str) -> str | None:
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] >= CACHE_TTL_S:
+        del _result_cache[key]
+        return None
+    _result_cache.move_to_end(key)
+    return entry[1]
+
+
+def _cache_put(key: str, result: str) -> None:
+    _result_cache[key] = (time.monotonic(), result)
+    _result_cache.move_to_end(key)
+    if len(_result_cache) > CACHE_MAX:
+        _result_cache.popitem(last=False)
 
 
 def _clean_html(text: str) -> str:
-    """Remove HTML tags and decode common entities."""
-    text = _HTML_TAG_RE.sub("", text)
-    text = _HTML_ENTITY_RE.sub("", text)
+    """Remove HTML tags and decode entities ("AT&amp;T" → "AT&T")."""
+    if "<" in text:
+        text = _HTML_TAG_RE.sub("", text)
+    if "&" in text:
+        text = unescape(text)
     return text.strip()
 
 
+def _clean_snippet(text: str) -> str:
+    """_clean_html() capped at SNIPPET_MAX_LEN.
+
+    Snippets can run to several KB, so only a 2x prefix is cleaned; the
+    whole text is only cleaned if markup left that prefix too short.
+    """
+    limit = SNIPPET_MAX_LEN * 2
+    cleaned = _clean_html(text[:limit])
+    if len(cleaned) < SNIPPET_MAX_LEN and len(text) > limit:
+        cleaned = _clean_html(text)
+    return cleaned[:SNIPPET_MAX_LEN]
+
+
+def _render_results(
+    lines: list[str],
+    results: list[dict],
+    url_key: str,
+    snippet_key: str,
+    extras_key: str | None = None,
+) -> None:
+    """Append one numbered entry per result: "N. title (url)", then its
+    snippet and up to two extra snippets on indented lines.
+
+    Providers only differ in field names; a missing url_key falls back
+    to "url".
+    """
+    for i, r in enumerate(results, 1):
+        title = _clean_html(r.get("title") or "No title")
+        url = r[url_key] if url_key in r else r.get("url", "")
+        snippet = _clean_snippet(r.get(snippet_key) or "")
+        entry = f"{i}. {title} ({url})"
+        lines.append(f"{entry}\n   {snippet}" if snippet else entry)
+        if extras_key:
+            lines.extend(
+                f"   {_clean_snippet(extra)}"
+                for extra in (r.get(extras_key) or [])[:2]
+            )
+
+
 class WebSearchTool(BaseTool):
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "web_search"
@@ -60,59 +232,98 @@ class WebSearchTool(BaseTool):
         }
 
     async def execute(self, **kwargs: Any) -> str:
-        query = kwargs.get("query", "")
+        # Malformed model arguments shouldn't cost a provider round trip
+        query = (kwargs.get("query") or "").strip()
         if not query:
             return "Error: no search query provided."
+        if len(query) < MIN_QUERY_LEN:
+            return f"Error: search query '{query}' is too short."
+        query = query[:MAX_QUERY_LEN]
+
+        key = _cache_key(query)
+        cached = _cache_get(key)
+        if cached is not None:
+            log.info("Cache hit for '%s'", query[:60])
+            return cached
 
         # Fallback chain: Serper -> Tavily -> Brave -> DuckDuckGo
+        providers = [
+            search for name, search, enabled in (
+                ("serper", self._search_serper, settings.serper_api_key),
+                ("tavily", self._search_tavily, settings.tavily_api_key),
+                ("brave", self._search_brave, settings.brave_api_key),
+                ("duckduckgo", self._search_duckduckgo, True),
+            ) if enabled and not _backing_off(name)
+        ]
         result = None
-        if settings.serper_api_key:
-            result = await self._search_serper(query)
-        if result is None and settings.tavily_api_key:
-            result = await self._search_tavily(query)
-        if result is None and settings.brave_api_key:
-            result = await self._search_brave(query)
-        if result is None:
-            result = await self._search_duckduckgo(query)
+        if providers:
+            header = f"Web search results for '{query}':"
+            result = await self._search_hedged(providers, query, header)
 
         if result is None:
             return f"Web search failed for '{query}'. All search providers returned no results."
 
+        _cache_put(key, result)
         return result
 
+    async def _search_hedged(self, providers: list, *args: Any) -> str | None:
+        """Run providers(*args) in priority order, overlapping slow ones.
+
+        The next provider starts as soon as a running one fails, or once
+        the running ones have gone HEDGE_DELAY_S without answering. The
+        first result wins and the rest are cancelled, so a slow or dead
+        provider costs at most HEDGE_DELAY_S instead of its full timeout.
+        """
+        remaining = iter(providers)
+        running = {asyncio.create_task(next(remaining)(*args))}
+        try:
+            while running:
+                done, running = await asyncio.wait(
+                    running, timeout=HEDGE_DELAY_S, return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    result = task.result()  # providers log and return None on error
+                    if result is not None:
+                        return result
+                search = next(remaining, None)
+                if search is not None:
+                    running.add(asyncio.create_task(search(*args)))
+        finally:
+            for task in running:
+                task.cancel()
+        return None
+
     # ── Serper (Google SERP) ─────────────────────────────────
 
-    async def _search_serper(self, query: str) -> str | None:
+    async def _search_serper(self, query: str, header: str) -> str | None:
         """Search via Serper.dev — returns Google results with knowledge graph
         and answer box data that other providers miss."""
         try:
-            async with httpx.AsyncClient(timeout=settings.search_timeout) as client:
-                resp = await client.post(
-                    "https://google.serper.dev/search",
-                    json={"q": query, "num": MAX_RESULTS},
-                    headers={
-                        "X-API-KEY": settings.serper_api_key,
-                        "Content-Type": "application/json",
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
-
-            lines = [f"Web search results for '{query}':"]
+            client = _get_client()
+            resp = await client.post(
+                SERPER_URL,
+                json={"q": query, "num": MAX_RESULTS},
+                headers=_SERPER_HEADERS,
+            )
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
+            _provider_ok("serper")
+
+            lines = [header]
 
             # Answer box — Google's featured snippet (often has the direct answer)
             answer_box = data.get("answerBox", {})
             if answer_box:
                 ab_title = answer_box.get("title", "")
                 ab_answer = answer_box.get("answer", "")
-                ab_snippet = _clean_html(answer_box.get("snippet", ""))
+                ab_snippet = _clean_snippet(answer_box.get("snippet", ""))
                 ab_list = answer_box.get("list", [])
                 if ab_title:
                     lines.append(f"Featured: {ab_title}")
                 if ab_answer:
                     lines.append(f"  {ab_answer}")
                 if ab_snippet:
-                    lines.append(f"  {ab_snippet[:SNIPPET_MAX_LEN]}")
+                    lines.append(f"  {ab_snippet}")
                 for item in ab_list[:10]:
                     lines.append(f"  - {_clean_html(str(item))}")
 
@@ -121,12 +332,12 @@ class WebSearchTool(BaseTool):
             if kg:
                 kg_title = kg.get("title", "")
                 kg_type = kg.get("type", "")
-                kg_desc = _clean_html(kg.get("description", ""))
+                kg_desc = _clean_snippet(kg.get("description", ""))
                 if kg_title:
                     lines.append(f"Knowledge Graph: {kg_title}" +
                                  (f" ({kg_type})" if kg_type else ""))
                 if kg_desc:
-                    lines.append(f"  {kg_desc[:SNIPPET_MAX_LEN]}")
+                    lines.append(f"  {kg_desc}")
                 for key, val in kg.get("attributes", {}).items():
                     lines.append(f"  {key}: {val}")
 
@@ -135,41 +346,34 @@ class WebSearchTool(BaseTool):
             if not results and not answer_box and not kg:
                 return None
 
-            for i, r in enumerate(results, 1):
-                title = _clean_html(r.get("title", "No title"))
-                url = r.get("link", "")
-                snippet = _clean_html(r.get("snippet", "") or "")[:SNIPPET_MAX_LEN]
-                lines.append(f"{i}. {title} ({url})")
-                if snippet:
-                    lines.append(f"   {snippet}")
+            _render_results(lines, results, "link", "snippet")
 
             log.info("Serper: %d results for '%s'", len(results), query[:60])
             return "\n".join(lines)
         except Exception as e:
             log.warning("Serper search failed: %s", e)
+            _provider_failed("serper")
             return None
 
     # ── Tavily ────────────────────────────────────────────────
 
-    async def _search_tavily(self, query: str) -> str | None:
+    async def _search_tavily(self, query: str, header: str) -> str | None:
         try:
-            async with httpx.AsyncClient(timeout=settings.search_timeout) as client:
-                resp = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "query": query,
-                        "max_results": MAX_RESULTS,
-                        "include_answer": True,
-                    },
-                    headers={
-                        "X-API-Key": settings.tavily_api_key,
-                        "Content-Type": "application/json",
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            client = _get_client()
+            resp = await client.post(
+                TAVILY_URL,
+                json={
+                    "query": query,
+                    "max_results": MAX_RESULTS,
+                    "include_answer": True,
+                },
+                headers=_TAVILY_HEADERS,
+            )
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
+            _provider_ok("tavily")
 
-            lines = [f"Web search results for '{query}':"]
+            lines = [header]
 
             # Tavily can return a direct answer — very useful for factual queries
             answer = data.get("answer")
@@ -181,47 +385,42 @@ class WebSearchTool(BaseTool):
             if not results and not answer:
                 return None
 
-            for i, r in enumerate(results, 1):
-                title = _clean_html(r.get("title", "No title"))
-                url = r.get("url", "")
-                snippet = _clean_html(r.get("content", "") or "")[:SNIPPET_MAX_LEN]
-                lines.append(f"{i}. {title} ({url})")
-                if snippet:
-                    lines.append(f"   {snippet}")
+            _render_results(lines, results, "url", "content")
 
             log.info("Tavily: %d results for '%s'", len(results), query[:60])
             return "\n".join(lines)
         except Exception as e:
             log.warning("Tavily search failed: %s", e)
+            _provider_failed("tavily")
             return None
 
     # ── Brave ─────────────────────────────────────────────────
 
-    async def _search_brave(self, query: str) -> str | None:
+    async def _search_brave(self, query: str, header: str) -> str | None:
         try:
-            async with httpx.AsyncClient(timeout=settings.search_timeout) as client:
-                resp = await client.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    params={"q": query, "count": MAX_RESULTS},
-                    headers={
-                        "X-Subscription-Token": settings.brave_api_key,
-                        "Accept": "application/json",
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
-
-            lines = [f"Web search results for '{query}':"]
+            client = _get_client()
+            resp = await client.get(
+                BRAVE_URL,
+                # Only the sections we render; Brave otherwise adds news,
+                # videos, discussions, FAQ... to every response
+                params={"q": query, "count": MAX_RESULTS, "result_filter": "web,infobox"},
+                headers=_BRAVE_HEADERS,
+            )
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
+            _provider_ok("brave")
+
+            lines = [header]
 
             # Brave infobox — structured facts (e.g. market cap, population)
             infobox = data.get("infobox", {})
             if infobox:
                 title = infobox.get("title", "")
-                desc = _clean_html(infobox.get("description", ""))
+                desc = _clean_snippet(infobox.get("description", ""))
                 if title:
                     lines.append(f"Infobox: {title}")
                 if desc:
-                    lines.append(f"  {desc[:SNIPPET_MAX_LEN]}")
+                    lines.append(f"  {desc}")
                 for fact in infobox.get("facts", [])[:8]:
                     lines.append(f"  {fact.get('label', '')}: {_clean_html(fact.get('value', ''))}")
 
@@ -229,46 +428,28 @@ class WebSearchTool(BaseTool):
             if not results and not infobox:
                 return None
 
-            for i, r in enumerate(results, 1):
-                title = _clean_html(r.get("title", "No title"))
-                url = r.get("url", "")
-                desc = _clean_html(r.get("description", "") or "")[:SNIPPET_MAX_LEN]
-                lines.append(f"{i}. {title} ({url})")
-                if desc:
-                    lines.append(f"   {desc}")
-                for extra in (r.get("extra_snippets") or [])[:2]:
-                    lines.append(f"   {_clean_html(extra)[:SNIPPET_MAX_LEN]}")
+            _render_results(lines, results, "url", "description", extras_key="extra_snippets")
 
             log.info("Brave: %d results for '%s'", len(results), query[:60])
             return "\n".join(lines)
         except Exception as e:
             log.warning("Brave search failed: %s", e)
+            _provider_failed("brave")
             return None
 
     # ── DuckDuckGo ────────────────────────────────────────────
 
-    async def _search_duckduckgo(self, query: str) -> str | None:
-        def _sync():
-            try:
-                from duckduckgo_search import DDGS
-                with DDGS() as ddgs:
-                    return list(ddgs.text(query, max_results=MAX_RESULTS))
-            except Exception as e:
-                log.warning("DuckDuckGo search failed: %s", e)
-                return []
-
-        raw = await asyncio.get_event_loop().run_in_executor(None, _sync)
+    async def _search_duckduckgo(self, query: str, header: str) -> str | None:
+        raw = await asyncio.get_running_loop().run_in_executor(_ddg_pool, _ddg_text, query)
+        if raw is None:
+            _provider_failed("duckduckgo")
+            return None
+        _provider_ok("duckduckgo")
         if not raw:
             return None
 
-        lines = [f"Web search results for '{query}':"]
-        for i, r in enumerate(raw[:MAX_RESULTS], 1):
-            title = _clean_html(r.get("title", "No title"))
-            url = r.get("href", r.get("url", ""))
-            snippet = _clean_html(r.get("body", "") or "")[:SNIPPET_MAX_LEN]
-            lines.append(f"{i}. {title} ({url})")
-            if snippet:
-                lines.append(f"   {snippet}")
+        lines = [header]
+        _render_results(lines, raw[:MAX_RESULTS], "href", "body")
 
         log.info("DuckDuckGo: %d results for '%s'", len(raw), query[:60])
         return "\n".join(lines)
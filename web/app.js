@@ -329,11 +329,15 @@ function connect() {
     ws.onmessage = (ev) => {
         let msg;
         try { msg = JSON.parse(ev.data); } catch { return; }
-        try {
-            handleMessage(msg);
-        } catch (err) {
-            console.error("handleMessage error:", err);
-            setStatus("Client error: " + err.message, true);
+        // Server coalesces bursts of frames into {type: "batch", items: [...]}
+        const items = msg.type === "batch" ? msg.items : [msg];
+        for (const item of items) {
+            try {
+                handleMessage(item);
+            } catch (err) {
+                console.error("handleMessage error:", err);
+                setStatus("Client error: " + err.message, true);
+            }
         }
     };
 